@@ -0,0 +1,48 @@
+"""Search AI nodes per second and depth reached within its time budget.
+
+Run from the repository root: python -m benchmarks.bench_battle_ai
+"""
+
+import time
+from random import Random
+
+from narfecritters.game.battle_ai import SearchAI
+from narfecritters.models import *
+
+MATCHUPS = [(1, 4), (4, 7), (7, 1), (25, 133)]
+LEVEL = 30
+TURNS = 50
+
+
+def main():
+    random = Random(1)
+    encyclopedia = Encyclopedia.load()
+    moves = Moves.load()
+    for budget_ms in [3.0, 20.0]:
+        ai = SearchAI(budget_ms)
+        nodes = 0
+        depths = 0
+        elapsed = 0.0
+        for enemy_id, player_id in MATCHUPS:
+            enemy = encyclopedia.create(random, moves, id=enemy_id, level=LEVEL)
+            player_critter = encyclopedia.create(
+                random, moves, id=player_id, level=LEVEL
+            )
+            for _ in range(TURNS):
+                start = time.perf_counter()
+                ai.choose_move(
+                    enemy, player_critter, EncounterStages(), EncounterStages(), random
+                )
+                elapsed += time.perf_counter() - start
+                nodes += ai.nodes
+                depths += ai.depth_reached
+        searches = len(MATCHUPS) * TURNS
+        print(
+            f"{budget_ms:4.0f}ms budget: {nodes / elapsed:10,.0f} nodes per second,"
+            f" {elapsed / searches * 1000:5.2f}ms per move,"
+            f" average depth {depths / searches:.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
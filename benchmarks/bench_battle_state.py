@@ -0,0 +1,46 @@
+"""Cost of copying an encounter, deepcopy of the World objects versus
+BattleState snapshots and steps.
+
+Run from the repository root: python -m benchmarks.bench_battle_state
+"""
+
+import copy
+import timeit
+from random import Random
+
+from narfecritters.game.battle_state import BattleState, step
+from narfecritters.game.world import World
+
+REPEAT = 2000
+
+
+def main():
+    world = World(random=Random(1))
+    world.player.add_critter(
+        world.encyclopedia.create(world.random, world.moves, id=4, level=20)
+    )
+    world.start_encounter(
+        world.encyclopedia.create(world.random, world.moves, id=1, level=20)
+    )
+    state = BattleState.from_world(world)
+    move = state.active_critter.moves[0]
+    rng = Random(1)
+
+    def deepcopy_encounter():
+        copy.deepcopy((world.encounter, world.player.critters, world.random))
+
+    def clone_rng():
+        Random().setstate(rng.getstate())
+
+    for name, fn in [
+        ("deepcopy encounter", deepcopy_encounter),
+        ("BattleState.from_world", lambda: BattleState.from_world(world)),
+        ("clone rng", clone_rng),
+        ("step", lambda: step(state, move, rng)),
+    ]:
+        elapsed = timeit.timeit(fn, number=REPEAT) / REPEAT
+        print(f"{name:24} {elapsed * 1e6:8.1f}us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Damage rolls per second, scalar calculate_move_damage versus the batch API.
+
+Run from the repository root: python -m benchmarks.bench_damage
+"""
+
+import time
+from dataclasses import fields
+from random import Random
+
+import numpy as np
+
+from narfecritters.game.move_damage import (
+    DamageBatch,
+    calculate_move_damage,
+    calculate_move_damage_batch,
+)
+from narfecritters.models import *
+
+ENTRY_COUNT = 1000
+BATCH_SIZE = 1_000_000
+
+
+def create_entries(random: Random):
+    encyclopedia = Encyclopedia.load()
+    moves = Moves.load()
+    damaging_moves = [
+        move
+        for move in moves.moves
+        if move.power and move.damage_class is not DamageClass.STATUS
+    ]
+    return [
+        (
+            encyclopedia.create(random, moves, id=1, level=random.randint(1, 100)),
+            encyclopedia.create(random, moves, id=4, level=random.randint(1, 100)),
+            EncounterStages(),
+            EncounterStages(),
+            random.choice(damaging_moves),
+        )
+        for _ in range(ENTRY_COUNT)
+    ]
+
+
+def main():
+    random = Random(1)
+    entries = create_entries(random)
+
+    start = time.perf_counter()
+    for entry in entries:
+        calculate_move_damage(*entry, random)
+    scalar_rate = ENTRY_COUNT / (time.perf_counter() - start)
+
+    batch = DamageBatch.from_moves(entries)
+    batch = DamageBatch(
+        **{
+            field.name: np.resize(getattr(batch, field.name), BATCH_SIZE)
+            for field in fields(DamageBatch)
+        }
+    )
+    rng = np.random.default_rng(1)
+    start = time.perf_counter()
+    calculate_move_damage_batch(batch, rng)
+    batch_rate = BATCH_SIZE / (time.perf_counter() - start)
+
+    print(f"scalar: {scalar_rate:12,.0f} rolls per second")
+    print(f"batch:  {batch_rate:12,.0f} rolls per second")
+
+
+if __name__ == "__main__":
+    main()
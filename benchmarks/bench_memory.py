@@ -0,0 +1,81 @@
+"""Bytes per critter for slotted models versus plain __dict__ dataclasses.
+
+Run from the repository root: python -m benchmarks.bench_memory
+"""
+
+import tracemalloc
+import uuid
+from dataclasses import MISSING, field, fields, make_dataclass
+from random import Random
+
+from narfecritters.models import *
+
+CRITTER_COUNT = 100_000
+
+
+def without_slots(cls):
+    """Same fields as cls on a regular dataclass, as the models were before"""
+    return make_dataclass(
+        cls.__name__,
+        [
+            (
+                (
+                    f.name,
+                    f.type,
+                    field(default=f.default, default_factory=f.default_factory),
+                )
+                if f.default is not MISSING or f.default_factory is not MISSING
+                else (f.name, f.type)
+            )
+            for f in fields(cls)
+        ],
+    )
+
+
+def create_species():
+    return Species(
+        id=1,
+        name="narf",
+        base_experience=64,
+        base_stats=Stats(45, 49, 49, 65, 65, 45),
+        type_ids=[1],
+        moves=[],
+        evolution_triggers=[],
+        capture_rate=45,
+        flavor_text=None,
+    )
+
+
+def measure(critter_class, stats_class) -> float:
+    random = Random(1)
+    species = create_species()
+    tracemalloc.start()
+    start, _peak = tracemalloc.get_traced_memory()
+    critters = [
+        critter_class(
+            uuid=uuid.uuid1(),
+            moves=[],
+            ivs=stats_class(*(random.randint(0, 31) for _ in range(6))),
+            evs=stats_class(),
+            experience=125,
+            **species.critter_attributes,
+            name=species.name_pretty,
+        )
+        for _ in range(CRITTER_COUNT)
+    ]
+    end, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del critters
+    return (end - start) / CRITTER_COUNT
+
+
+def main():
+    before = measure(without_slots(Critter), without_slots(Stats))
+    after = measure(Critter, Stats)
+    print(f"{CRITTER_COUNT} critters")
+    print(f"__dict__ models: {before:7.1f} bytes per critter")
+    print(f"slotted models:  {after:7.1f} bytes per critter")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Lookup cost of the move registry as the move table grows.
+
+Run from the repository root: python -m benchmarks.bench_registries
+"""
+
+from timeit import timeit
+
+from narfecritters.models import *
+
+TABLE_SIZES = [50, 100, 200, 400, 900]
+LOOKUPS = 100_000
+
+
+def create_moves(count: int) -> Moves:
+    return Moves(
+        moves=[
+            Move(
+                id=id,
+                name=f"move-{id}",
+                type_id=1,
+                target=MoveTarget.SELECTED_CRITTERS,
+                crit_rate=0,
+                flinch_chance=0,
+                healing=0,
+                stat_chance=0,
+                accuracy=100,
+                ailment_chance=0,
+                damage_class=DamageClass.PHYSICAL,
+                ailment=None,
+                power=40,
+            )
+            for id in range(1, count + 1)
+        ]
+    )
+
+
+def main():
+    for size in TABLE_SIZES:
+        moves = create_moves(size)
+        # worst case for a linear scan: the last entry of the table
+        last = moves.moves[-1]
+        by_id = timeit(lambda: moves.find_by_id(last.id), number=LOOKUPS)
+        by_name = timeit(lambda: moves.find_by_name(last.name), number=LOOKUPS)
+        print(
+            f"{size:>4} moves: "
+            f"find_by_id {by_id / LOOKUPS * 1e9:6.0f}ns "
+            f"find_by_name {by_name / LOOKUPS * 1e9:6.0f}ns"
+        )
+
+
+if __name__ == "__main__":
+    main()
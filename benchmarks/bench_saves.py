@@ -0,0 +1,63 @@
+"""Save and load times for a large player, YAML Save versus binary slots.
+
+Run from the repository root: python -m benchmarks.bench_saves
+"""
+
+import os
+import tempfile
+import time
+import uuid
+from random import Random
+
+from narfecritters.models import *
+from narfecritters.models.save_slots import SaveSlots
+
+CRITTER_COUNT = 1000
+
+
+def create_player() -> NPC:
+    random = Random(1)
+    moves = Moves.load()
+    encyclopedia = Encyclopedia.load()
+    species = encyclopedia.find_by_id(1)
+    player = NPC()
+    for _ in range(CRITTER_COUNT):
+        critter = Critter(
+            uuid=uuid.UUID(int=random.getrandbits(128)),
+            moves=[moves.find_by_id(random.randint(1, 100)) for _ in range(4)],
+            ivs=Stats(*(random.randint(0, 31) for _ in range(6))),
+            evs=Stats(),
+            experience=random.randint(125, 100_000),
+            **species.critter_attributes,
+            name=species.name_pretty,
+        )
+        critter.heal()
+        player.add_critter(critter)
+    return player
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main():
+    player = create_player()
+    with tempfile.TemporaryDirectory() as path:
+        yaml_path = os.path.join(path, "save.yml")
+        save = Save(players=[player] + [None] * (Save.SLOT_COUNT - 1))
+        _, yaml_save = timed(lambda: save.to_yaml_file(yaml_path))
+        _, yaml_load = timed(lambda: Save.from_yaml_file(yaml_path))
+        save_slots = SaveSlots(os.path.join(path, "saves"))
+        _, slot_save = timed(lambda: save_slots.save_slot(0, player))
+        _, slot_load = timed(lambda: save_slots.load_slot(0))
+        yaml_size = os.path.getsize(yaml_path)
+        slot_size = os.path.getsize(save_slots.slot_path(0))
+    print(f"{CRITTER_COUNT} critters")
+    print(f"YAML:   save {yaml_save:7.3f}s load {yaml_load:7.3f}s {yaml_size} bytes")
+    print(f"binary: save {slot_save:7.3f}s load {slot_load:7.3f}s {slot_size} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Game data load times through the YAML sources and the compiled pack.
+
+Needs the data/ directory. Run from the repository root:
+python -m benchmarks.bench_startup
+"""
+
+import os
+import subprocess
+import sys
+from time import perf_counter
+
+from narfecritters.models import *
+from narfecritters.models.gamedata import DB_PATH, PACK_FILENAME, load_pack
+
+FIRST_FRAME_SCRIPT = """
+import pygame
+from pygame_gui import UIManager
+from narfecritters.ui.settings import WINDOW_SIZE
+pygame.init()
+window_surface = pygame.display.set_mode(WINDOW_SIZE)
+manager = UIManager(WINDOW_SIZE, "data/theme.json")
+from narfecritters.ui.screen import ScreenManager
+from narfecritters.ui.start_screen import StartScreen
+screen_manager = ScreenManager()
+screen_manager.push(StartScreen(manager, screen_manager))
+screen_manager.current.update(0)
+manager.update(0)
+screen_manager.current.draw(window_surface)
+manager.draw_ui(window_surface)
+pygame.display.update()
+"""
+
+
+def timed(function):
+    start = perf_counter()
+    function()
+    return perf_counter() - start
+
+
+def load_yaml_world():
+    Encyclopedia.from_yaml_file(f"{DB_PATH}/encyclopedia.yml")
+    Moves.from_yaml_file(f"{DB_PATH}/moves.yml")
+    Types.from_yaml_file(f"{DB_PATH}/types.yml")
+
+
+def load_pack_world():
+    Encyclopedia.load()
+    Moves.load()
+    Types.load()
+
+
+def time_first_frame():
+    env = dict(os.environ, SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy")
+    start = perf_counter()
+    subprocess.run([sys.executable, "-c", FIRST_FRAME_SCRIPT], env=env, check=True)
+    return perf_counter() - start
+
+
+def main():
+    pack_path = os.path.join(DB_PATH, PACK_FILENAME)
+    if os.path.exists(pack_path):
+        os.remove(pack_path)
+    print(f"first frame, compiling pack: {time_first_frame() * 1000:8.1f}ms")
+    print(f"first frame, warm pack:      {time_first_frame() * 1000:8.1f}ms")
+
+    load_pack()
+    print(f"world data from YAML:        {timed(load_yaml_world) * 1000:8.1f}ms")
+    print(f"world data from pack:        {timed(load_pack_world) * 1000:8.1f}ms")
+
+    species_ids = list(load_pack().species_ids)
+    yaml_species = timed(
+        lambda: [
+            Species.from_yaml_file(f"{DB_PATH}/species/{id}.yml") for id in species_ids
+        ]
+    )
+    pack_species = timed(lambda: [load_pack().species(id) for id in species_ids])
+    count = max(1, len(species_ids))
+    print(f"species from YAML:           {yaml_species / count * 1e6:8.1f}us each")
+    print(f"species from pack:           {pack_species / count * 1e6:8.1f}us each")
+
+
+if __name__ == "__main__":
+    main()
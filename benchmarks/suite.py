@@ -0,0 +1,411 @@
+"""Benchmark suite for the hot paths, with JSON results and baseline checks.
+
+Every benchmark times one call of a function built by its setup, reporting
+the best and median time per call over several repeats. Benchmarks whose
+data files are missing are reported as skipped. Runs headless through SDL's
+dummy drivers.
+
+Run from the repository root:
+python -m benchmarks.suite --output results.json
+python -m benchmarks.suite --baseline benchmarks/baseline.json
+python -m benchmarks.suite --save-baseline benchmarks/baseline.json
+
+With --baseline the exit code is 1 when any benchmark got slower than
+--threshold times its baseline median.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from random import Random
+from typing import Callable, Iterator
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from narfecritters.models import *
+from narfecritters.ui.settings import DEFAULT_AREA, TILE_SIZE, WINDOW_SIZE
+
+RESULTS_VERSION = 1
+REPEAT = 5
+TARGET_REPEAT_SECONDS = 0.2
+DEFAULT_THRESHOLD = 1.25
+DB_REQUIREMENT = "data/db/encyclopedia.yml"
+AREA_REQUIREMENT = f"data/tiled/{DEFAULT_AREA}.tmx"
+WALK_PATH = [Direction.RIGHT] * 4 + [Direction.DOWN] * 4
+WALK_PATH += [Direction.LEFT] * 4 + [Direction.UP] * 4
+
+
+@dataclass
+class Benchmark:
+    name: str
+    setup: Callable[[], Iterator[Callable]]
+    requires: list[str] = field(default_factory=list)
+
+
+BENCHMARKS: list[Benchmark] = []
+
+
+def benchmark(name: str, requires: list[str] = None):
+    """Register a generator yielding the function to time, code after the
+    yield runs as teardown
+    """
+
+    def register(setup):
+        BENCHMARKS.append(Benchmark(name, contextmanager(setup), requires or []))
+        return setup
+
+    return register
+
+
+def create_world(seed=1):
+    from narfecritters.game.world import World
+
+    world = World(random=Random(seed))
+    world.player.add_critter(
+        world.encyclopedia.create(world.random, world.moves, id=4, level=30)
+    )
+    return world
+
+
+@benchmark("calculate_move_damage", requires=[DB_REQUIREMENT])
+def bench_calculate_move_damage():
+    from narfecritters.game.move_damage import calculate_move_damage
+
+    random = Random(1)
+    encyclopedia = Encyclopedia.load()
+    moves = Moves.load()
+    attacker = encyclopedia.create(random, moves, id=4, level=30)
+    defender = encyclopedia.create(random, moves, id=1, level=30)
+    move = next(move for move in attacker.moves if move.power)
+    stages = EncounterStages()
+    yield lambda: calculate_move_damage(
+        attacker, defender, stages, stages, move, random
+    )
+
+
+@benchmark("World.turn", requires=[DB_REQUIREMENT])
+def bench_world_turn():
+    world = create_world()
+
+    def turn():
+        if world.encounter is None:
+            for critter in world.player.critters:
+                critter.heal()
+            world.start_encounter(
+                world.encyclopedia.create(world.random, world.moves, id=1, level=30)
+            )
+        world.turn(world.active_critter.moves[0])
+
+    yield turn
+
+
+@benchmark("Encyclopedia.create", requires=[DB_REQUIREMENT])
+def bench_encyclopedia_create():
+    random = Random(1)
+    encyclopedia = Encyclopedia.load()
+    moves = Moves.load()
+    yield lambda: encyclopedia.create(random, moves, id=1, level=30)
+
+
+@benchmark("Encyclopedia.load", requires=[DB_REQUIREMENT])
+def bench_encyclopedia_load():
+    yield Encyclopedia.load
+
+
+@benchmark("Moves.find_by_id", requires=[DB_REQUIREMENT])
+def bench_moves_find_by_id():
+    moves = Moves.load()
+    ids = [move.id for move in moves.moves]
+    index = iter(range(sys.maxsize))
+    yield lambda: moves.find_by_id(ids[next(index) % len(ids)])
+
+
+@benchmark("Map", requires=[AREA_REQUIREMENT])
+def bench_map():
+    import pygame
+
+    from narfecritters.game.map import Map
+
+    pygame.display.init()
+    pygame.display.set_mode(WINDOW_SIZE)
+    yield lambda: Map(DEFAULT_AREA)
+
+
+@benchmark("World.move+step", requires=[DB_REQUIREMENT, AREA_REQUIREMENT])
+def bench_world_walk():
+    """One tile of a scripted loop, encounters and transitions undone"""
+    import pygame
+
+    pygame.display.init()
+    pygame.display.set_mode(WINDOW_SIZE)
+    world = create_world()
+    world.set_area(DEFAULT_AREA)
+    start = (world.player.x, world.player.y)
+    step = iter(range(sys.maxsize))
+
+    def walk():
+        index = next(step) % len(WALK_PATH)
+        if index == 0:
+            world.player.x, world.player.y = start
+        world.move(WALK_PATH[index], running=False)
+        while world.move_action:
+            world.step()
+        world.encounter = None
+        if world.area != DEFAULT_AREA:
+            world.set_area(DEFAULT_AREA)
+
+    yield walk
+
+
+@benchmark("AreaScreen.draw_terrain", requires=[DB_REQUIREMENT, AREA_REQUIREMENT])
+def bench_draw_terrain():
+    import pygame
+    from pygame_gui import UIManager
+
+    from narfecritters.ui.area_screen import AreaScreen
+    from narfecritters.ui.screen import ScreenManager
+
+    pygame.init()
+    pygame.display.set_mode(WINDOW_SIZE)
+    screen = AreaScreen(
+        UIManager(WINDOW_SIZE), ScreenManager(), create_world(), DEFAULT_AREA
+    )
+    surface = pygame.Surface(WINDOW_SIZE)
+    yield lambda: screen.draw_terrain(surface)
+
+
+def terrain_world():
+    """Display up and a world in the default area, for the terrain cases"""
+    import pygame
+
+    pygame.display.init()
+    pygame.display.set_mode(WINDOW_SIZE)
+    world = create_world()
+    world.set_area(DEFAULT_AREA)
+    return world, pygame.Surface(WINDOW_SIZE)
+
+
+def draw_tiles(map, surface, camera_x, camera_y):
+    """The per tile blits AreaScreen made before chunks, sprites left out"""
+    span = WINDOW_SIZE[0] // 2 // TILE_SIZE + 2
+    tile_x = camera_x // TILE_SIZE
+    tile_y = camera_y // TILE_SIZE
+    for layer in range(map.get_tile_layer_count()):
+        for x in range(max(0, tile_x - span), min(tile_x + span, map.width)):
+            for y in range(max(0, tile_y - span), min(tile_y + span, map.height)):
+                image = map.get_tile_image(x, y, layer)
+                if image:
+                    surface.blit(
+                        image,
+                        (
+                            WINDOW_SIZE[0] // 2 + x * TILE_SIZE - camera_x,
+                            WINDOW_SIZE[1] // 2 + y * TILE_SIZE - camera_y,
+                        ),
+                    )
+
+
+@benchmark("terrain per tile", requires=[DB_REQUIREMENT, AREA_REQUIREMENT])
+def bench_draw_tiles():
+    """Baseline for AreaScreen.draw_terrain, which draws warm chunks"""
+    world, surface = terrain_world()
+    yield lambda: draw_tiles(world.map, surface, world.player.x, world.player.y)
+
+
+@benchmark("TerrainChunks cold", requires=[DB_REQUIREMENT, AREA_REQUIREMENT])
+def bench_draw_chunks_cold():
+    """A view of chunks rendered from scratch, as after an area change"""
+    from narfecritters.ui.terrain_chunks import TerrainChunks
+
+    world, surface = terrain_world()
+
+    def draw():
+        terrain = TerrainChunks(world.map)
+        terrain.draw_below(surface, world.player.x, world.player.y)
+        terrain.draw_above(surface, world.player.x, world.player.y)
+
+    yield draw
+
+
+@contextmanager
+def save_directory():
+    """Run Save in a scratch directory so the real save is left alone"""
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as directory:
+        os.makedirs(os.path.join(directory, "data", "db"))
+        os.chdir(directory)
+        try:
+            yield
+        finally:
+            os.chdir(cwd)
+
+
+def create_save():
+    world = create_world()
+    for _ in range(5):
+        world.player.add_critter(
+            world.encyclopedia.create(world.random, world.moves, id=1, level=30)
+        )
+    return Save(players=[world.player] * Save.SLOT_COUNT)
+
+
+@benchmark("Save.save", requires=[DB_REQUIREMENT])
+def bench_save_save():
+    save = create_save()
+    with save_directory():
+        yield save.save
+
+
+@benchmark("Save.load", requires=[DB_REQUIREMENT])
+def bench_save_load():
+    save = create_save()
+    with save_directory():
+        save.save()
+        yield Save.load
+
+
+@contextmanager
+def save_slots_directory():
+    from narfecritters.models.save_slots import SaveSlots
+
+    with tempfile.TemporaryDirectory() as directory:
+        yield SaveSlots(os.path.join(directory, "saves"))
+
+
+@benchmark("SaveSlots.save_slot", requires=[DB_REQUIREMENT])
+def bench_save_slots_save():
+    player = create_save().players[0]
+    with save_slots_directory() as save_slots:
+        yield lambda: save_slots.save_slot(0, player, DEFAULT_AREA)
+
+
+@benchmark("SaveSlots.load_slot", requires=[DB_REQUIREMENT])
+def bench_save_slots_load():
+    player = create_save().players[0]
+    with save_slots_directory() as save_slots:
+        save_slots.save_slot(0, player, DEFAULT_AREA)
+        yield lambda: save_slots.load_slot(0)
+
+
+@benchmark("SaveSlots.load_metadata", requires=[DB_REQUIREMENT])
+def bench_save_slots_metadata():
+    """Every slot's metadata, as the load screen lists them"""
+    player = create_save().players[0]
+    with save_slots_directory() as save_slots:
+        for slot_index in range(Save.SLOT_COUNT):
+            save_slots.save_slot(slot_index, player, DEFAULT_AREA)
+        yield save_slots.load_metadata
+
+
+def time_calls(function: Callable):
+    """Best and median seconds per call, loops calibrated to the target"""
+    function()
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            function()
+        elapsed = time.perf_counter() - start
+        if elapsed >= TARGET_REPEAT_SECONDS / 10 or loops >= 1 << 20:
+            break
+        loops *= 10
+    loops = max(1, int(loops * TARGET_REPEAT_SECONDS / max(elapsed, 1e-9)))
+    times = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        for _ in range(loops):
+            function()
+        times.append((time.perf_counter() - start) / loops)
+    return {"min": min(times), "median": statistics.median(times), "loops": loops}
+
+
+def run_benchmark(entry: Benchmark):
+    missing = [path for path in entry.requires if not os.path.exists(path)]
+    if missing:
+        return {"skipped": f"missing {', '.join(missing)}"}
+    with entry.setup() as function:
+        return time_calls(function)
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(pattern: str = None):
+    results = {}
+    for entry in BENCHMARKS:
+        if pattern and pattern.lower() not in entry.name.lower():
+            continue
+        results[entry.name] = result = run_benchmark(entry)
+        if "skipped" in result:
+            print(f"{entry.name:26} skipped, {result['skipped']}")
+        else:
+            print(
+                f"{entry.name:26} {result['median'] * 1e6:12.2f}us"
+                f" (best {result['min'] * 1e6:.2f}us, {result['loops']} loops)"
+            )
+    return {
+        "version": RESULTS_VERSION,
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "timestamp": time.time(),
+        "results": results,
+    }
+
+
+def compare(report: dict, baseline: dict, threshold: float) -> list[str]:
+    """Print each ratio to the baseline, returning the regressed names"""
+    print(f"versus baseline {baseline.get('commit')}:")
+    regressions = []
+    for name, result in report["results"].items():
+        previous = baseline["results"].get(name)
+        if "median" not in result or not previous or "median" not in previous:
+            continue
+        ratio = result["median"] / previous["median"]
+        regressed = ratio > threshold
+        if regressed:
+            regressions.append(name)
+        print(f"{name:26} {ratio:6.2f}x{'  REGRESSION' if regressed else ''}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--filter", help="only run names containing this")
+    parser.add_argument("--output", help="write results JSON here")
+    parser.add_argument("--baseline", help="compare against this results JSON")
+    parser.add_argument("--save-baseline", help="write results as a baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args()
+
+    report = run(args.filter)
+    for path in [args.output, args.save_baseline]:
+        if path:
+            with open(path, "w") as f:
+                json.dump(report, f, indent=2)
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if compare(report, baseline, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
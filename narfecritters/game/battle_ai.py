@@ -0,0 +1,268 @@
+"""Enemy move selection for wild and special encounters.
+
+RandomAI is the classic behaviour. SearchAI runs an expectimax lookahead
+over rounds of expected damage, type factors and stat stages: its own moves
+are max nodes, hits and the player's move choice are chance nodes. The
+search deepens iteratively until the per turn time budget runs out and
+plays the best move of the deepest completed search.
+"""
+
+import time
+from abc import ABC, abstractmethod
+from random import Random
+
+from narfecritters.game.move_damage import (
+    APPLICABILITY,
+    CRITICAL_HIT_CHANCE,
+    calculate_base_damage,
+    calculate_type_factor,
+)
+from narfecritters.game.move_stat_changes import OPPONENT_TARGETS, USER_TARGETS
+from narfecritters.models import *
+
+STAGE_FIELDS = (
+    "attack",
+    "defense",
+    "spattack",
+    "spdefense",
+    "speed",
+    "accuracy",
+    "evasion",
+)
+EXPECTED_CRITICAL_HIT_SCALAR = 1 + CRITICAL_HIT_CHANCE
+EXPECTED_RANDOM_FACTOR = 0.925  # random.random() * 0.15 + 0.85
+SEARCH_BUDGET_MS = 3.0
+SEARCH_MAX_DEPTH = 8
+
+
+class BattleAI(ABC):
+    @abstractmethod
+    def choose_move(
+        self,
+        attacker: Critter,
+        defender: Critter,
+        attacker_encounter_stages: EncounterStages,
+        defender_encounter_stages: EncounterStages,
+        random: Random,
+        attacker_first: bool = True,
+    ) -> Move:
+        pass
+
+
+class RandomAI(BattleAI):
+    def choose_move(
+        self,
+        attacker,
+        defender,
+        attacker_encounter_stages,
+        defender_encounter_stages,
+        random,
+        attacker_first=True,
+    ):
+        return random.choice(attacker.moves)
+
+
+class SearchTimeout(Exception):
+    pass
+
+
+class SearchAI(BattleAI):
+    def __init__(self, budget_ms=SEARCH_BUDGET_MS, max_depth=SEARCH_MAX_DEPTH):
+        self.budget = budget_ms / 1000
+        self.max_depth = max_depth
+        self.nodes = 0
+        self.depth_reached = 0
+
+    def choose_move(
+        self,
+        attacker,
+        defender,
+        attacker_encounter_stages,
+        defender_encounter_stages,
+        random,
+        attacker_first=True,
+    ):
+        """Best move from the deepest search finishing within the budget,
+        random is left untouched so the rest of the battle replays the same
+        """
+        self.attacker = attacker
+        self.defender = defender
+        self.attacker_first = attacker_first
+        self.outcomes: dict[tuple, tuple[int, float, tuple, tuple]] = {}
+        self.values: dict[tuple, float] = {}
+        self.nodes = 0
+        self.deadline = None
+        state = (
+            attacker.current_hp,
+            defender.current_hp,
+            self.stages_key(attacker_encounter_stages),
+            self.stages_key(defender_encounter_stages),
+        )
+        # one round is cheap, always finish it so there is a move to play
+        best_move = self.search_root(state, 1)
+        self.depth_reached = 1
+        self.deadline = time.perf_counter() + self.budget
+        try:
+            for depth in range(2, self.max_depth + 1):
+                best_move = self.search_root(state, depth)
+                self.depth_reached = depth
+        except SearchTimeout:
+            pass
+        return best_move
+
+    def search_root(self, state, depth) -> Move:
+        best_move, best_value = None, None
+        for move in self.attacker.moves:
+            value = self.round_value(state, move, depth)
+            if best_value is None or value > best_value:
+                best_move, best_value = move, value
+        return best_move
+
+    def state_value(self, state, depth) -> float:
+        self.nodes += 1
+        if (
+            self.deadline
+            and self.nodes & 63 == 0
+            and time.perf_counter() > self.deadline
+        ):
+            raise SearchTimeout()
+        attacker_hp, defender_hp, _attacker_stages, _defender_stages = state
+        if attacker_hp <= 0:
+            return -1.0
+        if defender_hp <= 0:
+            return 1.0
+        if depth == 0:
+            return (
+                attacker_hp / self.attacker.max_hp - defender_hp / self.defender.max_hp
+            )
+        key = (depth, state)
+        value = self.values.get(key)
+        if value is None:
+            value = max(
+                self.round_value(state, move, depth) for move in self.attacker.moves
+            )
+            self.values[key] = value
+        return value
+
+    def round_value(self, state, attacker_move: Move, depth) -> float:
+        """Expected value of a round where the player picks uniformly"""
+        total = 0.0
+        for defender_move in self.defender.moves:
+            if self.attacker_first:
+                total += self.expect(state, True, attacker_move, defender_move, depth)
+            else:
+                total += self.expect(state, False, defender_move, attacker_move, depth)
+        return total / len(self.defender.moves)
+
+    def expect(self, state, attacker_moving, move, next_move, depth) -> float:
+        """Chance node for a move hitting, next_move resolves after it"""
+        damage, hit_chance, attacker_stages, defender_stages = self.outcome(
+            state, attacker_moving, move
+        )
+        attacker_hp, defender_hp, _attacker_stages, _defender_stages = state
+        if attacker_moving:
+            hit_state = (
+                attacker_hp,
+                defender_hp - damage,
+                attacker_stages,
+                defender_stages,
+            )
+        else:
+            hit_state = (
+                attacker_hp - damage,
+                defender_hp,
+                attacker_stages,
+                defender_stages,
+            )
+        value = 0.0
+        for chance, next_state in ((hit_chance, hit_state), (1 - hit_chance, state)):
+            if chance <= 0:
+                continue
+            if next_move is None or next_state[0] <= 0 or next_state[1] <= 0:
+                value += chance * self.state_value(next_state, depth - 1)
+            else:
+                value += chance * self.expect(
+                    next_state, not attacker_moving, next_move, None, depth
+                )
+        return value
+
+    def outcome(self, state, attacker_moving, move: Move):
+        """Memoized expected damage, hit chance and stages after a hit"""
+        _attacker_hp, _defender_hp, attacker_stages, defender_stages = state
+        key = (attacker_moving, move.id, attacker_stages, defender_stages)
+        outcome = self.outcomes.get(key)
+        if outcome is None:
+            if attacker_moving:
+                outcome = self.calculate_outcome(
+                    self.attacker, self.defender, attacker_stages, defender_stages, move
+                )
+            else:
+                damage, hit_chance, defender_stages, attacker_stages = (
+                    self.calculate_outcome(
+                        self.defender,
+                        self.attacker,
+                        defender_stages,
+                        attacker_stages,
+                        move,
+                    )
+                )
+                outcome = (damage, hit_chance, attacker_stages, defender_stages)
+            self.outcomes[key] = outcome
+        return outcome
+
+    @classmethod
+    def calculate_outcome(
+        cls, mover: Critter, target: Critter, mover_key, target_key, move: Move
+    ):
+        mover_stages = cls.stages_from_key(mover_key)
+        target_stages = cls.stages_from_key(target_key)
+        hit_chance = min(
+            1.0,
+            move.accuracy
+            * mover_stages.accuracy_multipler
+            * target_stages.evasion_multipler
+            / 100,
+        )
+        damage = 0
+        if (
+            move.category in APPLICABILITY
+            and move.power
+            and move.damage_class is not DamageClass.STATUS
+        ):
+            stab = 1.5 if move.type_id in mover.type_ids else 1
+            damage = round(
+                calculate_base_damage(mover, target, mover_stages, target_stages, move)
+                * EXPECTED_CRITICAL_HIT_SCALAR
+                * EXPECTED_RANDOM_FACTOR
+                * stab
+                * calculate_type_factor(target, move)
+            )
+        for stat_change in move.stat_changes:
+            if stat_change.name not in STAGE_FIELDS:
+                continue
+            if move.target in OPPONENT_TARGETS:
+                current = getattr(target_stages, stat_change.name)
+                setattr(target_stages, stat_change.name, current + stat_change.amount)
+            if move.target in USER_TARGETS:
+                current = getattr(mover_stages, stat_change.name)
+                setattr(mover_stages, stat_change.name, current + stat_change.amount)
+        return (
+            damage,
+            hit_chance,
+            cls.stages_key(mover_stages),
+            cls.stages_key(target_stages),
+        )
+
+    @classmethod
+    def stages_key(cls, stages: EncounterStages) -> tuple:
+        return tuple(getattr(stages, name) for name in STAGE_FIELDS)
+
+    @classmethod
+    def stages_from_key(cls, key: tuple) -> EncounterStages:
+        return EncounterStages(**dict(zip(STAGE_FIELDS, key)))
+
+
+def create_battle_ai(name: str, budget_ms: float = SEARCH_BUDGET_MS) -> BattleAI:
+    if name == "search":
+        return SearchAI(budget_ms)
+    return RandomAI()
@@ -0,0 +1,280 @@
+"""Typed battle events, formatted into text only when displayed.
+
+Recording an event stores the names and numbers involved, str(event)
+builds the message the battle screen shows. BattleLogWriter streams events
+to a compact binary log, BattleLogReader reads them back.
+
+Log layout: magic and version, then records. A record starts with a one
+byte event code. Code 0 defines the next string id followed by a u16
+length and utf8 bytes, strings are written once and referenced by id.
+Other codes are followed by the event fields in declaration order.
+"""
+
+import struct
+from dataclasses import dataclass, fields
+from enum import Enum, auto
+from typing import BinaryIO, Iterator
+
+from narfecritters.models import *
+
+LOG_MAGIC = b"NCBL"
+LOG_VERSION = 1
+LOG_HEADER = struct.Struct("<4sH")
+STRING_DEFINITION = 0
+FIELD_FORMATS = {str: "<I", int: "<i", float: "<d", bool: "<?"}
+ENUM_FORMAT = "<B"
+
+
+def type_effectiveness_suffix(type_factor: float):
+    if type_factor == 0:
+        return " It had no effect."
+    elif type_factor < 1:
+        return " It wasn't very effective."
+    elif type_factor > 1:
+        return " It was super effective!"
+    return ""
+
+
+class BattleEvent:
+    """Base of all events, CODE identifies the type in the binary log"""
+
+    __slots__ = ()
+    CODE = None
+
+
+@dataclass(frozen=True, slots=True)
+class MessageEvent(BattleEvent):
+    CODE = 1
+    text: str
+
+    def __str__(self):
+        return self.text
+
+
+@dataclass(frozen=True, slots=True)
+class DamageEvent(BattleEvent):
+    CODE = 2
+    critter_name: str
+    damage: int
+    move_name: str
+    type_factor: float
+
+    def __str__(self):
+        return (
+            f"{self.critter_name} took {self.damage} dmg from {self.move_name}. "
+            + type_effectiveness_suffix(self.type_factor)
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class MissEvent(BattleEvent):
+    CODE = 3
+    critter_name: str
+
+    def __str__(self):
+        return f"{self.critter_name} missed!"
+
+
+@dataclass(frozen=True, slots=True)
+class FaintEvent(BattleEvent):
+    CODE = 4
+    critter_name: str
+
+    def __str__(self):
+        return f"{self.critter_name} fainted!"
+
+
+@dataclass(frozen=True, slots=True)
+class LevelUpEvent(BattleEvent):
+    CODE = 5
+    critter_name: str
+    level: int
+
+    def __str__(self):
+        return f"{self.critter_name} leveled up to {self.level}"
+
+
+@dataclass(frozen=True, slots=True)
+class LearnMoveEvent(BattleEvent):
+    CODE = 6
+    critter_name: str
+    move_name_pretty: str
+
+    def __str__(self):
+        return f"{self.critter_name} learned {self.move_name_pretty}"
+
+
+@dataclass(frozen=True, slots=True)
+class EvolutionEvent(BattleEvent):
+    CODE = 7
+    previous_name: str
+    critter_name: str
+
+    def __str__(self):
+        return f"{self.previous_name} has evolved into {self.critter_name}"
+
+
+@dataclass(frozen=True, slots=True)
+class StatChangeEvent(BattleEvent):
+    CODE = 8
+    critter_name: str
+    stat_name: str
+    amount: int
+
+    def __str__(self):
+        return f"{self.stat_name.capitalize()} changed for {self.critter_name}"
+
+
+class AilmentEffect(Enum):
+    DAMAGE = auto()
+    IMMOBILIZED = auto()
+    SELF_HIT = auto()
+    CURED = auto()
+
+
+AILMENT_MESSAGES = {
+    (Ailment.BURN, AilmentEffect.DAMAGE): "{} took damage from burn!",
+    (Ailment.POISON, AilmentEffect.DAMAGE): "{} took damage from poison!",
+    (Ailment.PARALYSIS, AilmentEffect.IMMOBILIZED): "{} is paralyzed! It can't move!",
+    (Ailment.SLEEP, AilmentEffect.IMMOBILIZED): "{} is asleep!",
+    (Ailment.SLEEP, AilmentEffect.CURED): "{} woke up!",
+    (
+        Ailment.CONFUSION,
+        AilmentEffect.SELF_HIT,
+    ): "{} is confused! It hurt itself in its confusion!",
+    (Ailment.CONFUSION, AilmentEffect.CURED): "{} snapped out of its confusion!",
+}
+
+
+@dataclass(frozen=True, slots=True)
+class AilmentEvent(BattleEvent):
+    CODE = 9
+    critter_name: str
+    ailment: Ailment
+    effect: AilmentEffect
+
+    def __str__(self):
+        return AILMENT_MESSAGES[(self.ailment, self.effect)].format(self.critter_name)
+
+
+@dataclass(frozen=True, slots=True)
+class FlinchEvent(BattleEvent):
+    CODE = 10
+    critter_name: str
+
+    def __str__(self):
+        return f"{self.critter_name} flinched!"
+
+
+@dataclass(frozen=True, slots=True)
+class CatchEvent(BattleEvent):
+    CODE = 11
+    critter_name: str
+    caught: bool
+
+    def __str__(self):
+        if self.caught:
+            return f"{self.critter_name} caught successfully!"
+        return f"Failed to catch {self.critter_name}."
+
+
+@dataclass(frozen=True, slots=True)
+class RunEvent(BattleEvent):
+    CODE = 12
+    critter_name: str
+    escaped: bool
+
+    def __str__(self):
+        if self.escaped:
+            return f"{self.critter_name} escaped successfully!"
+        return f"{self.critter_name} failed to run away."
+
+
+EVENT_TYPES = {
+    event_type.CODE: event_type
+    for event_type in [
+        MessageEvent,
+        DamageEvent,
+        MissEvent,
+        FaintEvent,
+        LevelUpEvent,
+        LearnMoveEvent,
+        EvolutionEvent,
+        StatChangeEvent,
+        AilmentEvent,
+        FlinchEvent,
+        CatchEvent,
+        RunEvent,
+    ]
+}
+EVENT_FIELDS = {
+    code: [(field.name, field.type) for field in fields(event_type)]
+    for code, event_type in EVENT_TYPES.items()
+}
+
+
+class BattleLogWriter:
+    def __init__(self, log_file: BinaryIO):
+        self.log_file = log_file
+        self.string_ids: dict[str, int] = {}
+        log_file.write(LOG_HEADER.pack(LOG_MAGIC, LOG_VERSION))
+
+    def write(self, events: list[BattleEvent]):
+        data = bytearray()
+        for event in events:
+            values = []
+            for name, field_type in EVENT_FIELDS[event.CODE]:
+                value = getattr(event, name)
+                if field_type is str:
+                    value = self.string_id(value, data)
+                elif isinstance(value, Enum):
+                    value = value.value
+                values.append(value)
+            data.append(event.CODE)
+            for (_name, field_type), value in zip(EVENT_FIELDS[event.CODE], values):
+                data.extend(
+                    struct.pack(FIELD_FORMATS.get(field_type, ENUM_FORMAT), value)
+                )
+        self.log_file.write(data)
+
+    def string_id(self, value: str, data: bytearray) -> int:
+        string_id = self.string_ids.get(value)
+        if string_id is None:
+            string_id = self.string_ids[value] = len(self.string_ids)
+            encoded = value.encode()
+            data.append(STRING_DEFINITION)
+            data.extend(struct.pack("<H", len(encoded)))
+            data.extend(encoded)
+        return string_id
+
+
+class BattleLogReader:
+    def __init__(self, log_file: BinaryIO):
+        self.log_file = log_file
+        self.strings: list[str] = []
+        magic, version = LOG_HEADER.unpack(log_file.read(LOG_HEADER.size))
+        if magic != LOG_MAGIC or version != LOG_VERSION:
+            raise ValueError(f"Unsupported battle log {magic!r} v{version}")
+
+    def __iter__(self) -> Iterator[BattleEvent]:
+        while True:
+            code = self.log_file.read(1)
+            if not code:
+                return
+            code = code[0]
+            if code == STRING_DEFINITION:
+                (length,) = struct.unpack("<H", self.log_file.read(2))
+                self.strings.append(self.log_file.read(length).decode())
+                continue
+            values = []
+            for _name, field_type in EVENT_FIELDS[code]:
+                field_format = FIELD_FORMATS.get(field_type, ENUM_FORMAT)
+                (value,) = struct.unpack(
+                    field_format, self.log_file.read(struct.calcsize(field_format))
+                )
+                if field_type is str:
+                    value = self.strings[value]
+                elif field_type not in FIELD_FORMATS:
+                    value = field_type(value)
+                values.append(value)
+            yield EVENT_TYPES[code](*values)
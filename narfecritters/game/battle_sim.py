@@ -0,0 +1,240 @@
+"""Headless wild battle simulator for balance work.
+
+Battles run through World.turn, catch and run without a map or display.
+Every battle seeds its own Random from the run seed and the battle index,
+so results only depend on the seed, never on how battles are spread over
+worker processes.
+
+Run: python -m narfecritters.game.battle_sim 1 5 4 5 --battles 10000
+"""
+
+import argparse
+import logging
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from enum import Enum
+from random import Random
+from typing import Optional
+
+from narfecritters.game.world import World
+from narfecritters.models import *
+
+LOGGER = logging.getLogger(__name__)
+MAX_TURNS = 100
+CHUNK_SIZE = 250
+WORLD: Optional["SimulationWorld"] = None  # one per worker, reused across battles
+
+
+class BattleAction(Enum):
+    FIGHT = 1
+    CATCH = 2
+    RUN = 3
+
+
+class BattleOutcome(Enum):
+    WIN = 1
+    LOSS = 2
+    CAUGHT = 3
+    ESCAPED = 4
+    TIMEOUT = 5
+
+
+@dataclass(frozen=True)
+class BattleConfig:
+    player_species_id: int
+    player_level: int
+    enemy_species_id: int
+    enemy_level: int
+    action: BattleAction = BattleAction.FIGHT
+    balls: int = 3  # thrown before fighting when the action is CATCH
+    max_turns: int = MAX_TURNS
+
+
+@dataclass
+class BattleStats:
+    outcomes: Counter = field(default_factory=Counter)
+    turns: int = 0
+    catch_attempts: int = 0
+    damage_dealt: Counter = field(default_factory=Counter)  # per turn, to enemy
+    damage_taken: Counter = field(default_factory=Counter)  # per turn, to player
+
+    def merge(self, other: "BattleStats"):
+        self.outcomes.update(other.outcomes)
+        self.turns += other.turns
+        self.catch_attempts += other.catch_attempts
+        self.damage_dealt.update(other.damage_dealt)
+        self.damage_taken.update(other.damage_taken)
+
+    @property
+    def battles(self):
+        return self.outcomes.total()
+
+    @property
+    def win_rate(self):
+        return self.outcomes[BattleOutcome.WIN] / max(self.battles, 1)
+
+    @property
+    def average_turns(self):
+        return self.turns / max(self.battles, 1)
+
+    @property
+    def catch_rate(self):
+        """Successful catches per ball thrown"""
+        return self.outcomes[BattleOutcome.CAUGHT] / max(self.catch_attempts, 1)
+
+    @classmethod
+    def mean(cls, distribution: Counter):
+        count = distribution.total()
+        return sum(value * n for value, n in distribution.items()) / max(count, 1)
+
+    @classmethod
+    def percentile(cls, distribution: Counter, fraction: float):
+        remaining = fraction * distribution.total()
+        for value in sorted(distribution):
+            remaining -= distribution[value]
+            if remaining <= 0:
+                return value
+        return 0
+
+
+class SimulationWorld(World):
+    """World without a map, blacking out only ends the battle"""
+
+    def respawn(self):
+        self.blacked_out = True
+
+
+def simulate_battle(
+    world: SimulationWorld, config: BattleConfig, seed: str, stats: BattleStats
+):
+    world.random = Random(seed)
+    world.blacked_out = False
+    world.player = NPC()
+    world.player.add_item(ItemType.BALL, config.balls)
+    player_critter = world.encyclopedia.create(
+        world.random,
+        world.moves,
+        id=config.player_species_id,
+        level=config.player_level,
+    )
+    world.player.add_critter(player_critter)
+    enemy = world.encyclopedia.create(
+        world.random, world.moves, id=config.enemy_species_id, level=config.enemy_level
+    )
+    world.start_encounter(enemy)
+
+    turns = 0
+    while world.encounter and turns < config.max_turns:
+        turns += 1
+        enemy_hp = enemy.current_hp
+        player_hp = player_critter.current_hp
+        if config.action is BattleAction.CATCH and world.player.has_item(ItemType.BALL):
+            stats.catch_attempts += 1
+            world.catch(ItemType.BALL)
+        elif config.action is BattleAction.RUN:
+            world.run()
+        else:
+            world.turn(world.random.choice(player_critter.moves))
+        stats.damage_dealt[max(enemy_hp - enemy.current_hp, 0)] += 1
+        stats.damage_taken[max(player_hp - player_critter.current_hp, 0)] += 1
+
+    if world.encounter:
+        outcome = BattleOutcome.TIMEOUT
+        world.encounter = None
+    elif world.blacked_out:
+        outcome = BattleOutcome.LOSS
+    elif world.player.has_critter(enemy):
+        outcome = BattleOutcome.CAUGHT
+    elif enemy.fainted:
+        outcome = BattleOutcome.WIN
+    else:
+        outcome = BattleOutcome.ESCAPED
+    stats.outcomes[outcome] += 1
+    stats.turns += turns
+
+
+def simulate_chunk(config: BattleConfig, seed: int, start: int, count: int):
+    global WORLD
+    if WORLD is None:
+        WORLD = SimulationWorld()
+    stats = BattleStats()
+    for index in range(start, start + count):
+        simulate_battle(WORLD, config, f"{seed}:{index}", stats)
+    return stats
+
+
+def simulate(
+    config: BattleConfig,
+    battles: int,
+    seed: int = 0,
+    processes: Optional[int] = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> BattleStats:
+    """Run battles seeded battles, processes=1 keeps them in this process"""
+    chunks = [
+        (start, min(chunk_size, battles - start))
+        for start in range(0, battles, chunk_size)
+    ]
+    stats = BattleStats()
+    if processes == 1:
+        for start, count in chunks:
+            stats.merge(simulate_chunk(config, seed, start, count))
+        return stats
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        futures = [
+            executor.submit(simulate_chunk, config, seed, start, count)
+            for start, count in chunks
+        ]
+        for future in futures:
+            stats.merge(future.result())
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate wild battles headlessly")
+    parser.add_argument("player_species_id", type=int)
+    parser.add_argument("player_level", type=int)
+    parser.add_argument("enemy_species_id", type=int)
+    parser.add_argument("enemy_level", type=int)
+    parser.add_argument(
+        "--action", choices=[action.name for action in BattleAction], default="FIGHT"
+    )
+    parser.add_argument("--balls", type=int, default=3)
+    parser.add_argument("--battles", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--processes", type=int, default=None)
+    args = parser.parse_args()
+    config = BattleConfig(
+        args.player_species_id,
+        args.player_level,
+        args.enemy_species_id,
+        args.enemy_level,
+        action=BattleAction[args.action],
+        balls=args.balls,
+    )
+
+    start = time.perf_counter()
+    stats = simulate(config, args.battles, args.seed, args.processes)
+    elapsed = time.perf_counter() - start
+    print(f"{stats.battles} battles in {elapsed:.2f}s, {stats.battles / elapsed:.0f}/s")
+    for outcome in BattleOutcome:
+        print(
+            f"{outcome.name.lower():>8}: {stats.outcomes[outcome] / stats.battles:.3f}"
+        )
+    print(f"average turns: {stats.average_turns:.2f}")
+    print(f"catch rate per ball: {stats.catch_rate:.3f}")
+    for name, distribution in [
+        ("dealt", stats.damage_dealt),
+        ("taken", stats.damage_taken),
+    ]:
+        print(
+            f"damage {name} per turn: mean {BattleStats.mean(distribution):.1f}"
+            f" p50 {BattleStats.percentile(distribution, 0.5)}"
+            f" p90 {BattleStats.percentile(distribution, 0.9)}"
+        )
+
+
+if __name__ == "__main__":
+    main()
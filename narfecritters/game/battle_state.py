@@ -0,0 +1,275 @@
+"""Immutable battle snapshots and a pure turn function for search and replay.
+
+A BattleState is a frozen value: copying one is free and step returns a new
+state, sharing everything the turn did not touch. step resolves a turn
+exactly like World.turn, drawing from rng in the same order, with the enemy
+choosing like RandomAI. The battle ends at the knockout: experience, level
+ups and blackout healing stay with World.end_encounter.
+
+EncounterStages held by a state are never mutated, step works on copies.
+"""
+
+from dataclasses import dataclass, replace
+from random import Random
+from typing import Optional
+
+from narfecritters.game.move_damage import calculate_move_damage
+from narfecritters.game.move_stat_changes import calculate_move_stat_changes
+from narfecritters.models import *
+
+
+@dataclass(frozen=True, slots=True)
+class CritterState:
+    """The parts of a Critter a battle reads, stats are fixed mid battle"""
+
+    name: str
+    level: int
+    max_hp: int
+    current_hp: int
+    attack: int
+    defense: int
+    spattack: int
+    spdefense: int
+    speed: int
+    type_ids: tuple[int, ...]
+    moves: tuple[Move, ...]
+    ailments: frozenset[Ailment]
+
+    @classmethod
+    def from_critter(cls, critter: Critter):
+        return CritterState(
+            name=critter.name,
+            level=critter.level,
+            max_hp=critter.max_hp,
+            current_hp=critter.current_hp,
+            attack=critter.attack,
+            defense=critter.defense,
+            spattack=critter.spattack,
+            spdefense=critter.spdefense,
+            speed=critter.speed,
+            type_ids=tuple(critter.type_ids),
+            moves=tuple(critter.moves),
+            ailments=frozenset(critter.ailments),
+        )
+
+    @property
+    def fainted(self):
+        return self.current_hp <= 0
+
+
+@dataclass(frozen=True, slots=True)
+class BattleState:
+    party: tuple[CritterState, ...]  # the player's active critters, in order
+    active_index: int
+    enemy: CritterState
+    player_stages: EncounterStages
+    enemy_stages: EncounterStages
+    order_player_first: bool = True
+    won: Optional[bool] = None  # set once the battle is decided
+
+    @classmethod
+    def from_world(cls, world):
+        """Snapshot the current encounter of a World"""
+        party = [
+            world.player.find_critter_by_uuid(critter_uuid)
+            for critter_uuid in world.player.active_critters
+        ]
+        encounter = world.encounter
+        return BattleState(
+            party=tuple(CritterState.from_critter(critter) for critter in party),
+            active_index=party.index(encounter.active_player_critter),
+            enemy=CritterState.from_critter(encounter.enemy),
+            player_stages=replace(encounter.player_stat_stages),
+            enemy_stages=replace(encounter.enemy_stat_stages),
+            order_player_first=encounter.order_player_first,
+        )
+
+    @property
+    def active_critter(self) -> CritterState:
+        return self.party[self.active_index]
+
+    @property
+    def over(self):
+        return self.won is not None
+
+
+class Combatant:
+    """Mutable scratch copy of one side's critter while a turn resolves"""
+
+    __slots__ = ("critter", "current_hp", "ailments", "stages", "party_index")
+
+    def __init__(
+        self,
+        critter: CritterState,
+        stages: EncounterStages,
+        party_index: Optional[int] = None,
+    ):
+        self.critter = critter
+        self.current_hp = critter.current_hp
+        self.ailments = set(critter.ailments)
+        self.stages = stages
+        self.party_index = party_index  # None for the enemy
+
+    @property
+    def name(self):
+        return self.critter.name
+
+    @property
+    def fainted(self):
+        return self.current_hp <= 0
+
+    def has_ailment(self, ailment: Ailment):
+        return ailment in self.ailments
+
+    def add_current_hp(self, amount: int):
+        self.current_hp = max(0, min(self.critter.max_hp, self.current_hp + amount))
+
+    def freeze(self) -> CritterState:
+        if (
+            self.current_hp == self.critter.current_hp
+            and self.ailments == self.critter.ailments
+        ):
+            return self.critter
+        return replace(
+            self.critter,
+            current_hp=self.current_hp,
+            ailments=frozenset(self.ailments),
+        )
+
+
+class Turn:
+    """One World.turn worth of rules over Combatants"""
+
+    def __init__(self, state: BattleState, rng: Random):
+        self.state = state
+        self.rng = rng
+        self.party = list(state.party)
+        self.active_index = state.active_index
+        self.won = state.won
+        player_stages = replace(state.player_stages)
+        self.player = Combatant(
+            state.active_critter, player_stages, party_index=state.active_index
+        )
+        self.enemy = Combatant(state.enemy, replace(state.enemy_stages))
+
+    def resolve(self, player_move: Move) -> BattleState:
+        if self.state.order_player_first:
+            first, first_move = self.player, player_move
+            second, second_move = self.enemy, None
+        else:
+            first, first_move = self.enemy, None
+            second, second_move = self.player, player_move
+        defender_flinched = self.turn_step(first, second, first_move)
+        if (
+            self.won is None
+            and not second.fainted
+            and not first.fainted
+            and not defender_flinched
+        ):
+            self.turn_step(second, first, second_move)
+        for ailment in [Ailment.BURN, Ailment.POISON]:
+            for combatant in [first, second]:
+                if (
+                    self.won is None
+                    and not combatant.fainted
+                    and combatant.has_ailment(ailment)
+                ):
+                    combatant.add_current_hp(-combatant.critter.max_hp // 8)
+                    self.check_faint(combatant)
+        self.party[self.player.party_index] = self.player.freeze()
+        return replace(
+            self.state,
+            party=tuple(self.party),
+            active_index=self.active_index,
+            enemy=self.enemy.freeze(),
+            player_stages=self.player.stages,
+            enemy_stages=self.enemy.stages,
+            won=self.won,
+        )
+
+    def turn_step(
+        self, attacker: Combatant, defender: Combatant, move: Optional[Move]
+    ) -> bool:
+        """World.turn_step, returns whether the defender flinched"""
+        if not move:
+            move = self.rng.choice(attacker.critter.moves)
+        if attacker.has_ailment(Ailment.PARALYSIS):
+            if self.rng.randint(0, 100) < 25:
+                return False
+        if attacker.has_ailment(Ailment.CONFUSION):
+            attacker.stages.confusion_turns -= 1
+            if attacker.stages.confusion_turns == 0:
+                attacker.ailments.remove(Ailment.CONFUSION)
+            elif self.rng.randint(0, 100) < 50:
+                defender = attacker
+        if attacker.has_ailment(Ailment.SLEEP):
+            attacker.stages.sleep_turns -= 1
+            if attacker.stages.sleep_turns == 0:
+                attacker.ailments.remove(Ailment.SLEEP)
+            else:
+                return False
+        hit = (
+            move.accuracy
+            * attacker.stages.accuracy_multipler
+            * defender.stages.evasion_multipler
+            >= self.rng.randint(1, 100)
+        )
+        if not hit:
+            return False
+        result = calculate_move_damage(
+            attacker.critter,
+            defender.critter,
+            attacker.stages,
+            defender.stages,
+            move,
+            self.rng,
+        )
+        if result and result.damage:
+            defender.add_current_hp(-result.damage)
+        self.check_faint(defender)
+        if move.healing:
+            defender.add_current_hp(
+                round(defender.critter.max_hp * (move.healing / 100))
+            )
+        calculate_move_stat_changes(
+            attacker.critter,
+            defender.critter,
+            attacker.stages,
+            defender.stages,
+            move,
+            [],
+        )
+        if (
+            move.ailment
+            and not move.type_id in defender.critter.type_ids
+            and move.ailment_chance >= self.rng.randint(1, 100)
+        ):
+            defender.ailments.add(move.ailment)
+            if move.ailment is Ailment.CONFUSION:
+                defender.stages.confusion_turns = self.rng.randint(1, 4)
+            if move.ailment is Ailment.SLEEP:
+                defender.stages.sleep_turns = self.rng.randint(1, 3)
+        flinched_check = move.flinch_chance >= self.rng.randint(1, 100)
+        return defender is not attacker and flinched_check
+
+    def check_faint(self, combatant: Combatant):
+        if combatant.current_hp > 0 or self.won is not None:
+            return
+        if combatant.party_index is None:
+            self.won = True
+            return
+        self.party[combatant.party_index] = combatant.freeze()
+        for index, critter in enumerate(self.party):
+            if not critter.fainted:
+                self.active_index = index
+                return
+        self.won = False
+
+
+def step(state: BattleState, player_move: Move, rng: Random) -> BattleState:
+    """Resolve one turn where the player uses player_move, states are not
+    modified. Pass a copy of rng to explore what-ifs from the same point.
+    """
+    if state.over:
+        return state
+    return Turn(state, rng).resolve(player_move)
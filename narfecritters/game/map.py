@@ -1,9 +1,25 @@
-from dataclasses import dataclass
+"""Tiled areas and the grids and indexes derived from them.
+
+pytmx imports pygame, so it is only imported where maps are loaded, leaving
+the rest of the game package, and World, usable without SDL.
+"""
 
-import pytmx
+import logging
+from dataclasses import dataclass
 
 from narfecritters.models.encyclopedia import Encyclopedia
 
+LOGGER = logging.getLogger(__name__)
+
+TILE_TALLGRASS = 1
+TILE_HEAL = 2
+TILE_TRANSITION = 4
+TILE_TYPE_FLAGS = {
+    "tallgrass": TILE_TALLGRASS,
+    "heal": TILE_HEAL,
+    "transition": TILE_TRANSITION,
+}
+
 
 @dataclass
 class TransitionDetails:
@@ -27,27 +43,70 @@ class SpecialEncounter:
 
 
 class Map:
-    def __init__(self, area: str):
+    def __init__(self, area: str, tmxdata=None):
+        if tmxdata is None:
+            from pytmx.util_pygame import load_pygame
+
+            tmxdata = load_pygame(f"data/tiled/{area}.tmx")
         self.area = area
-        self.tmxdata = pytmx.load_pygame(f"data/tiled/{area}.tmx")
+        self.tmxdata = tmxdata
+        self.tile_layer_count = len(list(self.tmxdata.visible_tile_layers))
+        self.collisions, self.tile_flags = build_tile_grids(
+            self.tmxdata, self.tile_layer_count
+        )
+        properties = self.tmxdata.properties
+        self.start_tile = parse_tile(properties.get("StartTile"))
+        self.encounter_level = None
+        if properties.get("EncounterLevelMean"):
+            self.encounter_level = EncounterLevel(
+                float(properties.get("EncounterLevelMean")),
+                float(properties.get("EncounterLevelSigma")),
+            )
+        self.encounter_table: list[tuple[str, int]] = []
+        for encounter in (properties.get("Encounters") or "").split("\n"):
+            if encounter:
+                name, probability = str(encounter).split(",")
+                self.encounter_table.append((name, int(probability)))
+        self.transitions: dict[tuple[int, int], TransitionDetails] = {}
+        # the first object of a name wins, as with get_object_by_name
+        objects_by_name = {}
+        for object in self.tmxdata.objects:
+            if object.name in objects_by_name:
+                continue
+            objects_by_name[object.name] = object
+            if object.name and object.name.startswith("transition,"):
+                self.transitions[parse_tile(object.name[11:])] = TransitionDetails(
+                    object.properties["Destination"],
+                    *parse_tile(object.properties["DestinationXY"]),
+                )
+        self.merchant_tile: None | tuple[int, int] = None
+        self.special_encounters: dict[tuple[int, int], SpecialEncounter] = {}
+        for datum_str in (properties.get("NPCs") or "").split("\n"):
+            if not datum_str:
+                continue
+            tile_x, tile_y = parse_tile(datum_str)
+            npc = objects_by_name[f"npc,{tile_x},{tile_y}"]
+            name = npc.properties["Name"]
+            if name == "merchant":
+                self.merchant_tile = self.merchant_tile or (tile_x, tile_y)
+            elif (tile_x, tile_y) in self.special_encounters:
+                LOGGER.warning(f"{area} lists NPC {tile_x},{tile_y} twice, ignoring")
+            else:
+                self.special_encounters[(tile_x, tile_y)] = SpecialEncounter(
+                    name, int(npc.properties["Level"]), tile_x, tile_y
+                )
 
     def get_start_tile(self):
-        return map(int, self.tmxdata.properties.get("StartTile").split(","))
+        return self.start_tile
 
     def get_area_encounter_level(self):
-        mean = float(self.tmxdata.properties.get("EncounterLevelMean"))
-        sigma = float(self.tmxdata.properties.get("EncounterLevelSigma"))
-        return EncounterLevel(mean, sigma)
+        return self.encounter_level
 
     def get_candidate_encounters(self, encyclopedia: Encyclopedia):
         candidate_encounters: list[int] = []
-        encounters_str = self.tmxdata.properties.get("Encounters")
-        if not encounters_str:
-            return []
-        for encounter in encounters_str.split("\n"):
-            name, probability = str(encounter).split(",")
+        for name, probability in self.encounter_table:
             id = encyclopedia.name_to_id[name]
-            candidate_encounters.extend([id] * int(probability))
+            candidate_encounters.extend([id] * probability)
         return candidate_encounters
 
     def get_tile_type(self, tile_x, tile_y, layer):
@@ -55,32 +114,16 @@ class Map:
         return tile_props.get("type")
 
     def get_transition_details(self, tile_x, tile_y):
-        object = self.tmxdata.get_object_by_name(f"transition,{tile_x},{tile_y}")
-        destination_area = object.properties["Destination"]
-        dest_x, dest_y = map(int, object.properties["DestinationXY"].split(","))
-        return TransitionDetails(destination_area, dest_x, dest_y)
+        return self.transitions[(tile_x, tile_y)]
+
+    def get_transition_destinations(self) -> set[str]:
+        return {transition.destination_area for transition in self.transitions.values()}
 
     def get_area_special_encounters(self) -> list[SpecialEncounter]:
-        for tile_x, tile_y in self.get_area_npc_locations():
-            npc = self.tmxdata.get_object_by_name(f"npc,{tile_x},{tile_y}")
-            name = npc.properties["Name"]
-            if name != "merchant":
-                yield SpecialEncounter(
-                    name, int(npc.properties["Level"]), tile_x, tile_y
-                )
+        return list(self.special_encounters.values())
 
     def get_area_merchant_details(self) -> None | tuple[int, int]:
-        for tile_x, tile_y in self.get_area_npc_locations():
-            npc = self.tmxdata.get_object_by_name(f"npc,{tile_x},{tile_y}")
-            if npc.properties["Name"] == "merchant":
-                return tile_x, tile_y
-
-    def get_area_npc_locations(self) -> list[int, int]:
-        data = self.tmxdata.properties.get("NPCs")
-        if not data:
-            return []
-        for datum_str in data.split("\n"):
-            yield map(int, datum_str.split(","))
+        return self.merchant_tile
 
     def has_colliders(self, tile_x, tile_y, layer):
         tile_props = self.tmxdata.get_tile_properties(tile_x, tile_y, layer) or {}
@@ -90,11 +133,49 @@ class Map:
         return self.tmxdata.get_tile_image(tile_x, tile_y, layer)
 
     def get_tile_layer_count(self):
-        return len(list(self.tmxdata.visible_tile_layers))
+        return self.tile_layer_count
+
+    def is_blocked(self, tile_x, tile_y):
+        """Whether any layer collides at the tile, outside the map is blocked"""
+        if not (0 <= tile_x < self.width and 0 <= tile_y < self.height):
+            return True
+        return self.collisions[tile_y * self.width + tile_x] == 1
+
+    def get_tile_flags(self, tile_x, tile_y):
+        """TILE_* flags of every layer at the tile, merged"""
+        if not (0 <= tile_x < self.width and 0 <= tile_y < self.height):
+            return 0
+        return self.tile_flags[tile_y * self.width + tile_x]
+
+    def get_area_enemy_ai(self) -> None | str:
+        return self.tmxdata.properties.get("EnemyAI")
 
     def is_area_cave(self):
         return self.tmxdata.properties.get("AreaType") == "cave"
 
+    @classmethod
+    def load_deferred(cls, area: str):
+        """Parse a map off the main thread, tile images stay unconverted
+        until convert_images is called on the main thread
+        """
+        import pytmx
+
+        return Map(
+            area,
+            pytmx.TiledMap(
+                f"data/tiled/{area}.tmx", image_loader=deferred_image_loader
+            ),
+        )
+
+    def convert_images(self):
+        from pytmx.util_pygame import smart_convert
+
+        images = self.tmxdata.images
+        for index, image in enumerate(images):
+            if isinstance(image, tuple):
+                images[index] = smart_convert(*image)
+        return self
+
     @property
     def width(self):
         return self.tmxdata.width
@@ -102,3 +183,60 @@ class Map:
     @property
     def height(self):
         return self.tmxdata.height
+
+
+def parse_tile(value: None | str) -> None | tuple[int, int]:
+    """Parse an "x,y" property into a tile tuple"""
+    if not value:
+        return None
+    tile_x, tile_y = value.split(",")
+    return int(tile_x), int(tile_y)
+
+
+def deferred_image_loader(filename: str, colorkey, **kwargs):
+    """pytmx image loader doing the thread safe half of
+    pytmx.util_pygame.pygame_image_loader, leaving (tile, colorkey,
+    pixelalpha) for smart_convert
+    """
+    import pygame
+    from pytmx.util_pygame import handle_transformation
+
+    if colorkey:
+        colorkey = pygame.Color(f"#{colorkey}")
+    pixelalpha = kwargs.get("pixelalpha", True)
+    image = pygame.image.load(filename)
+
+    def load_image(rect=None, flags=None):
+        tile = image.subsurface(rect) if rect else image.copy()
+        if flags:
+            tile = handle_transformation(tile, flags)
+        return tile, colorkey, pixelalpha
+
+    return load_image
+
+
+def build_tile_grids(tmxdata, layer_count) -> tuple[bytearray, bytearray]:
+    """Row major collision bitmap and TILE_* flag grid, merged across the
+    first layer_count layers. Properties are looked up once per gid.
+    """
+    width, height = tmxdata.width, tmxdata.height
+    collisions = bytearray(width * height)
+    tile_flags = bytearray(width * height)
+    gid_details: dict[int, tuple[int, int]] = {}
+    for layer in range(layer_count):
+        for y, row in enumerate(tmxdata.layers[layer].data):
+            offset = y * width
+            for x, gid in enumerate(row):
+                details = gid_details.get(gid)
+                if details is None:
+                    tile_props = tmxdata.get_tile_properties_by_gid(gid) or {}
+                    details = gid_details[gid] = (
+                        1 if tile_props.get("colliders") else 0,
+                        TILE_TYPE_FLAGS.get(tile_props.get("type"), 0),
+                    )
+                collides, flags = details
+                if collides:
+                    collisions[offset + x] = 1
+                if flags:
+                    tile_flags[offset + x] |= flags
+    return collisions, tile_flags
@@ -0,0 +1,76 @@
+"""Bounded cache of loaded Maps with background preloading of neighbours.
+
+get returns a cached Map, moving it to the most recent end, or loads one and
+evicts the least recently used past capacity. get is load, which may run on
+another thread, followed by add on the main thread. preload_neighbours
+parses the destinations of a map's transitions on a worker thread; tile
+images are only converted, which needs the display, by add.
+"""
+
+import logging
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable
+
+from narfecritters.game.map import Map
+
+LOGGER = logging.getLogger(__name__)
+MAP_CACHE_SIZE = 4
+
+
+class MapCache:
+    def __init__(
+        self,
+        capacity: int = MAP_CACHE_SIZE,
+        loader: Callable[[str], Map] = Map.load_deferred,
+    ):
+        self.capacity = capacity
+        self.loader = loader
+        self.maps: OrderedDict[str, Map] = OrderedDict()
+        self.pending: dict[str, Future] = {}
+        self.executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="map-preload"
+        )
+
+    def get(self, area: str) -> Map:
+        return self.add(self.load(area))
+
+    def load(self, area: str) -> Map:
+        """The cached or preloaded map, else a freshly loaded one. Only
+        pending preloads change and images stay unconverted, so it can run
+        off the main thread while the main thread leaves the cache alone
+        """
+        map = self.maps.get(area)
+        if map:
+            return map
+        future = self.pending.pop(area, None)
+        if future:
+            try:
+                return future.result()
+            except Exception:
+                LOGGER.exception(f"Preloading {area} failed, loading again")
+        return self.loader(area)
+
+    def add(self, map: Map) -> Map:
+        """Convert map's images and make it the most recently used"""
+        map.convert_images()
+        self.maps[map.area] = map
+        self.maps.move_to_end(map.area)
+        while len(self.maps) > self.capacity:
+            self.maps.popitem(last=False)
+        return map
+
+    def preload_neighbours(self, map: Map):
+        """Start loading the areas map transitions to, dropping preloads
+        for any other area so at most its neighbours are held in flight
+        """
+        neighbours = map.get_transition_destinations() - {map.area}
+        for area in list(self.pending):
+            if area not in neighbours and self.pending.pop(area).cancel():
+                LOGGER.debug(f"Cancelled preloading {area}")
+        for area in neighbours:
+            if area not in self.maps and area not in self.pending:
+                self.pending[area] = self.executor.submit(self.loader, area)
+
+    def __contains__(self, area: str):
+        return area in self.maps
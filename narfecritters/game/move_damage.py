@@ -1,4 +1,8 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
+from typing import Iterable
+
+import numpy as np
+
 from narfecritters.models import *
 
 TYPES = Types.load()  # this is a trick for performance and usability in tests, refactor
@@ -9,6 +13,7 @@ APPLICABILITY = [
     MoveCategory.DAMAGE_LOWER,
     MoveCategory.DAMAGE_RAISE,
 ]
+CRITICAL_HIT_CHANCE = 0.0625
 
 
 @dataclass
@@ -46,15 +51,7 @@ def calculate_base_damage(
 
 
 def calculate_type_factor(defender: Critter, move: Move):
-    type_factor = 1
-    for type_id in defender.type_ids:
-        if move.type_id in TYPES.find_by_id(type_id).double_damage_from:
-            type_factor *= 2
-        if move.type_id in TYPES.find_by_id(type_id).half_damage_from:
-            type_factor /= 2
-        if move.type_id in TYPES.find_by_id(type_id).no_damage_from:
-            type_factor *= 0
-    return type_factor
+    return TYPES.chart.factor(move.type_id, defender.type_ids)
 
 
 def calculate_move_damage(
@@ -78,9 +75,111 @@ def calculate_move_damage(
     )
     # TODO critical hits in gen5 use interesting stages, leaving at stage +0 for now
     # see https://bulbapedia.bulbagarden.net/wiki/Critical_hit for implementation details
-    critical_hit_scalar = 1 if random.random() > 0.0625 else 2
+    critical_hit_scalar = 1 if random.random() > CRITICAL_HIT_CHANCE else 2
     random_factor = random.random() * 0.15 + 0.85
     stab = 1.5 if move.type_id in attacker.type_ids else 1
     type_factor = calculate_type_factor(defender, move)
     dmg = round(base_damage * critical_hit_scalar * random_factor * stab * type_factor)
     return MoveDamageResult(damage=dmg, type_factor=type_factor)
+
+
+@dataclass
+class DamageBatch:
+    """Parallel arrays, one entry per attacker, defender and damaging move"""
+
+    attacker_level: np.ndarray
+    attacker_attack: np.ndarray
+    attacker_spattack: np.ndarray
+    attack_multiplier: np.ndarray
+    spattack_multiplier: np.ndarray
+    defender_defense: np.ndarray
+    defender_spdefense: np.ndarray
+    defense_multiplier: np.ndarray
+    spdefense_multiplier: np.ndarray
+    move_power: np.ndarray
+    physical: np.ndarray  # bool, otherwise the move is special
+    stab: np.ndarray
+    type_factor: np.ndarray
+
+    def __len__(self):
+        return len(self.move_power)
+
+    @classmethod
+    def from_moves(
+        cls,
+        entries: Iterable[
+            tuple[Critter, Critter, EncounterStages, EncounterStages, Move]
+        ],
+    ):
+        """Gather the batch from the same arguments calculate_move_damage takes"""
+        columns = {field.name: [] for field in fields(cls)}
+        for attacker, defender, attacker_stages, defender_stages, move in entries:
+            if move.category not in APPLICABILITY or not move.power:
+                raise ValueError(f"Move {move.name} does not deal damage")
+            if move.damage_class is DamageClass.STATUS:
+                raise ValueError(f"Error: status move {move.name} in damage batch")
+            columns["attacker_level"].append(attacker.level)
+            columns["attacker_attack"].append(attacker.attack)
+            columns["attacker_spattack"].append(attacker.spattack)
+            columns["attack_multiplier"].append(attacker_stages.attack_multipler)
+            columns["spattack_multiplier"].append(attacker_stages.spattack_multipler)
+            columns["defender_defense"].append(defender.defense)
+            columns["defender_spdefense"].append(defender.spdefense)
+            columns["defense_multiplier"].append(defender_stages.defense_multipler)
+            columns["spdefense_multiplier"].append(defender_stages.spdefense_multipler)
+            columns["move_power"].append(move.power)
+            columns["physical"].append(move.damage_class is DamageClass.PHYSICAL)
+            columns["stab"].append(1.5 if move.type_id in attacker.type_ids else 1)
+            columns["type_factor"].append(calculate_type_factor(defender, move))
+        return cls(**{name: np.asarray(values) for name, values in columns.items()})
+
+
+def calculate_move_damage_batch(
+    batch: DamageBatch,
+    rng: Optional[np.random.Generator] = None,
+    crit_rolls: Optional[np.ndarray] = None,
+    random_rolls: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Vectorized calculate_move_damage.
+
+    Rolls are uniform in [0, 1) and take the place of the two random.random()
+    draws the scalar version makes, in the same order. Given the same rolls
+    the damage matches calculate_move_damage exactly: every step uses the same
+    float64 operations, and np.rint rounds half to even like round.
+    Missing rolls are drawn from rng.
+    """
+    if crit_rolls is None or random_rolls is None:
+        rng = rng if rng is not None else np.random.default_rng()
+        crit_rolls = rng.random(len(batch)) if crit_rolls is None else crit_rolls
+        random_rolls = rng.random(len(batch)) if random_rolls is None else random_rolls
+    attack = np.where(
+        batch.physical,
+        batch.attacker_attack * batch.attack_multiplier,
+        batch.attacker_spattack * batch.spattack_multiplier,
+    )
+    defense = np.where(
+        batch.physical,
+        batch.defender_defense * batch.defense_multiplier,
+        batch.defender_spdefense * batch.spdefense_multiplier,
+    )
+    base_damage = (
+        np.rint(
+            (
+                (np.rint((2 * batch.attacker_level) / 5) + 2)
+                * batch.move_power
+                * np.rint(attack / defense)
+            )
+            / 50
+        )
+        + 2
+    )
+    critical_hit_scalar = np.where(crit_rolls > CRITICAL_HIT_CHANCE, 1, 2)
+    random_factor = random_rolls * 0.15 + 0.85
+    damage = np.rint(
+        base_damage
+        * critical_hit_scalar
+        * random_factor
+        * batch.stab
+        * batch.type_factor
+    )
+    return damage.astype(np.int64)
@@ -1,5 +1,25 @@
+from narfecritters.game.battle_events import BattleEvent, StatChangeEvent
 from narfecritters.models import *
 
+OPPONENT_TARGETS = [
+    MoveTarget.ALL_CRITTERS,
+    MoveTarget.ENTIRE_FIELD,
+    MoveTarget.ALL_OPPONENTS,
+    MoveTarget.OPPONENTS_FIELD,
+    MoveTarget.RANDOM_OPPONENT,
+    MoveTarget.ALL_OTHER_CRITTERS,
+]
+USER_TARGETS = [
+    MoveTarget.ALL_CRITTERS,
+    MoveTarget.ENTIRE_FIELD,
+    MoveTarget.ALL_ALLIES,
+    MoveTarget.USER_AND_ALLIES,
+    MoveTarget.USER,
+    MoveTarget.USER_OR_ALLY,
+    MoveTarget.SELECTED_CRITTERS_ME_FIRST,
+    MoveTarget.ALLY,
+]
+
 
 def calculate_move_stat_changes(
     attacker: Critter,
@@ -7,19 +27,12 @@ def calculate_move_stat_changes(
     attacker_encounter_stages: EncounterStages,
     defender_encounter_stages: EncounterStages,
     move: Move,
-    information: list[str],
+    information: list[BattleEvent],
 ):
     if not move.stat_changes:
         return
     for stat_change in move.stat_changes:
-        if move.target in [
-            MoveTarget.ALL_CRITTERS,
-            MoveTarget.ENTIRE_FIELD,
-            MoveTarget.ALL_OPPONENTS,
-            MoveTarget.OPPONENTS_FIELD,
-            MoveTarget.RANDOM_OPPONENT,
-            MoveTarget.ALL_OTHER_CRITTERS,
-        ]:
+        if move.target in OPPONENT_TARGETS:
             current_stat = getattr(defender_encounter_stages, stat_change.name)
             setattr(
                 defender_encounter_stages,
@@ -27,18 +40,9 @@ def calculate_move_stat_changes(
                 current_stat + stat_change.amount,
             )
             information.append(
-                f"{stat_change.name.capitalize()} changed for {defender.name}"
+                StatChangeEvent(defender.name, stat_change.name, stat_change.amount)
             )
-        if move.target in [
-            MoveTarget.ALL_CRITTERS,
-            MoveTarget.ENTIRE_FIELD,
-            MoveTarget.ALL_ALLIES,
-            MoveTarget.USER_AND_ALLIES,
-            MoveTarget.USER,
-            MoveTarget.USER_OR_ALLY,
-            MoveTarget.SELECTED_CRITTERS_ME_FIRST,
-            MoveTarget.ALLY,
-        ]:
+        if move.target in USER_TARGETS:
             current_stat = getattr(attacker_encounter_stages, stat_change.name)
             setattr(
                 attacker_encounter_stages,
@@ -46,5 +50,5 @@ def calculate_move_stat_changes(
                 current_stat + stat_change.amount,
             )
             information.append(
-                f"{stat_change.name.capitalize()} changed for {attacker.name}"
+                StatChangeEvent(attacker.name, stat_change.name, stat_change.amount)
             )
@@ -0,0 +1,75 @@
+"""Spatial hash of an area's NPCs.
+
+NPCs are keyed by the tile they stand on for O(1) collision and interaction
+lookups, and grouped into CELL_TILES square cells so a view rectangle only
+visits the cells it overlaps. NPCs stand still, their tiles are read once
+when added, so an NPC that moves has to be removed and added again.
+"""
+
+from typing import Iterable, Iterator
+
+from narfecritters.models import NPC
+from narfecritters.ui.settings import TILE_SIZE
+
+CELL_TILES = 8
+
+
+def npc_tile(npc: NPC) -> tuple[int, int]:
+    return npc.x // TILE_SIZE, npc.y // TILE_SIZE
+
+
+class NPCIndex:
+    def __init__(self, npcs: Iterable[NPC] = ()):
+        self.by_tile: dict[tuple[int, int], NPC] = {}
+        self.cells: dict[tuple[int, int], list[NPC]] = {}
+        self.npcs: dict[int, NPC] = {}  # by id(npc), in insertion order
+        self.tiles: dict[int, tuple[int, int]] = {}  # id(npc) to its tile
+        for npc in npcs:
+            self.add(npc)
+
+    def add(self, npc: NPC):
+        tile = npc_tile(npc)
+        self.npcs[id(npc)] = npc
+        self.tiles[id(npc)] = tile
+        self.by_tile[tile] = npc
+        self.cells.setdefault(self.cell(tile), []).append(npc)
+
+    def remove(self, npc: NPC):
+        del self.npcs[id(npc)]
+        tile = self.tiles.pop(id(npc))
+        cell = self.cells[self.cell(tile)]
+        cell[:] = [other for other in cell if other is not npc]
+        if self.by_tile.get(tile) is npc:
+            del self.by_tile[tile]
+            for other in cell:  # another NPC sharing the tile takes over
+                if self.tiles[id(other)] == tile:
+                    self.by_tile[tile] = other
+
+    def at(self, tile_x: int, tile_y: int) -> None | NPC:
+        return self.by_tile.get((tile_x, tile_y))
+
+    def in_rect(
+        self, tile_x_begin: int, tile_y_begin: int, tile_x_end: int, tile_y_end: int
+    ) -> Iterator[NPC]:
+        """NPCs on tiles in [begin, end) on both axes"""
+        for cell_x in range(tile_x_begin // CELL_TILES, -(-tile_x_end // CELL_TILES)):
+            for cell_y in range(
+                tile_y_begin // CELL_TILES, -(-tile_y_end // CELL_TILES)
+            ):
+                for npc in self.cells.get((cell_x, cell_y), ()):
+                    tile_x, tile_y = self.tiles[id(npc)]
+                    if (
+                        tile_x_begin <= tile_x < tile_x_end
+                        and tile_y_begin <= tile_y < tile_y_end
+                    ):
+                        yield npc
+
+    @classmethod
+    def cell(cls, tile: tuple[int, int]) -> tuple[int, int]:
+        return tile[0] // CELL_TILES, tile[1] // CELL_TILES
+
+    def __iter__(self) -> Iterator[NPC]:
+        return iter(list(self.npcs.values()))
+
+    def __len__(self):
+        return len(self.npcs)
@@ -0,0 +1,58 @@
+"""Fixed timestep accumulation and headless fast forwarding.
+
+The world advances in steps of STEP_SECONDS whatever the frame rate: each
+frame FixedTimestep.advance turns the elapsed time into a whole number of
+steps and keeps the remainder, alpha is how far the render sits between the
+last two steps. fast_forward runs steps back to back for scripted play.
+"""
+
+from typing import Iterable
+
+from narfecritters.models import Direction
+
+STEP_SECONDS = 1 / 60
+MAX_STEPS_PER_FRAME = 15  # drop time past this rather than spiral on a stall
+FAST_FORWARD_MAX_STEPS = 600  # per scripted move
+
+
+class FixedTimestep:
+    def __init__(
+        self,
+        step_seconds: float = STEP_SECONDS,
+        speed: float = 1.0,
+        max_steps: int = MAX_STEPS_PER_FRAME,
+    ):
+        self.step_seconds = step_seconds
+        self.speed = speed
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+
+    def advance(self, dt: float) -> int:
+        """Steps to run for a frame of dt seconds"""
+        self.accumulator += dt * self.speed
+        steps = int(self.accumulator // self.step_seconds)
+        if steps > self.max_steps:
+            steps = self.max_steps
+            self.accumulator = 0.0
+        else:
+            self.accumulator -= steps * self.step_seconds
+        return steps
+
+    @property
+    def alpha(self) -> float:
+        return min(1.0, self.accumulator / self.step_seconds)
+
+
+def fast_forward(world, moves: Iterable[tuple[Direction, bool]]):
+    """Walk world through (direction, running) moves without a clock,
+    stopping at the first encounter or area change, which is returned
+    """
+    for direction, running in moves:
+        world.move(direction, running)
+        for _ in range(FAST_FORWARD_MAX_STEPS):
+            if not world.move_action:
+                break
+            result = world.step()
+            if result.encounter or result.area_change:
+                return result
+    return None
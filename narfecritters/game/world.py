@@ -1,15 +1,27 @@
 import logging
 import math
+import warnings
 from dataclasses import dataclass, field
 from random import Random
 
-from pygame.math import Vector2
-
-from narfecritters.ui.settings import TILE_SIZE, ENCOUNTER_PROBABILITY, DEFAULT_AREA
+from narfecritters.ui.settings import (
+    TILE_SIZE,
+    ENCOUNTER_PROBABILITY,
+    DEFAULT_AREA,
+    ENEMY_AI,
+    ENEMY_AI_BUDGET_MS,
+)
 from narfecritters.models import *
+from narfecritters.models.save_slots import Autosaver
+from narfecritters.game.battle_ai import BattleAI, create_battle_ai
+from narfecritters.game.battle_events import *
+from narfecritters.game.catch import calculate_catch_value, roll_catch
 from narfecritters.game.move_damage import calculate_move_damage
 from narfecritters.game.move_stat_changes import calculate_move_stat_changes
-from narfecritters.game.map import Map
+from narfecritters.game.map import TILE_HEAL, TILE_TALLGRASS, TILE_TRANSITION, Map
+from narfecritters.game.map_cache import MapCache
+from narfecritters.game.npc_index import NPCIndex
+from narfecritters.game.timestep import STEP_SECONDS
 
 LOGGER = logging.getLogger(__name__)
 MOVE_SPEED = 200
@@ -45,10 +57,22 @@ class MoveAction:
 
 @dataclass
 class TurnResult:
-    information: list[str]
+    information: list[BattleEvent]
     fainted: bool
 
 
+@dataclass
+class PreparedArea:
+    """Everything set_area loads, built by World.prepare_area"""
+
+    area: str
+    map: Map
+    merchant: Optional[NPC]
+    special_encounters: list[NPC]
+    candidate_encounters: list[int]
+    random_state: tuple  # world.random once the special encounters are rolled
+
+
 @dataclass
 class AreaEncounter:
     id: int
@@ -65,21 +89,27 @@ class World:
         self.encounter: Optional[Encounter] = None
         self.area: Optional[str] = None
         self.map: Optional[Map] = None
+        self.map_cache = MapCache()
         self.candidate_encounters: list[int] = []
         self.move_action = None
+        self.previous_player_position = (self.player.x, self.player.y)
         self.merchant = None
-
-    def update(self, dt: float):
+        self.npc_index = NPCIndex()
+        self.autosaver: Optional[Autosaver] = None
+        self.battle_log: Optional[BattleLogWriter] = None
+        self.enemy_ai: BattleAI = create_battle_ai(ENEMY_AI, ENEMY_AI_BUDGET_MS)
+
+    def step(self):
+        """Advance the world by one fixed STEP_SECONDS tick"""
+        self.player.play_time += STEP_SECONDS
+        self.previous_player_position = (self.player.x, self.player.y)
         if self.move_action:
-            direction = Vector2(
-                self.move_action.target_x - self.player.x,
-                self.move_action.target_y - self.player.y,
-            )
-            velocity = direction.normalize() * 2
-            if self.move_action.running:
-                velocity *= 2
-            self.player.x += int(velocity.x)
-            self.player.y += int(velocity.y)
+            direction_x = self.move_action.target_x - self.player.x
+            direction_y = self.move_action.target_y - self.player.y
+            speed = 4 if self.move_action.running else 2
+            distance = math.hypot(direction_x, direction_y)
+            self.player.x += int(direction_x / distance * speed)
+            self.player.y += int(direction_y / distance * speed)
             if (
                 abs(self.player.x - self.move_action.target_x) == 0
                 and abs(self.player.y - self.move_action.target_y) == 0
@@ -92,11 +122,40 @@ class World:
                     return MoveResult(encounter=True)
         return MoveResult()
 
+    def update(self, dt: float):
+        """Deprecated, advance by one step and dt of play time. Call step
+        once per fixed STEP_SECONDS tick instead.
+        """
+        warnings.warn(
+            "World.update is deprecated, use World.step",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        result = self.step()
+        self.player.play_time += dt - STEP_SECONDS
+        return result
+
+    def render_position(self, alpha: float) -> tuple[float, float]:
+        """Player position alpha of the way from the previous step to the
+        last, jumps such as transitions are not interpolated
+        """
+        previous_x, previous_y = self.previous_player_position
+        if (
+            abs(self.player.x - previous_x) > TILE_SIZE
+            or abs(self.player.y - previous_y) > TILE_SIZE
+        ):
+            return self.player.x, self.player.y
+        return (
+            previous_x + (self.player.x - previous_x) * alpha,
+            previous_y + (self.player.y - previous_y) * alpha,
+        )
+
     def respawn(self):
         """Heal critters and udate player location, generally due to blackout"""
         self.player.x = self.player.respawn_x
         self.player.y = self.player.respawn_y
-        self.set_area(self.player.respawn_area)
+        if self.player.respawn_area:
+            self.set_area(self.player.respawn_area)
         for critter in self.player.critters:
             critter.heal()
 
@@ -124,24 +183,22 @@ class World:
     def detect_and_handle_random_encounter(self):
         px = int(self.player.x // TILE_SIZE)
         py = int(self.player.y // TILE_SIZE)
-        for layer in range(self.map.get_tile_layer_count()):
-            if (
-                self.map.get_tile_type(px, py, layer) == "tallgrass"
-                or self.map.is_area_cave()
-            ) and self.random.random() < ENCOUNTER_PROBABILITY:
-                enemy_id = self.random.choice(self.candidate_encounters)
-                encounter_level = self.map.get_area_encounter_level()
-                level = round(
-                    self.random.gauss(encounter_level.mean, encounter_level.sigma)
-                )
-                enemy = self.encyclopedia.create(
-                    self.random,
-                    self.moves,
-                    id=enemy_id,
-                    level=level,
-                )
-                self.start_encounter(enemy)
-                return True
+        if (
+            self.map.get_tile_flags(px, py) & TILE_TALLGRASS or self.map.is_area_cave()
+        ) and self.random.random() < ENCOUNTER_PROBABILITY:
+            enemy_id = self.random.choice(self.candidate_encounters)
+            encounter_level = self.map.get_area_encounter_level()
+            level = round(
+                self.random.gauss(encounter_level.mean, encounter_level.sigma)
+            )
+            enemy = self.encyclopedia.create(
+                self.random,
+                self.moves,
+                id=enemy_id,
+                level=level,
+            )
+            self.start_encounter(enemy)
+            return True
 
     def start_encounter(self, enemy: Critter):
         order_player_first = enemy.speed < self.active_critter.speed
@@ -154,34 +211,47 @@ class World:
         )
 
     def start_special_encounter(self, npc: NPC):
-        self.special_encounters.remove(npc)
+        self.npc_index.remove(npc)
         enemy = npc.active_critter
         self.start_encounter(enemy)
 
     def detect_area_transition(self):
         px = int(self.player.x // TILE_SIZE)
         py = int(self.player.y // TILE_SIZE)
-        for layer in range(self.map.get_tile_layer_count()):
-            if self.map.get_tile_type(px, py, layer) == "heal":
-                for critter in self.player.critters:
-                    critter.heal()
-                self.update_respawn()
-                LOGGER.info("Healed!")
-            if self.map.get_tile_type(px, py, layer) == "transition":
-                details = self.map.get_transition_details(px, py)
-                LOGGER.info(f"Transitioning to {details.destination_area}")
-                self.player.x = TILE_SIZE * details.destination_x + TILE_SIZE // 2
-                self.player.y = TILE_SIZE * details.destination_y + TILE_SIZE // 2
-                return details.destination_area
+        tile_flags = self.map.get_tile_flags(px, py)
+        if tile_flags & TILE_HEAL:
+            for critter in self.player.critters:
+                critter.heal()
+            self.update_respawn()
+            LOGGER.info("Healed!")
+            self.autosave(self.area)
+        if tile_flags & TILE_TRANSITION:
+            details = self.map.get_transition_details(px, py)
+            LOGGER.info(f"Transitioning to {details.destination_area}")
+            self.player.x = TILE_SIZE * details.destination_x + TILE_SIZE // 2
+            self.player.y = TILE_SIZE * details.destination_y + TILE_SIZE // 2
+            self.autosave(details.destination_area)
+            return details.destination_area
         return None
 
+    def autosave(self, area: str):
+        if self.autosaver:
+            self.autosaver.autosave(self.player, area)
+
+    def log_events(self, information: list[BattleEvent]):
+        if self.battle_log:
+            self.battle_log.write(information)
+
+    def turn_result(self, information: list[BattleEvent], fainted: bool):
+        self.log_events(information)
+        return TurnResult(information, fainted)
+
     def detect_and_handle_collisions(self, target_x, target_y):
         px = target_x // TILE_SIZE
         py = target_y // TILE_SIZE
-        for layer in range(self.map.get_tile_layer_count()):
-            if self.map.has_colliders(px, py, layer):
-                return True
-        if self.detect_merchant() or self.detect_special_encounter():
+        if self.map.is_blocked(px, py):
+            return True
+        if self.detect_merchant() or self.npc_index.at(px, py):
             return True
         return False
 
@@ -195,16 +265,9 @@ class World:
         )
 
     def detect_special_encounter(self) -> None | NPC:
-        target_x, target_y = self.get_player_facing_tile()
-        for special_encounter in self.special_encounters:
-            if (
-                special_encounter.x // TILE_SIZE == target_x
-                and special_encounter.y // TILE_SIZE == target_y
-            ):
-                return special_encounter
-        return None
+        return self.npc_index.at(*self.get_player_facing_tile())
 
-    def end_encounter(self, win, information: list[str]):
+    def end_encounter(self, win, information: list[BattleEvent]):
         if win:
             current_level = self.active_critter.level
             self.grant_experience()
@@ -214,15 +277,17 @@ class World:
         if self.active_critter is None:
             self.respawn()
 
-    def handle_level_up(self, information: list[str], previous_level: int):
+    def handle_level_up(self, information: list[BattleEvent], previous_level: int):
         information.append(
-            f"{self.active_critter.name} leveled up to {self.active_critter.level}"
+            LevelUpEvent(self.active_critter.name, self.active_critter.level)
         )
         self.active_critter.current_hp = self.active_critter.max_hp
         self.detect_and_execute_evolution(information)
         self.learn_moves_from_level_up(information, previous_level)
 
-    def learn_moves_from_level_up(self, information: list[str], previous_level: int):
+    def learn_moves_from_level_up(
+        self, information: list[BattleEvent], previous_level: int
+    ):
         for species_move in self.encyclopedia.find_by_id(self.active_critter.id).moves:
             if (
                 species_move.level_learned_at > previous_level
@@ -232,10 +297,10 @@ class World:
                 move = self.moves.find_by_id(species_move.id)
                 self.active_critter.moves.append(move)
                 information.append(
-                    f"{self.active_critter.name} learned {move.name_pretty}"
+                    LearnMoveEvent(self.active_critter.name, move.name_pretty)
                 )
 
-    def detect_and_execute_evolution(self, information: list[str]):
+    def detect_and_execute_evolution(self, information: list[BattleEvent]):
         previous_name = self.active_critter.name
         for evolution_trigger in self.active_critter.evolution_triggers:
             if (
@@ -245,7 +310,7 @@ class World:
                 target_species_id = evolution_trigger.evolved_species_id
                 self.encyclopedia.evolve(self.active_critter, target_species_id)
                 information.append(
-                    f"{previous_name} has evolved into {self.active_critter.name}"
+                    EvolutionEvent(previous_name, self.active_critter.name)
                 )
                 return
 
@@ -279,29 +344,23 @@ class World:
         Attempt to catch the attacking critter. See:
         https://bulbapedia.bulbagarden.net/wiki/Catch_rate#Capture_method_.28Generation_V.2B.29
         """
-        information: list[str] = []
+        information: list[BattleEvent] = []
         if self.player.inventory[ball_type] > 0:
             self.player.remove_item(ball_type)
         else:
-            information.append(f"No balls left!")
-            return TurnResult(information, False)
+            information.append(MessageEvent("No balls left!"))
+            return self.turn_result(information, False)
         player_critter = self.active_critter
 
-        bonus_ball = 1
-        status_bonus = 1  # TODO
-        numerator = (
-            (3 * self.enemy.max_hp - 2 * self.enemy.current_hp)
-            * 4096
-            * self.enemy.capture_rate
-            * bonus_ball
+        a = calculate_catch_value(
+            self.enemy.capture_rate, self.enemy.max_hp, self.enemy.current_hp
         )
-        a = math.floor(numerator / 3 * self.enemy.max_hp) * status_bonus
-        if a >= self.random.randint(0, 1044480) or self.shake_check(a):
-            information.append(f"{self.enemy.name} caught successfully!")
+        if roll_catch(a, self.random):
+            information.append(CatchEvent(self.enemy.name, True))
             self.player.add_critter(self.enemy)
             self.end_encounter(True, information)
         else:
-            information.append(f"Failed to catch {self.enemy.name}.")
+            information.append(CatchEvent(self.enemy.name, False))
             self.turn_step(  # TODO need to call turn to calculate poison+burn etc here
                 defender=player_critter,
                 attacker=self.enemy,
@@ -309,21 +368,11 @@ class World:
                 defender_encounter_stages=self.encounter.player_stat_stages,
                 information=information,
             )
-        return TurnResult(information, player_critter.fainted)
-
-    def shake_check(self, a) -> bool:
-        """Perform 3 shake checkes as described:
-        https://bulbapedia.bulbagarden.net/wiki/Catch_rate#Shake_probability_4
-        """
-        for _x in range(3):
-            b = math.floor(65536 / math.sqrt(math.sqrt(1044480 / a)))
-            if self.random.randint(0, 65535) >= b:
-                return False
-        return True
+        return self.turn_result(information, player_critter.fainted)
 
     def run(self) -> TurnResult:
         """Attempt to flee the attacking critter"""
-        information: list[str] = []
+        information: list[BattleEvent] = []
         player_critter = self.active_critter
 
         odds_escape = (
@@ -331,10 +380,10 @@ class World:
             + 30 * self.encounter.run_attempts
         ) % 256
         if odds_escape >= self.random.randint(0, 255):
-            information.append(f"{player_critter.name} escaped successfully!")
+            information.append(RunEvent(player_critter.name, True))
             self.end_encounter(False, information)
         else:
-            information.append(f"{player_critter.name} failed to run away.")
+            information.append(RunEvent(player_critter.name, False))
             self.encounter.run_attempts += 1
             self.turn_step(  # TODO need to call turn to calculate poison+burn etc here
                 defender=player_critter,
@@ -343,11 +392,11 @@ class World:
                 defender_encounter_stages=self.encounter.player_stat_stages,
                 information=information,
             )
-        return TurnResult(information, player_critter.fainted)
+        return self.turn_result(information, player_critter.fainted)
 
     def turn(self, player_move: Move) -> TurnResult:
         """Take each critters turn. Observes speeds for priority order."""
-        information: list[str] = []
+        information: list[BattleEvent] = []
         player_critter = self.active_critter
         if self.encounter.order_player_first:
             first = player_critter
@@ -371,9 +420,9 @@ class World:
             information=information,
             move=first_move,
         )
-        if not second.fainted and not first.fainted:
+        if self.encounter and not second.fainted and not first.fainted:
             if result.defender_flinched:
-                information.append(f"{second.name} flinched!")
+                information.append(FlinchEvent(second.name))
             else:
                 self.turn_step(
                     defender=first,
@@ -383,23 +432,20 @@ class World:
                     information=information,
                     move=second_move,
                 )
-        if not first.fainted and first.has_ailment(Ailment.BURN):
-            first.add_current_hp(-first.max_hp // 8)
-            information.append(f"{first.name} took damage from burn!")
-            self.check_and_observe_critter_faint(first, information)
-        if not second.fainted and second.has_ailment(Ailment.BURN):
-            second.add_current_hp(-second.max_hp // 8)
-            information.append(f"{second.name} took damage from burn!")
-            self.check_and_observe_critter_faint(second, information)
-        if not first.fainted and first.has_ailment(Ailment.POISON):
-            first.add_current_hp(-first.max_hp // 8)
-            information.append(f"{first.name} took damage from poison!")
-            self.check_and_observe_critter_faint(first, information)
-        if not second.fainted and second.has_ailment(Ailment.POISON):
-            second.add_current_hp(-second.max_hp // 8)
-            information.append(f"{second.name} took damage from poison!")
-            self.check_and_observe_critter_faint(second, information)
-        return TurnResult(information, player_critter.fainted)
+        for ailment in (Ailment.BURN, Ailment.POISON):
+            for critter in (first, second):
+                # once a faint ends the encounter, nothing else happens this turn
+                if (
+                    self.encounter
+                    and not critter.fainted
+                    and critter.has_ailment(ailment)
+                ):
+                    critter.add_current_hp(-critter.max_hp // 8)
+                    information.append(
+                        AilmentEvent(critter.name, ailment, AilmentEffect.DAMAGE)
+                    )
+                    self.check_and_observe_critter_faint(critter, information)
+        return self.turn_result(information, player_critter.fainted)
 
     def turn_step(
         self,
@@ -407,24 +453,41 @@ class World:
         defender: Critter,
         attacker_encounter_stages: EncounterStages,
         defender_encounter_stages: EncounterStages,
-        information: list[str],
+        information: list[BattleEvent],
         move: Optional[Move] = None,
     ):
         """Use a move, if not given, choose randomly"""
         if not move:
-            move = self.moves.find_by_id(self.random.choice(attacker.moves).id)
+            # the enemy acts now, any faster player move has already resolved
+            move = self.enemy_ai.choose_move(
+                attacker,
+                defender,
+                attacker_encounter_stages,
+                defender_encounter_stages,
+                self.random,
+                attacker_first=True,
+            )
+            move = self.moves.find_by_id(move.id)
         if attacker.has_ailment(Ailment.PARALYSIS):
             if self.random.randint(0, 100) < 25:
-                information.append(f"{attacker.name} is paralyzed! It can't move!")
+                information.append(
+                    AilmentEvent(
+                        attacker.name, Ailment.PARALYSIS, AilmentEffect.IMMOBILIZED
+                    )
+                )
                 return TurnStepResult()
         if attacker.has_ailment(Ailment.CONFUSION):
             attacker_encounter_stages.confusion_turns -= 1
             if attacker_encounter_stages.confusion_turns == 0:
                 attacker.ailments.remove(Ailment.CONFUSION)
-                information.append(f"{attacker.name} snapped out of its confusion!")
+                information.append(
+                    AilmentEvent(attacker.name, Ailment.CONFUSION, AilmentEffect.CURED)
+                )
             elif self.random.randint(0, 100) < 50:
                 information.append(
-                    f"{attacker.name} is confused! It hurt itself in its confusion!"
+                    AilmentEvent(
+                        attacker.name, Ailment.CONFUSION, AilmentEffect.SELF_HIT
+                    )
                 )
                 defender = attacker
                 defender_encounter_stages = attacker_encounter_stages
@@ -432,9 +495,15 @@ class World:
             attacker_encounter_stages.sleep_turns -= 1
             if attacker_encounter_stages.sleep_turns == 0:
                 attacker.ailments.remove(Ailment.SLEEP)
-                information.append(f"{attacker.name} woke up!")
+                information.append(
+                    AilmentEvent(attacker.name, Ailment.SLEEP, AilmentEffect.CURED)
+                )
             else:
-                information.append(f"{attacker.name} is asleep!")
+                information.append(
+                    AilmentEvent(
+                        attacker.name, Ailment.SLEEP, AilmentEffect.IMMOBILIZED
+                    )
+                )
                 return TurnStepResult()
         hit = (
             move.accuracy
@@ -443,7 +512,7 @@ class World:
             >= self.random.randint(1, 100)
         )
         if not hit:
-            information.append(f"{attacker.name} missed!")
+            information.append(MissEvent(attacker.name))
             return TurnStepResult()
         self.calculate_and_apply_move_damage(
             attacker,
@@ -477,10 +546,12 @@ class World:
         flinched_check = move.flinch_chance >= self.random.randint(1, 100)
         return TurnStepResult(defender != attacker and flinched_check)
 
-    def check_and_observe_critter_faint(self, critter: Critter, information: list[str]):
+    def check_and_observe_critter_faint(
+        self, critter: Critter, information: list[BattleEvent]
+    ):
         if critter.current_hp <= 0:
-            information.append(f"{critter.name} fainted!")
-            if critter in self.player.critters:
+            information.append(FaintEvent(critter.name))
+            if self.player.has_critter(critter):
                 self.encounter.active_player_critter = self.player.active_critter
                 if self.encounter.active_player_critter is None:
                     self.end_encounter(False, information)
@@ -494,7 +565,7 @@ class World:
         attacker_encounter_stages: EncounterStages,
         defender_encounter_stages: EncounterStages,
         move: Move,
-        information: list[str],
+        information: list[BattleEvent],
     ):
         result = calculate_move_damage(
             attacker,
@@ -507,52 +578,74 @@ class World:
         if result and result.damage:
             player_damage = result.damage
             defender.add_current_hp(-player_damage)
-            information_suffix = self.get_type_effectiveness_response_suffix(
-                result.type_factor
-            )
             information.append(
-                f"{defender.name} took {player_damage} dmg from {move.name}. "
-                + information_suffix
+                DamageEvent(defender.name, player_damage, move.name, result.type_factor)
             )
 
     def set_area(self, area: str):
-        self.area = area
-        self.map = Map(area)
+        self.apply_area(self.prepare_area(area))
+
+    def prepare_area(self, area: str) -> PreparedArea:
+        """Load an area without changing the world, safe to run on a worker.
+        Rolls come from a copy of world.random, which apply_area advances,
+        only the map cache's pending preloads and the species cache change.
+        """
+        map = self.map_cache.load(area)
+        random = Random()
+        random.setstate(self.random.getstate())
+        candidate_encounters = map.get_candidate_encounters(self.encyclopedia)
+        prepared = PreparedArea(
+            area=area,
+            map=map,
+            merchant=self.create_merchant(map),
+            special_encounters=self.create_special_encounters(map, random),
+            candidate_encounters=candidate_encounters,
+            random_state=random.getstate(),
+        )
+        self.encyclopedia.prefetch(set(candidate_encounters))
+        return prepared
+
+    def apply_area(self, prepared: PreparedArea):
+        """Switch to a prepared area, on the main thread"""
+        self.random.setstate(prepared.random_state)
+        self.area = prepared.area
+        self.map = self.map_cache.add(prepared.map)
         if not self.player.respawn_area:
             start_x, start_y = self.map.get_start_tile()
             self.player.x = TILE_SIZE * start_x + TILE_SIZE // 2
             self.player.y = TILE_SIZE * start_y + TILE_SIZE // 2
             self.update_respawn()
+        self.merchant = prepared.merchant
+        self.npc_index = NPCIndex(prepared.special_encounters)
+        self.candidate_encounters = prepared.candidate_encounters
+        self.enemy_ai = create_battle_ai(
+            self.map.get_area_enemy_ai() or ENEMY_AI, ENEMY_AI_BUDGET_MS
+        )
+        self.map_cache.preload_neighbours(self.map)
 
-        if area == DEFAULT_AREA:
-            start_x, start_y = self.map.get_start_tile()
-        self.spawn_merchant()
-        self.spawn_special_encounters()
-        self.candidate_encounters = self.map.get_candidate_encounters(self.encyclopedia)
-
-    def spawn_merchant(self):
-        merchant_details = self.map.get_area_merchant_details()
+    def create_merchant(self, map: Map) -> Optional[NPC]:
+        merchant_details = map.get_area_merchant_details()
         if merchant_details:
             tile_x, tile_y = merchant_details
             x = TILE_SIZE * tile_x + TILE_SIZE // 2
             y = TILE_SIZE * tile_y + TILE_SIZE // 2
-            self.merchant = NPC(x, y, sprite="npc06")
-        else:
-            self.merchant = None
+            return NPC(x, y, sprite="npc06")
+        return None
 
-    def spawn_special_encounters(self):
-        self.special_encounters: list[NPC] = []
-        for special_encounter in self.map.get_area_special_encounters():
+    def create_special_encounters(self, map: Map, random: Random) -> list[NPC]:
+        special_encounters: list[NPC] = []
+        for special_encounter in map.get_area_special_encounters():
             x = TILE_SIZE * special_encounter.tile_x + TILE_SIZE // 2
             y = TILE_SIZE * special_encounter.tile_y + TILE_SIZE // 2
             critter = self.encyclopedia.create(
-                self.random,
+                random,
                 self.moves,
                 name=special_encounter.name,
                 level=special_encounter.level,
             )
             npc = NPC(x=x, y=y, critters=[critter], active_critters=[critter.uuid])
-            self.special_encounters.append(npc)
+            special_encounters.append(npc)
+        return special_encounters
 
     def get_player_facing_tile(self) -> tuple[int, int]:
         """Return the tile the player is facing, given their direction"""
@@ -570,13 +663,7 @@ class World:
 
     @classmethod
     def get_type_effectiveness_response_suffix(cls, type_factor: float):
-        if type_factor == 0:
-            return " It had no effect."
-        elif type_factor < 1:
-            return " It wasn't very effective."
-        elif type_factor > 1:
-            return " It was super effective!"
-        return ""
+        return type_effectiveness_suffix(type_factor)
 
     @property
     def active_critter(self) -> Critter:
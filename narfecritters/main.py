@@ -3,10 +3,18 @@ import logging
 import pygame
 from pygame_gui import UIManager
 
+from narfecritters.game.timestep import FixedTimestep
+from narfecritters.util import frame_profiler
 from narfecritters.util.logging import initialize_logging
 from narfecritters.ui.start_screen import StartScreen
 from narfecritters.ui.screen import ScreenManager
-from narfecritters.ui.settings import WINDOW_SIZE
+from narfecritters.ui.settings import (
+    WINDOW_SIZE,
+    SIMULATION_SPEED,
+    FRAME_PROFILE,
+    FRAME_PROFILE_PATH,
+    FRAME_PROFILE_CAPACITY,
+)
 
 
 LOGGER = logging.getLogger(__name__)
@@ -23,27 +31,42 @@ def main():
 
     clock = pygame.time.Clock()
     is_running = True
+    timestep = FixedTimestep(speed=SIMULATION_SPEED)
+    profiler = frame_profiler.create_frame_profiler(
+        FRAME_PROFILE, FRAME_PROFILE_PATH, FRAME_PROFILE_CAPACITY
+    )
 
     screen_manager = ScreenManager()
     screen_manager.push(StartScreen(manager, screen_manager))
 
     while is_running:
         dt = clock.tick(60) / 1000.0
+        profiler.begin_frame(type(screen_manager.current).__name__)
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 is_running = False
             else:
                 screen_manager.current.process_event(event)
             manager.process_events(event)
+        profiler.mark(frame_profiler.EVENTS)
 
-        screen_manager.current.update(dt)
+        for _ in range(timestep.advance(dt)):
+            screen_manager.current.update(timestep.step_seconds)
+        screen_manager.current.set_interpolation(timestep.alpha)
+        profiler.mark(frame_profiler.UPDATE)
 
         manager.update(dt)
+        profiler.mark(frame_profiler.UI_UPDATE)
         window_surface.blit(background, (0, 0))
         screen_manager.current.draw(window_surface)
+        profiler.mark(frame_profiler.DRAW)
         manager.draw_ui(window_surface)
+        profiler.mark(frame_profiler.DRAW_UI)
 
         pygame.display.update()
+        profiler.mark(frame_profiler.DISPLAY)
+        profiler.end_frame()
+    profiler.write()
 
 
 if __name__ == "__main__":
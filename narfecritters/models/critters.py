@@ -1,22 +1,24 @@
 from enum import Enum, auto
 from typing import Optional
-from functools import lru_cache
 from uuid import UUID
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from dataclass_wizard import YAMLWizard
 
 from narfecritters.models.moves import *
 from narfecritters.models.stats import *
 
+# fields the cached level and stats are derived from
+DERIVED_STATS_SOURCES = frozenset(["base_stats", "ivs", "evs", "experience"])
 
-@dataclass
+
+@dataclass(slots=True)
 class EvolutionTrigger:
     evolved_species_id: int
     min_level: Optional[int]
 
 
-@dataclass
+@dataclass(slots=True)
 class SpeciesMove:
     id: int
     name: str
@@ -46,14 +48,35 @@ class Species(YAMLWizard):
 
     @property
     def critter_attributes(self):
-        attributes = dict(self.__dict__)
-        del attributes["moves"]
-        del attributes["name"]
-        return attributes
+        return {name: getattr(self, name) for name in SPECIES_CRITTER_ATTRIBUTES}
 
 
-@dataclass
-class Critter(YAMLWizard):
+# species fields copied onto critters of that species
+SPECIES_CRITTER_ATTRIBUTES = [
+    f.name for f in fields(Species) if f.name not in ("moves", "name")
+]
+
+
+@dataclass(slots=True)
+class DerivedStats:
+    level: int
+    max_hp: int
+    attack: int
+    defense: int
+    spattack: int
+    spdefense: int
+    speed: int
+
+
+class DerivedStatsCache:
+    """Slot for Critter's cached stats, outside the dataclass fields so it is
+    never serialized"""
+
+    __slots__ = ("_derived_stats",)
+
+
+@dataclass(slots=True)
+class Critter(DerivedStatsCache):
     id: int
     name: str
     base_experience: int
@@ -85,50 +108,84 @@ class Critter(YAMLWizard):
     def fainted(self):
         return self.current_hp <= 0
 
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if name in DERIVED_STATS_SOURCES:
+            self.invalidate_stats()
+
+    def invalidate_stats(self):
+        """Drop cached stats, needed after mutating ivs or evs in place"""
+        object.__setattr__(self, "_derived_stats", None)
+
     @property
-    def level(self):
+    def derived_stats(self) -> DerivedStats:
+        if self._derived_stats is None:
+            self._derived_stats = self.calculate_derived_stats()
+        return self._derived_stats
+
+    def calculate_derived_stats(self) -> DerivedStats:
         # only modeling medium-fast experience group for now
-        return self.level_for_medium_fast_xp(self.experience)
+        level = self.level_for_medium_fast_xp(self.experience)
+        base_stats, ivs, evs = self.base_stats, self.ivs, self.evs
+        numerator = 2 * base_stats.hp + ivs.hp + evs.hp // 4
+        return DerivedStats(
+            level=level,
+            max_hp=(numerator * level) // 100 + level + 10,
+            attack=self.calculate_stat(
+                base_stats.attack, ivs.attack, evs.attack, level
+            ),
+            defense=self.calculate_stat(
+                base_stats.defense, ivs.defense, evs.defense, level
+            ),
+            spattack=self.calculate_stat(
+                base_stats.spattack, ivs.spattack, evs.spattack, level
+            ),
+            spdefense=self.calculate_stat(
+                base_stats.spdefense, ivs.spdefense, evs.spdefense, level
+            ),
+            speed=self.calculate_stat(base_stats.speed, ivs.speed, evs.speed, level),
+        )
+
+    @classmethod
+    def calculate_stat(cls, base: int, iv: int, ev: int, level: int):
+        return (2 * base + ev // 4 + iv) * level // 100 + 5
+
+    @property
+    def level(self):
+        return self.derived_stats.level
 
     @property
     def max_hp(self):
-        numerator = 2 * self.base_stats.hp + self.ivs.hp + self.evs.hp // 4
-        return (numerator * self.level) // 100 + self.level + 10
+        return self.derived_stats.max_hp
 
     @property
     def attack(self):
-        return (
-            2 * self.base_stats.attack + self.evs.attack // 4 + self.ivs.attack
-        ) * self.level // 100 + 5
+        return self.derived_stats.attack
 
     @property
     def defense(self):
-        return (
-            2 * self.base_stats.defense + self.evs.defense // 4 + self.ivs.defense
-        ) * self.level // 100 + 5
+        return self.derived_stats.defense
 
     @property
     def spattack(self):
-        return (
-            2 * self.base_stats.spattack + self.evs.spattack // 4 + self.ivs.spattack
-        ) * self.level // 100 + 5
+        return self.derived_stats.spattack
 
     @property
     def spdefense(self):
-        return (
-            2 * self.base_stats.spdefense + self.evs.spdefense // 4 + self.ivs.spdefense
-        ) * self.level // 100 + 5
+        return self.derived_stats.spdefense
 
     @property
     def speed(self):
-        return (
-            2 * self.base_stats.speed + self.evs.speed // 4 + self.ivs.speed
-        ) * self.level // 100 + 5
+        return self.derived_stats.speed
 
     @classmethod
-    @lru_cache(maxsize=100)
     def level_for_medium_fast_xp(cls, experience):
-        candidate_level = 1
-        while candidate_level**3 <= experience:
-            candidate_level += 1
-        return candidate_level - 1
+        """Integer cube root: the highest level whose cube fits in experience"""
+        if experience <= 0:
+            return 0
+        level = round(experience ** (1 / 3))
+        while level**3 > experience:
+            level -= 1
+        while (level + 1) ** 3 <= experience:
+            level += 1
+        return level
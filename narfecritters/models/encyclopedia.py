@@ -1,4 +1,9 @@
+from collections import OrderedDict
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
 from random import Random
+from threading import Lock
+from typing import Callable, Iterable
 import uuid
 
 from dataclasses import dataclass, field
@@ -10,27 +15,109 @@ from narfecritters.models.npcs import *
 from narfecritters.models.stats import *
 from narfecritters.models.types import *
 
+LOGGER = logging.getLogger(__name__)
+SPECIES_CACHE_SIZE = 256
+
+
+class SpeciesCache:
+    """Bounded LRU of loaded species, shared with the prefetch worker"""
+
+    def __init__(
+        self, loader: Callable[[int], Species], maxsize: int = SPECIES_CACHE_SIZE
+    ):
+        self.loader = loader
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.id_to_species: OrderedDict[int, Species] = OrderedDict()
+        self.lock = Lock()
+
+    def get(self, id: int) -> Species:
+        with self.lock:
+            species = self.id_to_species.get(id)
+            if species is not None:
+                self.id_to_species.move_to_end(id)
+                self.hits += 1
+                return species
+            self.misses += 1
+        return self.load(id)
+
+    def prefetch(self, id: int) -> Species:
+        """Like get, without counting towards hits and misses"""
+        with self.lock:
+            species = self.id_to_species.get(id)
+        return species or self.load(id)
+
+    def load(self, id: int) -> Species:
+        # loading happens outside the lock so lookups never wait on disk
+        species = self.loader(id)
+        with self.lock:
+            self.id_to_species[id] = species
+            self.id_to_species.move_to_end(id)
+            while len(self.id_to_species) > self.maxsize:
+                self.id_to_species.popitem(last=False)
+        return species
+
+    def __contains__(self, id: int):
+        return id in self.id_to_species
+
+    def __len__(self):
+        return len(self.id_to_species)
+
 
 @dataclass
 class Encyclopedia(YAMLWizard):
     name_to_id: dict[str, int]
-    id_to_species: dict[int, Species] = field(default_factory=dict)
+
+    def __post_init__(self):
+        self.species_cache = SpeciesCache(self.load_species)
+        self.prefetch_executor: Optional[ThreadPoolExecutor] = None
 
     @classmethod
     def load(cls):
-        return Encyclopedia.from_yaml_file("data/db/encyclopedia.yml")
+        from narfecritters.models.gamedata import load_pack
+
+        return Encyclopedia(name_to_id=load_pack().name_to_id())
 
     def find_by_id(self, id: int):
-        if id not in self.id_to_species:
-            self.id_to_species[id] = Species.from_yaml_file(f"data/db/species/{id}.yml")
-        return self.id_to_species[id]
+        return self.species_cache.get(id)
+
+    def prefetch(self, ids: Iterable[int]) -> Future:
+        """Load the given species and their evolutions on a worker thread"""
+        if self.prefetch_executor is None:
+            self.prefetch_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="species-prefetch"
+            )
+        return self.prefetch_executor.submit(self.prefetch_species, list(ids))
+
+    def prefetch_species(self, ids: list[int]):
+        visited = set()
+        while ids:
+            id = ids.pop()
+            if id in visited:
+                continue
+            visited.add(id)
+            try:
+                species = self.species_cache.prefetch(id)
+            except Exception:
+                LOGGER.exception(f"Failed to prefetch species {id}")
+                continue
+            for evolution_trigger in species.evolution_triggers:
+                ids.append(evolution_trigger.evolved_species_id)
+
+    @classmethod
+    def load_species(cls, id: int) -> Species:
+        from narfecritters.models.gamedata import load_pack
+
+        return load_pack().species(id)
 
     def find_by_name(self, name):
         return self.find_by_id(self.name_to_id[name])
 
     def evolve(self, critter: Critter, target_species_id):
         target_species = self.find_by_id(target_species_id)
-        critter.__dict__.update(target_species.critter_attributes)
+        for name, value in target_species.critter_attributes.items():
+            setattr(critter, name, value)
         critter.name = target_species.name_pretty
 
     def create(
@@ -0,0 +1,215 @@
+"""Compiled binary pack of the YAML game data in data/db.
+
+The pack is a header, a pickled index of (offset, length) records and the
+pickled records themselves. It is read through mmap, so species are only
+unpickled when first requested. ``load_pack`` rebuilds it whenever the
+YAML sources are newer, have been added or removed, or the model layout has
+changed.
+
+This module imports the model modules to parse the YAML, so their ``load``
+methods import it locally rather than at module level.
+"""
+
+import logging
+import mmap
+import os
+import pickle
+import struct
+import zlib
+from dataclasses import fields
+from functools import lru_cache
+from typing import Optional
+
+from narfecritters.models.critters import *
+from narfecritters.models.encyclopedia import Encyclopedia
+from narfecritters.models.moves import *
+from narfecritters.models.stats import *
+from narfecritters.models.types import *
+
+LOGGER = logging.getLogger(__name__)
+DB_PATH = "data/db"
+PACK_FILENAME = "gamedata.pack"
+PACK_MAGIC = b"NCPK"
+PACK_VERSION = 2
+HEADER = struct.Struct("<4sIII")  # magic, version, schema, index length
+PACKED_MODELS = [
+    Species,
+    SpeciesMove,
+    EvolutionTrigger,
+    Stats,
+    Move,
+    StatChange,
+    Type,
+]
+
+
+def model_schema() -> int:
+    """Fingerprint of the pickled model layouts, stale packs fail to match"""
+    layout = [
+        (model.__name__, [f.name for f in fields(model)], "__slots__" in vars(model))
+        for model in PACKED_MODELS
+    ]
+    return zlib.crc32(repr(layout).encode())
+
+
+class GameDataPack:
+    def __init__(self, buffer):
+        self.buffer = buffer
+        magic, version, schema, index_length = HEADER.unpack_from(buffer)
+        if magic != PACK_MAGIC or version != PACK_VERSION:
+            raise ValueError(f"Unsupported game data pack {magic!r} v{version}")
+        if schema != model_schema():
+            raise ValueError("Game data pack was built for other model layouts")
+        self.records_offset = HEADER.size + index_length
+        index = pickle.loads(buffer[HEADER.size : self.records_offset])
+        self.sections: dict[str, tuple[int, int]] = index["sections"]
+        self.species_records: dict[int, tuple[int, int]] = index["species"]
+        self.sources: list[str] = index["sources"]
+
+    @classmethod
+    def open(cls, path: str):
+        with open(path, "rb") as pack_file:
+            return GameDataPack(
+                mmap.mmap(pack_file.fileno(), 0, access=mmap.ACCESS_READ)
+            )
+
+    def read(self, record: tuple[int, int]):
+        offset, length = record
+        offset += self.records_offset
+        return pickle.loads(self.buffer[offset : offset + length])
+
+    def name_to_id(self) -> dict[str, int]:
+        return self.read(self.sections["name_to_id"])
+
+    def moves(self) -> list[Move]:
+        return self.read(self.sections["moves"])
+
+    def types(self) -> list[Type]:
+        return self.read(self.sections["types"])
+
+    def species(self, id: int) -> Species:
+        return self.read(self.species_records[id])
+
+    @property
+    def species_ids(self):
+        return self.species_records.keys()
+
+
+def source_paths(db_path=DB_PATH) -> list[str]:
+    paths = [
+        os.path.join(db_path, "encyclopedia.yml"),
+        os.path.join(db_path, "moves.yml"),
+        os.path.join(db_path, "types.yml"),
+    ]
+    species_path = os.path.join(db_path, "species")
+    if os.path.isdir(species_path):
+        paths.extend(
+            entry.path
+            for entry in os.scandir(species_path)
+            if entry.name.endswith(".yml")
+        )
+    return paths
+
+
+def source_names(db_path=DB_PATH) -> list[str]:
+    """The existing YAML sources relative to db_path, the set a pack is built
+    from
+    """
+    return sorted(
+        os.path.relpath(path, db_path)
+        for path in source_paths(db_path)
+        if os.path.exists(path)
+    )
+
+
+def build_pack(db_path=DB_PATH) -> bytes:
+    """Parse every YAML source in db_path and compile them into pack bytes"""
+    sources = source_names(db_path)
+    # parsing goes through the YAMLWizard loaders, not the pack backed ones
+    encyclopedia = Encyclopedia.from_yaml_file(
+        os.path.join(db_path, "encyclopedia.yml")
+    )
+    blobs = {
+        "name_to_id": dict(encyclopedia.name_to_id),
+        "moves": Moves.from_yaml_file(os.path.join(db_path, "moves.yml")).moves,
+        "types": Types.from_yaml_file(os.path.join(db_path, "types.yml")).types,
+    }
+    species_blobs = {}
+    for id in sorted(set(encyclopedia.name_to_id.values())):
+        path = os.path.join(db_path, "species", f"{id}.yml")
+        if os.path.exists(path):
+            species_blobs[id] = Species.from_yaml_file(path)
+
+    # record offsets are relative to the end of the index
+    body = bytearray()
+    sections: dict[str, tuple[int, int]] = {}
+    for key, value in blobs.items():
+        sections[key] = append_record(body, value)
+    species = {id: append_record(body, value) for id, value in species_blobs.items()}
+    index = pickle.dumps(
+        {"sections": sections, "species": species, "sources": sources},
+        pickle.HIGHEST_PROTOCOL,
+    )
+    header = HEADER.pack(PACK_MAGIC, PACK_VERSION, model_schema(), len(index))
+    return header + index + bytes(body)
+
+
+def append_record(body: bytearray, value) -> tuple[int, int]:
+    data = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+    record = (len(body), len(data))
+    body.extend(data)
+    return record
+
+
+def write_pack(db_path=DB_PATH) -> str:
+    path = os.path.join(db_path, PACK_FILENAME)
+    data = build_pack(db_path)
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "wb") as pack_file:
+        pack_file.write(data)
+    os.replace(temp_path, path)
+    return path
+
+
+def open_fresh_pack(db_path=DB_PATH) -> Optional[GameDataPack]:
+    """The compiled pack, or None when it is missing, unreadable, older than
+    a source or built from another set of sources
+    """
+    path = os.path.join(db_path, PACK_FILENAME)
+    if not os.path.exists(path):
+        return None
+    pack_mtime = os.path.getmtime(path)
+    for source_path in source_paths(db_path):
+        if os.path.exists(source_path) and os.path.getmtime(source_path) > pack_mtime:
+            return None
+    try:
+        pack = GameDataPack.open(path)
+    except ValueError as e:
+        LOGGER.info(f"Rebuilding game data pack: {e}")
+        return None
+    if pack.sources != source_names(db_path):
+        return None
+    return pack
+
+
+def is_pack_stale(db_path=DB_PATH) -> bool:
+    return open_fresh_pack(db_path) is None
+
+
+@lru_cache(maxsize=None)
+def load_pack(db_path=DB_PATH) -> GameDataPack:
+    """Open the game data pack, compiling it first if missing or stale"""
+    pack = open_fresh_pack(db_path)
+    if pack:
+        return pack
+    path = os.path.join(db_path, PACK_FILENAME)
+    LOGGER.info(f"Compiling game data pack {path}")
+    try:
+        return GameDataPack.open(write_pack(db_path))
+    except OSError as e:
+        LOGGER.warning(f"Could not write game data pack, keeping it in memory: {e}")
+        return GameDataPack(build_pack(db_path))
+
+
+if __name__ == "__main__":
+    print(f"Wrote {write_pack()}")
@@ -4,6 +4,8 @@ from dataclasses import dataclass, field
 
 from dataclass_wizard import YAMLWizard
 
+from narfecritters.models.registry import IdNameIndex
+
 
 class DamageClass(Enum):
     STATUS = auto()
@@ -61,13 +63,13 @@ class MoveCategory(Enum):
     UNIQUE = 13
 
 
-@dataclass
+@dataclass(slots=True)
 class StatChange:
     amount: int
     name: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Move:
     id: int
     name: str
@@ -94,16 +96,21 @@ class Move:
 class Moves(YAMLWizard):
     moves: list[Move]
 
+    def __post_init__(self):
+        self._index = IdNameIndex(self.moves)
+
     @classmethod
     def load(cls):
-        return Moves.from_yaml_file(f"data/db/moves.yml")
+        from narfecritters.models.gamedata import load_pack
+
+        return Moves(moves=load_pack().moves())
 
     def find_by_name(self, name: str):
-        for move in self.moves:
-            if move.name == name:
-                return move
+        return self._index.find_by_name(name)
 
     def find_by_id(self, id: int):
-        for move in self.moves:
-            if move.id == id:
-                return move
+        return self._index.find_by_id(id)
+
+    def add(self, move: Move):
+        """Add a move, replacing any existing move with the same id"""
+        self._index.add(move)
@@ -15,6 +15,11 @@ ACTIVE_CRITTERS_MAX = 6
 
 @dataclass
 class NPC:
+    """critters and active_critters are indexed, change them only through
+    add_critter, remove_critter, activate_critter and deactivate_critter or
+    by assigning new lists. Editing them in place leaves the index stale.
+    """
+
     x: int = 0
     y: int = 0
     respawn_x: int = 0
@@ -26,29 +31,63 @@ class NPC:
     critters: list[Critter] = field(default_factory=list)
     active_critters: list[UUID] = field(default_factory=list)
     sprite: Optional[str] = "player"
+    play_time: float = 0.0
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name == "critters":
+            self.reindex_critters()
+        elif name == "active_critters":
+            self.invalidate_active_critter()
+
+    def reindex_critters(self):
+        self.uuid_to_critter = {critter.uuid: critter for critter in self.critters}
+        self.invalidate_active_critter()
+
+    def invalidate_active_critter(self):
+        self.active_critter_list = None
 
     @property
     def active_critter(self):
-        for active_critter_uuid in self.active_critters:
-            active_critter = self.find_critter_by_uuid(active_critter_uuid)
-            if not active_critter.fainted:
-                return active_critter
+        """First active critter that has not fainted. The resolved active
+        critters are cached per roster, hp is checked on every call.
+        """
+        if self.active_critter_list is None:
+            self.active_critter_list = [
+                self.uuid_to_critter[critter_uuid]
+                for critter_uuid in self.active_critters
+            ]
+        for critter in self.active_critter_list:
+            if not critter.fainted:
+                return critter
         return None
 
     def add_critter(self, critter: Critter):
         self.critters.append(critter)
+        self.uuid_to_critter[critter.uuid] = critter
         if len(self.active_critters) < ACTIVE_CRITTERS_MAX:
             self.active_critters.append(critter.uuid)
+        self.invalidate_active_critter()
 
     def remove_critter(self, critter: Critter):
         self.critters.remove(critter)
         self.active_critters.remove(critter.uuid)
+        del self.uuid_to_critter[critter.uuid]
+        self.invalidate_active_critter()
+
+    def activate_critter(self, critter_uuid: UUID):
+        self.active_critters.append(critter_uuid)
+        self.invalidate_active_critter()
+
+    def deactivate_critter(self, critter_slot_idx: int):
+        del self.active_critters[critter_slot_idx]
+        self.invalidate_active_critter()
 
     def find_critter_by_uuid(self, uuid):
-        for critter in self.critters:
-            if critter.uuid == uuid:
-                return critter
-        return None
+        return self.uuid_to_critter.get(uuid)
+
+    def has_critter(self, critter: Critter):
+        return self.uuid_to_critter.get(critter.uuid) is critter
 
     def add_item(self, item: ItemType, amount: int = 1):
         current = self.inventory.get(item, 0)
@@ -0,0 +1,36 @@
+class IdNameIndex:
+    """Hash lookups over a list of entries that have an ``id`` and a ``name``.
+
+    The wrapped list stays the iteration view, so entries should be added
+    through ``add`` to keep both in sync.
+    """
+
+    def __init__(self, entries: list):
+        self.entries = entries
+        self.reindex()
+
+    def reindex(self):
+        # first entry wins on duplicates, matching the old linear scans
+        self.id_to_entry = {}
+        self.name_to_entry = {}
+        for entry in self.entries:
+            self.id_to_entry.setdefault(entry.id, entry)
+            self.name_to_entry.setdefault(entry.name, entry)
+
+    def find_by_id(self, id: int):
+        return self.id_to_entry.get(id)
+
+    def find_by_name(self, name: str):
+        return self.name_to_entry.get(name)
+
+    def add(self, entry):
+        """Append an entry, or replace the entry sharing its id"""
+        existing = self.id_to_entry.get(entry.id)
+        if existing is None:
+            self.entries.append(entry)
+        else:
+            self.entries[self.entries.index(existing)] = entry
+            if self.name_to_entry.get(existing.name) is existing:
+                del self.name_to_entry[existing.name]
+        self.id_to_entry[entry.id] = entry
+        self.name_to_entry[entry.name] = entry
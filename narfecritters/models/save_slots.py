@@ -0,0 +1,270 @@
+"""Binary save slots, one file per slot, written atomically.
+
+Each slot file is a header, a small pickled SlotMetadata record and the
+pickled plain-data form of an NPC, the same data the YAML Save holds for
+that slot. Save menus only read the header and metadata, rosters are
+deserialized when a slot is loaded. Autosaves use the same format and
+alternate between two files. The YAML Save stays as an export/import format.
+"""
+
+import io
+import logging
+import os
+import pickle
+import struct
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from threading import Lock
+from typing import BinaryIO, Optional
+
+from dataclass_wizard import asdict, fromdict
+
+from narfecritters.models.npcs import *
+
+LOGGER = logging.getLogger(__name__)
+SAVE_SLOTS_PATH = "data/db/saves"
+YAML_SAVE_PATH = "data/db/save.yml"
+SLOT_MAGIC = b"NCSV"
+SLOT_VERSION = 2
+SLOT_PREFIX = struct.Struct("<4sH")  # magic, version
+# metadata length, metadata crc32, body length, body crc32
+SLOT_HEADER = struct.Struct("<IIII")
+AUTOSAVE_COUNT = 2
+# raised reading a truncated, corrupt or tampered slot
+SLOT_ERRORS = (ValueError, pickle.UnpicklingError)
+
+
+@dataclass(slots=True)
+class SlotMetadata:
+    critter_count: int
+    x: int
+    y: int
+    area: Optional[str]
+    play_time: float
+    timestamp: float
+
+    @classmethod
+    def from_player(cls, player: NPC, area: Optional[str], timestamp: float):
+        return SlotMetadata(
+            critter_count=len(player.critters),
+            x=player.x,
+            y=player.y,
+            area=area,
+            play_time=player.play_time,
+            timestamp=timestamp,
+        )
+
+    @property
+    def play_time_pretty(self):
+        minutes, seconds = divmod(int(self.play_time), 60)
+        hours, minutes = divmod(minutes, 60)
+        return f"{hours}:{minutes:02}:{seconds:02}"
+
+
+class PlainDataUnpickler(pickle.Unpickler):
+    """Save data only holds builtins, refuse anything that imports code"""
+
+    def find_class(self, module, name):
+        raise pickle.UnpicklingError(f"Unexpected {module}.{name} in save data")
+
+
+def loads_plain(data: bytes, crc: int):
+    if zlib.crc32(data) != crc:
+        raise ValueError("Save slot is truncated or corrupt")
+    return PlainDataUnpickler(io.BytesIO(data)).load()
+
+
+def read_exactly(slot_file: BinaryIO, length: int) -> bytes:
+    data = slot_file.read(length)
+    if len(data) != length:
+        raise ValueError("Save slot is truncated or corrupt")
+    return data
+
+
+def encode_slot(
+    player: NPC, area: Optional[str] = None, timestamp: Optional[float] = None
+) -> bytes:
+    metadata = SlotMetadata.from_player(
+        player, area, time.time() if timestamp is None else timestamp
+    )
+    metadata_data = pickle.dumps(asdict(metadata), pickle.HIGHEST_PROTOCOL)
+    body = pickle.dumps(asdict(player), pickle.HIGHEST_PROTOCOL)
+    header = SLOT_PREFIX.pack(SLOT_MAGIC, SLOT_VERSION) + SLOT_HEADER.pack(
+        len(metadata_data), zlib.crc32(metadata_data), len(body), zlib.crc32(body)
+    )
+    return header + metadata_data + body
+
+
+def read_slot_header(slot_file: BinaryIO) -> tuple[int, int, int, int]:
+    magic, version = SLOT_PREFIX.unpack(read_exactly(slot_file, SLOT_PREFIX.size))
+    if magic != SLOT_MAGIC or version != SLOT_VERSION:
+        raise ValueError(f"Unsupported save slot {magic!r} v{version}")
+    return SLOT_HEADER.unpack(read_exactly(slot_file, SLOT_HEADER.size))
+
+
+def read_slot_player(slot_file: BinaryIO) -> NPC:
+    metadata_length, _crc, length, crc = read_slot_header(slot_file)
+    slot_file.seek(metadata_length, os.SEEK_CUR)
+    return fromdict(NPC, loads_plain(read_exactly(slot_file, length), crc))
+
+
+def read_slot_metadata(slot_file: BinaryIO) -> SlotMetadata:
+    length, crc, _body_length, _body_crc = read_slot_header(slot_file)
+    return fromdict(SlotMetadata, loads_plain(read_exactly(slot_file, length), crc))
+
+
+def write_atomic(path: str, data: bytes):
+    """Write to a temporary file then rename, readers never see partial data"""
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "wb") as temp_file:
+        temp_file.write(data)
+        temp_file.flush()
+        os.fsync(temp_file.fileno())
+    os.replace(temp_path, path)
+
+
+class SaveSlots:
+    def __init__(self, path=SAVE_SLOTS_PATH):
+        self.path = path
+
+    @classmethod
+    def open(cls, path=SAVE_SLOTS_PATH, yaml_path=YAML_SAVE_PATH):
+        """Open the slots, importing the YAML save the first time"""
+        save_slots = SaveSlots(path)
+        if not os.path.isdir(path) and os.path.exists(yaml_path):
+            LOGGER.info(f"Importing {yaml_path} into {path}")
+            save_slots.import_yaml(yaml_path)
+        return save_slots
+
+    def slot_path(self, slot_index: int):
+        return os.path.join(self.path, f"slot{slot_index}.sav")
+
+    def autosave_path(self, autosave_index: int):
+        return os.path.join(self.path, f"autosave{autosave_index}.sav")
+
+    def save_slot(self, slot_index: int, player: NPC, area: Optional[str] = None):
+        os.makedirs(self.path, exist_ok=True)
+        write_atomic(self.slot_path(slot_index), encode_slot(player, area))
+
+    def save_autosave(self, player: NPC, area: Optional[str], timestamp: float):
+        """Overwrite the older autosave, the newer one survives a bad write"""
+        os.makedirs(self.path, exist_ok=True)
+        path = min(
+            (self.autosave_path(idx) for idx in range(AUTOSAVE_COUNT)),
+            key=lambda path: getattr(self.read_metadata(path), "timestamp", -1),
+        )
+        write_atomic(path, encode_slot(player, area, timestamp))
+
+    def load_autosave(self) -> Optional[tuple[NPC, SlotMetadata]]:
+        """Newest autosave that reads back completely, if any"""
+        for metadata, path in self.autosaves():
+            try:
+                with open(path, "rb") as slot_file:
+                    return read_slot_player(slot_file), metadata
+            except SLOT_ERRORS as e:
+                LOGGER.warning(f"Skipping unreadable autosave {path}: {e}")
+        return None
+
+    def autosaves(self) -> list[tuple[SlotMetadata, str]]:
+        """Readable autosaves, newest first"""
+        autosaves = []
+        for idx in range(AUTOSAVE_COUNT):
+            path = self.autosave_path(idx)
+            metadata = self.read_metadata(path)
+            if metadata:
+                autosaves.append((metadata, path))
+        autosaves.sort(key=lambda autosave: autosave[0].timestamp, reverse=True)
+        return autosaves
+
+    def load_slot(self, slot_index: int) -> Optional[NPC]:
+        """The slot's player, None when it is empty or unreadable"""
+        path = self.slot_path(slot_index)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "rb") as slot_file:
+                return read_slot_player(slot_file)
+        except SLOT_ERRORS as e:
+            LOGGER.warning(f"Unreadable save slot {path}: {e}")
+            return None
+
+    def load_slot_metadata(self, slot_index: int) -> Optional[SlotMetadata]:
+        return self.read_metadata(self.slot_path(slot_index))
+
+    def read_metadata(self, path: str) -> Optional[SlotMetadata]:
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "rb") as slot_file:
+                return read_slot_metadata(slot_file)
+        except SLOT_ERRORS as e:
+            LOGGER.warning(f"Unreadable save slot {path}: {e}")
+            return None
+
+    def load_metadata(self) -> list[Optional[SlotMetadata]]:
+        return [self.load_slot_metadata(idx) for idx in range(Save.SLOT_COUNT)]
+
+    def delete_slot(self, slot_index: int):
+        path = self.slot_path(slot_index)
+        if os.path.exists(path):
+            os.remove(path)
+
+    def load(self) -> Save:
+        return Save(players=[self.load_slot(idx) for idx in range(Save.SLOT_COUNT)])
+
+    def export_yaml(self, yaml_path=YAML_SAVE_PATH):
+        self.load().to_yaml_file(yaml_path)
+
+    def import_yaml(self, yaml_path=YAML_SAVE_PATH):
+        save = Save.from_yaml_file(yaml_path)
+        for slot_index, player in enumerate(save.players):
+            if player:
+                self.save_slot(slot_index, player)
+            else:
+                self.delete_slot(slot_index)
+
+
+class Autosaver:
+    """Writes autosaves on a background worker.
+
+    The player is pickled on the calling thread, which is cheap compared to
+    encoding and writing the slot. A snapshot taken while another is still
+    pending replaces it, only the newest state is worth writing.
+    """
+
+    def __init__(self, save_slots: SaveSlots):
+        self.save_slots = save_slots
+        self.lock = Lock()
+        self.pending: Optional[tuple[bytes, Optional[str], float]] = None
+        self.writing = None
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="autosave")
+
+    def autosave(self, player: NPC, area: Optional[str]):
+        snapshot = pickle.dumps(player, pickle.HIGHEST_PROTOCOL)
+        with self.lock:
+            self.pending = (snapshot, area, time.time())
+            if self.writing is None:
+                self.writing = self.executor.submit(self.write_pending)
+
+    def write_pending(self):
+        while True:
+            with self.lock:
+                if self.pending is None:
+                    self.writing = None
+                    return
+                snapshot, area, timestamp = self.pending
+                self.pending = None
+            try:
+                player = pickle.loads(snapshot)
+                self.save_slots.save_autosave(player, area, timestamp)
+            except Exception:
+                LOGGER.exception("Autosave failed")
+
+    def flush(self):
+        """Block until every pending snapshot has been written"""
+        with self.lock:
+            writing = self.writing
+        if writing:
+            writing.result()
@@ -3,7 +3,7 @@ from random import Random
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class Stats:
     hp: int = 0
     attack: int = 0
@@ -24,7 +24,7 @@ class Stats:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class EncounterStages(Stats):
     """See https://bulbapedia.bulbagarden.net/wiki/Stat_modifier#Stage_multipliers for details"""
 
@@ -1,6 +1,8 @@
 from dataclasses import dataclass, field
 from dataclass_wizard import YAMLWizard
 
+from narfecritters.models.registry import IdNameIndex
+
 
 @dataclass
 class Type:
@@ -18,16 +20,66 @@ class Type:
 class Types(YAMLWizard):
     types: list[Type]
 
+    def __post_init__(self):
+        self._index = IdNameIndex(self.types)
+        self._chart = None
+
     @classmethod
     def load(cls):
-        return Types.from_yaml_file(f"data/db/types.yml")
+        from narfecritters.models.gamedata import load_pack
+
+        return Types(types=load_pack().types())
 
     def find_by_name(self, name: str):
-        for type in self.types:
-            if type.name == name:
-                return type
+        return self._index.find_by_name(name)
 
     def find_by_id(self, id: int):
-        for type in self.types:
-            if type.id == id:
-                return type
+        return self._index.find_by_id(id)
+
+    def add(self, type: Type):
+        """Add a type, replacing any existing type with the same id"""
+        self._index.add(type)
+        self._chart = None
+
+    @property
+    def chart(self) -> "TypeChart":
+        if self._chart is None:
+            self._chart = TypeChart(self.types)
+        return self._chart
+
+
+class TypeChart:
+    """Dense attacking type by defending type damage multiplier matrix"""
+
+    def __init__(self, types: list[Type]):
+        self.type_id_to_index = {type.id: index for index, type in enumerate(types)}
+        self.rows: dict[int, list[float]] = {}
+        for attacking_type in types:
+            self.rows.setdefault(
+                attacking_type.id,
+                [
+                    self.calculate_factor(attacking_type.id, defending_type)
+                    for defending_type in types
+                ],
+            )
+
+    def factor(self, attacking_type_id: int, defending_type_ids: list[int]):
+        """Combined multiplier of an attack against a (possibly dual typed) defender"""
+        row = self.rows.get(attacking_type_id)
+        if row is None:
+            return 1
+        type_factor = 1
+        for type_id in defending_type_ids:
+            type_factor *= row[self.type_id_to_index[type_id]]
+        return type_factor
+
+    @classmethod
+    def calculate_factor(cls, attacking_type_id: int, defending_type: Type):
+        type_factor = 1
+        if attacking_type_id in defending_type.double_damage_from:
+            type_factor *= 2
+        if attacking_type_id in defending_type.half_damage_from:
+            type_factor /= 2
+        if attacking_type_id in defending_type.no_damage_from:
+            type_factor *= 0
+        return type_factor
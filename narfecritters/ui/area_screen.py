@@ -4,18 +4,18 @@ import pygame
 from pygame_gui import UIManager
 
 from narfecritters.models import Direction, NPC
-from narfecritters.game.world import World
+from narfecritters.game.world import PreparedArea, World
 from narfecritters.ui.battle_screen import BattleScreen
+from narfecritters.ui.loading_screen import LoadingScreen
 from narfecritters.ui.merchant.merchant_screen import MerchantScreen
 from narfecritters.ui.npc_sprite import NPCSprite
 from narfecritters.ui.pause.pause_screen import PauseScreen
 from narfecritters.ui.screen import Screen, ScreenManager
 from narfecritters.ui.settings import TILE_SIZE, WINDOW_SIZE
+from narfecritters.ui.terrain_chunks import TerrainChunks
 
 LOGGER = logging.getLogger(__name__)
-TILE_VIEW_SPAN = (
-    WINDOW_SIZE[0] // 2 // TILE_SIZE + 2
-)  # how many tiles away shall we paint
+NPC_DRAW_MARGIN = 3  # tiles, critter sprites reach above their tile
 
 
 class AreaScreen(Screen):
@@ -25,13 +25,22 @@ class AreaScreen(Screen):
         screen_manager: ScreenManager,
         world: World,
         area: str,
+        prepared: None | PreparedArea = None,
     ):
+        """prepared, from World.prepare_area, is applied instead of loading
+        area here
+        """
         super().__init__(ui_manager)
         self.screen_manager = screen_manager
         self.world = world
         self.player_sprite = NPCSprite("player", 0.8, offset=(0, -7))
         self.sprites = pygame.sprite.Group(self.player_sprite)
-        self.world.set_area(area)
+        if prepared:
+            self.world.apply_area(prepared)
+        else:
+            self.world.set_area(area)
+        self.frozen_camera: None | tuple[int, int] = None
+        self.terrain = TerrainChunks(self.world.map)
         self.merchant_sprite = None
         self.area_species_id_to_images: dict[int, pygame.sprite.Sprite] = {}
 
@@ -60,23 +69,25 @@ class AreaScreen(Screen):
         if not self.world.move_action:
             self.player_sprite.stop()
             self.handle_move()
-        result = self.world.update(dt)
+        result = self.world.step()
         if result.encounter:
             self.screen_manager.push(
                 BattleScreen(self.ui_manager, self.screen_manager, self.world)
             )
         if result.area_change:
+            # the player already stands at the destination, keep the view
+            x, y = self.world.previous_player_position
+            self.frozen_camera = (round(x), round(y))
             self.screen_manager.pop()
-            screen = AreaScreen(
+            screen = LoadingScreen(
                 self.ui_manager,
                 self.screen_manager,
                 self.world,
                 result.area_change,
+                previous=self,
             )
             self.screen_manager.push(screen)
 
-        self.update_merchant_sprite()
-
         self.player_sprite.set_position(WINDOW_SIZE[0] // 2, WINDOW_SIZE[1] // 2)
         self.sprites.update()
 
@@ -123,8 +134,9 @@ class AreaScreen(Screen):
 
     def draw(self, surface: pygame.Surface):
         surface.blit(self.background, (0, 0))
+        self.update_merchant_sprite()
         self.draw_terrain(surface)
-        for npc in self.world.special_encounters:
+        for npc in self.visible_npcs():
             image = self.area_species_id_to_images.get(npc.active_critter.id)
             if not image:
                 path = f"data/sprites/critters/front/{npc.active_critter.id}.png"
@@ -136,31 +148,32 @@ class AreaScreen(Screen):
             y += TILE_SIZE - size_y
             surface.blit(image, (x, y))
 
+    def visible_npcs(self):
+        camera_x, camera_y = self.camera_position()
+        return self.world.npc_index.in_rect(
+            (camera_x - WINDOW_SIZE[0] // 2) // TILE_SIZE - NPC_DRAW_MARGIN,
+            (camera_y - WINDOW_SIZE[1] // 2) // TILE_SIZE - NPC_DRAW_MARGIN,
+            (camera_x + WINDOW_SIZE[0] // 2) // TILE_SIZE + NPC_DRAW_MARGIN + 1,
+            (camera_y + WINDOW_SIZE[1] // 2) // TILE_SIZE + NPC_DRAW_MARGIN + 1,
+        )
+
+    def camera_position(self) -> tuple[int, int]:
+        if self.frozen_camera:
+            return self.frozen_camera
+        x, y = self.world.render_position(self.interpolation)
+        return round(x), round(y)
+
     def draw_terrain(self, surface):
-        px = self.world.player.x
-        py = self.world.player.y
-        tile_x = int(px // TILE_SIZE)
-        tile_y = int(py // TILE_SIZE)
-        tile_x_begin = max(0, tile_x - TILE_VIEW_SPAN)
-        tile_x_end = min(tile_x + TILE_VIEW_SPAN, self.world.map.width)
-        tile_y_begin = max(0, tile_y - TILE_VIEW_SPAN)
-        tile_y_end = min(tile_y + TILE_VIEW_SPAN, self.world.map.height)
-        for layer in range(self.world.map.get_tile_layer_count()):
-            for x in range(tile_x_begin, tile_x_end):
-                for y in range(tile_y_begin, tile_y_end):
-                    image = self.world.map.get_tile_image(x, y, layer)
-                    if image:
-                        surface.blit(
-                            image,
-                            (
-                                WINDOW_SIZE[0] // 2 + x * TILE_SIZE - px,
-                                WINDOW_SIZE[1] // 2 + y * TILE_SIZE - py,
-                            ),
-                        )
-            if self.world.map.tmxdata.layers[layer].name == "Tile Layer 2":
-                self.sprites.draw(surface)
+        if self.terrain.map is not self.world.map:  # respawned elsewhere
+            self.terrain = TerrainChunks(self.world.map)
+        px, py = self.camera_position()
+        self.terrain.draw_below(surface, px, py)
+        if self.terrain.has_sprite_layer:
+            self.sprites.draw(surface)
+        self.terrain.draw_above(surface, px, py)
 
     def get_npc_draw_position(self, npc: NPC):
-        x = WINDOW_SIZE[0] // 2 + npc.x - self.world.player.x
-        y = WINDOW_SIZE[1] // 2 + npc.y - self.world.player.y
+        camera_x, camera_y = self.camera_position()
+        x = WINDOW_SIZE[0] // 2 + npc.x - camera_x
+        y = WINDOW_SIZE[1] // 2 + npc.y - camera_y
         return x, y
@@ -6,6 +6,9 @@ from pygame_gui import UI_BUTTON_PRESSED, UIManager
 from pygame_gui.core.ui_element import UIElement
 from pygame_gui.elements import UIButton
 
+from narfecritters.game.battle_events import BattleEvent, LevelUpEvent, MessageEvent
+from narfecritters.game.catch import catch_probability
+from narfecritters.game.move_damage import calculate_type_factor
 from narfecritters.game.world import World
 from narfecritters.models.items import ItemType
 from narfecritters.ui.screen import Screen, ScreenManager
@@ -32,8 +35,10 @@ class BattleScreen(Screen):
         self.world = world
         self.menu_buttons: list[UIButton] = []
         self.information_elements: list[UIElement] = []
-        self.information_queue: list[str] = [
-            f"You are fighting a level {self.world.enemy.level} {self.world.enemy.name}"
+        self.information_queue: list[BattleEvent] = [
+            MessageEvent(
+                f"You are fighting a level {self.world.enemy.level} {self.world.enemy.name}"
+            )
         ]
         self.fight_buttons: list[UIButton] = []
         self.critter_buttons: list[UIButton] = []
@@ -59,7 +64,9 @@ class BattleScreen(Screen):
                             self.world.catch(ItemType.BALL).information
                         )
                     else:
-                        self.information_queue.append("Not enough balls to catch!")
+                        self.information_queue.append(
+                            MessageEvent("Not enough balls to catch!")
+                        )
                     self.initialize_information_elements()
             elif event.ui_element in self.fight_buttons:
                 self.kill_fight_buttons()
@@ -73,7 +80,7 @@ class BattleScreen(Screen):
                 critter = event.ui_element.critter
                 self.world.encounter.active_player_critter = critter
                 self.reload_self_critter_image()
-                information: list[str] = []
+                information: list[BattleEvent] = []
                 active_critter = self.world.active_critter
                 self.world.turn_step(  # TODO need to call turn to calculate poison+burn etc here
                     defender=active_critter,
@@ -85,6 +92,7 @@ class BattleScreen(Screen):
                 if active_critter.fainted:
                     # TODO itd be nice to do this after the information elements catch up
                     self.reload_self_critter_image()
+                self.world.log_events(information)
                 self.information_queue.extend(information)
                 self.initialize_information_elements()
             elif event.ui_element in self.information_elements:
@@ -96,10 +104,7 @@ class BattleScreen(Screen):
                     self.screen_manager.pop()
                 else:
                     self.initialize_menu_buttons()
-                if "leveled up to" in last_information:
-                    # TODO hack: Need to enrich information queue with a struct that describes a trigger
-                    # for other screen or things. It doesn't exist right now though, and while useful in general,
-                    # this is the only specific thing I need this for right now. Consider refactoring.
+                if isinstance(last_information, LevelUpEvent):
                     if len(self.world.active_critter.moves) > 4:
                         self.screen_manager.push(
                             MoveSelectScreen(
@@ -128,7 +133,7 @@ class BattleScreen(Screen):
 
     def initialize_information_elements(self):
         y = WINDOW_SIZE[1] - (len(MenuOptions) + 1) * 32
-        information_text = self.information_queue[0]
+        information_text = str(self.information_queue[0])
         LOGGER.info(information_text)
         self.information_elements.append(
             UIButton(
@@ -148,8 +153,18 @@ class BattleScreen(Screen):
     def initialize_menu_buttons(self):
         y = WINDOW_SIZE[1] - (len(MenuOptions) + 1) * 32
         for menu_option in MenuOptions:
+            tool_tip_text = None
+            if menu_option is MenuOptions.CATCH:
+                enemy = self.world.enemy
+                odds = catch_probability(
+                    enemy.capture_rate, enemy.max_hp, enemy.current_hp
+                )
+                tool_tip_text = f"{odds:.0%} chance to catch"
             menu_button = UIButton(
-                (WINDOW_SIZE[0] - 128, y), menu_option.name, manager=self.ui_manager
+                (WINDOW_SIZE[0] - 128, y),
+                menu_option.name,
+                manager=self.ui_manager,
+                tool_tip_text=tool_tip_text,
             )
             self.menu_buttons.append(menu_button)
             y += 32
@@ -174,11 +189,17 @@ class BattleScreen(Screen):
             if len(self.fight_buttons) >= 4:
                 LOGGER.warn(f"Critter has move than 4 moves!")
                 continue
+            tool_tip_text = None
+            if critters_move.power:
+                type_factor = calculate_type_factor(self.world.enemy, critters_move)
+                suffix = self.world.get_type_effectiveness_response_suffix(type_factor)
+                tool_tip_text = suffix.strip() or None
             self.fight_buttons.append(
                 UIButton(
                     (WINDOW_SIZE[0] - 128, y),
                     critters_move.name_pretty,
                     manager=self.ui_manager,
+                    tool_tip_text=tool_tip_text,
                 )
             )
             self.fight_buttons[-1].move = critters_move
@@ -0,0 +1,72 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+from pygame_gui import UIManager
+
+from narfecritters.game.world import PreparedArea, World
+from narfecritters.ui.screen import Screen, ScreenManager
+from narfecritters.ui.settings import WINDOW_SIZE
+
+LOGGER = logging.getLogger(__name__)
+FADE_SECONDS = 0.3
+AREA_LOADER = ThreadPoolExecutor(max_workers=1, thread_name_prefix="area-loader")
+
+
+def load_area(world: World, area: str) -> tuple[PreparedArea, dict]:
+    """Worker half of an area switch: the area and its critter sprites,
+    images are left unconverted for the main thread
+    """
+    prepared = world.prepare_area(area)
+    images = {}
+    for npc in prepared.special_encounters:
+        id = npc.active_critter.id
+        if id not in images:
+            images[id] = pygame.image.load(f"data/sprites/critters/front/{id}.png")
+    return prepared, images
+
+
+class LoadingScreen(Screen):
+    """Fades out the previous screen while World.prepare_area runs on a
+    worker, then replaces itself with an AreaScreen applying the result. The
+    worker reads the world, so this screen does not update it meanwhile.
+    """
+
+    def __init__(
+        self,
+        ui_manager: UIManager,
+        screen_manager: ScreenManager,
+        world: World,
+        area: str,
+        previous: Screen = None,
+    ):
+        super().__init__(ui_manager)
+        self.screen_manager = screen_manager
+        self.world = world
+        self.area = area
+        self.previous = previous
+        self.elapsed = 0.0
+        self.overlay = pygame.Surface(WINDOW_SIZE)
+        LOGGER.info(f"Loading {area}")
+        self.future = AREA_LOADER.submit(load_area, world, area)
+
+    def update(self, dt: float):
+        self.elapsed += dt
+        if self.elapsed < FADE_SECONDS or not self.future.done():
+            return
+        from narfecritters.ui.area_screen import AreaScreen
+
+        prepared, images = self.future.result()
+        screen = AreaScreen(
+            self.ui_manager, self.screen_manager, self.world, self.area, prepared
+        )
+        for id, image in images.items():
+            screen.area_species_id_to_images[id] = image.convert_alpha()
+        self.screen_manager.pop()
+        self.screen_manager.push(screen)
+
+    def draw(self, surface: pygame.Surface):
+        if self.previous:
+            self.previous.draw(surface)
+        self.overlay.set_alpha(round(255 * min(1.0, self.elapsed / FADE_SECONDS)))
+        surface.blit(self.overlay, (0, 0))
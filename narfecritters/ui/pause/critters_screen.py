@@ -40,13 +40,13 @@ class CrittersScreen(Screen):
                 critter_slot_idx = event.ui_element.critter_slot_idx
                 if len(self.world.player.active_critters) <= critter_slot_idx:
                     return
-                del self.world.player.active_critters[critter_slot_idx]
+                self.world.player.deactivate_critter(critter_slot_idx)
                 self.reinit()
             if event.ui_element in self.critter_buttons:
                 if len(self.world.player.active_critters) >= ACTIVE_CRITTERS_MAX:
                     return
                 critter_uuid = event.ui_element.critter_uuid
-                self.world.player.active_critters.append(critter_uuid)
+                self.world.player.activate_critter(critter_uuid)
                 self.reinit()
 
     def initialize_active_critter_buttons(self):
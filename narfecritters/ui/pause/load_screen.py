@@ -21,6 +21,12 @@ class LoadScreen(SaveScreen):
                     self.screen_manager.pop()
             if event.ui_element in self.slot_buttons:
                 slot_index = event.ui_element.slot_index
-                self.world.player = self.save.players[slot_index]
-                self.screen_manager.pop()
-                self.screen_manager.pop()
+                player = self.save_slots.load_slot(slot_index)
+                if player:
+                    self.world.player = player
+                    self.screen_manager.pop()
+                    self.screen_manager.pop()
+                elif self.slot_metadata[slot_index]:
+                    # the metadata reads back but the roster does not
+                    event.ui_element.set_text("Unreadable")
+                    event.ui_element.disable()
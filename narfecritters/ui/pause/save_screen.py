@@ -7,7 +7,7 @@ from pygame_gui.elements import UIButton
 
 from narfecritters.ui.screen import Screen, ScreenManager
 from narfecritters.ui.settings import WINDOW_SIZE
-from narfecritters.models import Save
+from narfecritters.models.save_slots import SaveSlots
 from narfecritters.game.world import World
 
 
@@ -25,7 +25,8 @@ class SaveScreen(Screen):
         super().__init__(ui_manager)
         self.screen_manager = screen_manager
         self.world = world
-        self.save = Save.load()
+        self.save_slots = SaveSlots.open()
+        self.slot_metadata = self.save_slots.load_metadata()
         self.menu_buttons: list[UIButton] = []
         self.slot_buttons: list[UIButton] = []
         self.init()
@@ -37,17 +38,22 @@ class SaveScreen(Screen):
                     self.screen_manager.pop()
             if event.ui_element in self.slot_buttons:
                 slot_index = event.ui_element.slot_index
-                self.save.players[slot_index] = self.world.player
-                self.save.save()
+                self.save_slots.save_slot(
+                    slot_index, self.world.player, self.world.area
+                )
+                self.slot_metadata = self.save_slots.load_metadata()
                 self.reinit()
 
     def initialize_slot_buttons(self):
         y = 32
         idx = 0
-        for player in self.save.players:
+        for metadata in self.slot_metadata:
             text = "-"
-            if player:
-                text = f"{len(player.critters)}, {player.x}/{player.y}"
+            if metadata:
+                text = (
+                    f"{metadata.critter_count}, {metadata.area or '?'} "
+                    f"{metadata.x}/{metadata.y}, {metadata.play_time_pretty}"
+                )
             button = UIButton(
                 (32, y),
                 text=text,
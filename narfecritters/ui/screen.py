@@ -8,6 +8,8 @@ from narfecritters.ui.settings import WINDOW_SIZE
 
 
 class Screen:
+    interpolation = 1.0  # how far rendering sits between the last two steps
+
     def __init__(self, ui_manager: UIManager):
         self.ui_manager = ui_manager
         self.background = load_image("data/images/background.png").convert_alpha()
@@ -19,8 +21,12 @@ class Screen:
         pass
 
     def update(self, dt: float):
+        """Called once per fixed simulation step of dt seconds"""
         pass
 
+    def set_interpolation(self, alpha: float):
+        self.interpolation = alpha
+
     def draw(self, surface: Surface):
         surface.blit(self.background, (WINDOW_SIZE[0] // 2, WINDOW_SIZE[1] // 2))
 
@@ -27,6 +27,12 @@ class Settings(YAMLWizard):
     )
     encounter_probability: float = 0.05
     default_area: str = "overworld"
+    enemy_ai: str = "random"  # or "search", areas may override with EnemyAI
+    enemy_ai_budget_ms: float = 3.0
+    simulation_speed: float = 1.0  # fixed steps run per step of real time
+    frame_profile: bool = False
+    frame_profile_path: str = "frame_profile.json"
+    frame_profile_capacity: int = 3600
 
     @classmethod
     def load(cls, path="settings.yml"):
@@ -40,3 +46,9 @@ WINDOW_SIZE = (SETTINGS.window_size.x, SETTINGS.window_size.y)
 TILE_SIZE = SETTINGS.tile_size
 ENCOUNTER_PROBABILITY = SETTINGS.encounter_probability
 DEFAULT_AREA = SETTINGS.default_area
+ENEMY_AI = SETTINGS.enemy_ai
+ENEMY_AI_BUDGET_MS = SETTINGS.enemy_ai_budget_ms
+SIMULATION_SPEED = SETTINGS.simulation_speed
+FRAME_PROFILE = SETTINGS.frame_profile
+FRAME_PROFILE_PATH = SETTINGS.frame_profile_path
+FRAME_PROFILE_CAPACITY = SETTINGS.frame_profile_capacity
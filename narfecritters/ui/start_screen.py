@@ -4,10 +4,11 @@ import pygame
 from pygame_gui import UI_BUTTON_PRESSED, UIManager
 from pygame_gui.elements import UIButton
 
-from narfecritters.ui.area_screen import AreaScreen
+from narfecritters.ui.loading_screen import LoadingScreen
 from narfecritters.ui.screen import Screen, ScreenManager
 from narfecritters.ui.settings import WINDOW_SIZE, SETTINGS
 from narfecritters.game.world import DEFAULT_AREA, World
+from narfecritters.models.save_slots import Autosaver, SaveSlots
 
 
 LOGGER = logging.getLogger(__name__)
@@ -20,6 +21,8 @@ class StartScreen(Screen):
         super().__init__(ui_manager)
         self.screen_manager = screen_manager
         self.world = World()
+        self.save_slots = SaveSlots.open()
+        self.world.autosaver = Autosaver(self.save_slots)
 
         self.greeting_elements = [
             UIButton((0, 0), GREETING_TEXT_1, manager=self.ui_manager),
@@ -45,8 +48,18 @@ class StartScreen(Screen):
             self.buttons.append(button)
             y += 32
 
+        self.continue_button = None
+        if self.save_slots.autosaves():
+            self.continue_button = UIButton(
+                (WINDOW_SIZE[0] / 2, y + 32), "Continue", manager=self.ui_manager
+            )
+            self.buttons.append(self.continue_button)
+
     def process_event(self, event):
         if event.type == UI_BUTTON_PRESSED:
+            if event.ui_element is self.continue_button:
+                self.continue_from_autosave()
+                return
             if event.ui_element in self.buttons:
                 species = event.ui_element.species
                 critter = self.world.encyclopedia.create(
@@ -59,7 +72,7 @@ class StartScreen(Screen):
                 self.world.player.add_critter(critter)
                 self.screen_manager.pop()
                 self.screen_manager.push(
-                    AreaScreen(
+                    LoadingScreen(
                         self.ui_manager,
                         self.screen_manager,
                         self.world,
@@ -67,6 +80,18 @@ class StartScreen(Screen):
                     )
                 )
 
+    def continue_from_autosave(self):
+        autosave = self.save_slots.load_autosave()
+        if not autosave:
+            LOGGER.warning("No readable autosave to continue from")
+            return
+        self.world.player, metadata = autosave
+        area = metadata.area or self.world.player.respawn_area or DEFAULT_AREA
+        self.screen_manager.pop()
+        self.screen_manager.push(
+            LoadingScreen(self.ui_manager, self.screen_manager, self.world, area)
+        )
+
     def kill(self):
         self.kill_elements(self.buttons + self.greeting_elements)
 
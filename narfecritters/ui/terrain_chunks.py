@@ -0,0 +1,134 @@
+"""Static tile layers pre-rendered into chunk surfaces.
+
+Each chunk covers CHUNK_TILES x CHUNK_TILES tiles and has two stacks: the
+layers up to and including SPRITE_LAYER_NAME, drawn below the sprites, and
+the layers after it, drawn above. Chunks are rendered the first time they
+come into view, one neighbouring chunk per frame is rendered ahead of the
+camera, and chunks far from the camera are evicted.
+"""
+
+import pygame
+
+from narfecritters.game.map import Map
+from narfecritters.ui.settings import TILE_SIZE, WINDOW_SIZE
+
+CHUNK_TILES = 16
+PRELOAD_MARGIN = 1  # chunks beyond the view rendered ahead of time
+EVICT_MARGIN = 2  # chunks beyond the view kept before eviction
+SPRITE_LAYER_NAME = "Tile Layer 2"
+
+
+class TerrainChunks:
+    def __init__(self, map: Map, chunk_tiles: int = CHUNK_TILES):
+        self.map = map
+        self.chunk_tiles = chunk_tiles
+        self.chunk_size = chunk_tiles * TILE_SIZE
+        layers = list(range(map.get_tile_layer_count()))
+        layer_names = [map.tmxdata.layers[layer].name for layer in layers]
+        self.has_sprite_layer = SPRITE_LAYER_NAME in layer_names
+        split = (
+            layer_names.index(SPRITE_LAYER_NAME) + 1
+            if self.has_sprite_layer
+            else len(layers)
+        )
+        self.below_layers = layers[:split]
+        self.above_layers = layers[split:]
+        self.chunks: dict[tuple[int, int], tuple[pygame.Surface, pygame.Surface]] = {}
+        self.chunk_columns = -(-map.width // chunk_tiles)
+        self.chunk_rows = -(-map.height // chunk_tiles)
+
+    def visible_range(self, camera_x, camera_y, margin=0):
+        """Chunk columns and rows overlapping the window, plus margin"""
+        left = camera_x - WINDOW_SIZE[0] // 2
+        top = camera_y - WINDOW_SIZE[1] // 2
+        begin_x = max(0, left // self.chunk_size - margin)
+        begin_y = max(0, top // self.chunk_size - margin)
+        end_x = min(
+            self.chunk_columns, (left + WINDOW_SIZE[0]) // self.chunk_size + 1 + margin
+        )
+        end_y = min(
+            self.chunk_rows, (top + WINDOW_SIZE[1]) // self.chunk_size + 1 + margin
+        )
+        return range(begin_x, end_x), range(begin_y, end_y)
+
+    def draw_below(self, surface: pygame.Surface, camera_x: int, camera_y: int):
+        """Blit the below sprite stacks and update the chunk set, call first"""
+        self.prepare(camera_x, camera_y)
+        self.draw_stack(surface, camera_x, camera_y, 0)
+
+    def draw_above(self, surface: pygame.Surface, camera_x: int, camera_y: int):
+        self.draw_stack(surface, camera_x, camera_y, 1)
+
+    def draw_stack(self, surface, camera_x, camera_y, stack):
+        columns, rows = self.visible_range(camera_x, camera_y)
+        origin_x = WINDOW_SIZE[0] // 2 - camera_x
+        origin_y = WINDOW_SIZE[1] // 2 - camera_y
+        blits = []
+        for chunk_x in columns:
+            for chunk_y in rows:
+                image = self.get_chunk(chunk_x, chunk_y)[stack]
+                if image:
+                    blits.append(
+                        (
+                            image,
+                            (
+                                origin_x + chunk_x * self.chunk_size,
+                                origin_y + chunk_y * self.chunk_size,
+                            ),
+                        )
+                    )
+        surface.blits(blits, doreturn=False)
+
+    def prepare(self, camera_x, camera_y):
+        """Evict far chunks and render at most one upcoming chunk"""
+        columns, rows = self.visible_range(camera_x, camera_y, EVICT_MARGIN)
+        for key in [
+            key for key in self.chunks if key[0] not in columns or key[1] not in rows
+        ]:
+            del self.chunks[key]
+        columns, rows = self.visible_range(camera_x, camera_y, PRELOAD_MARGIN)
+        for chunk_x in columns:
+            for chunk_y in rows:
+                if (chunk_x, chunk_y) not in self.chunks:
+                    self.get_chunk(chunk_x, chunk_y)
+                    return
+
+    def get_chunk(self, chunk_x, chunk_y) -> tuple[pygame.Surface, pygame.Surface]:
+        chunk = self.chunks.get((chunk_x, chunk_y))
+        if chunk is None:
+            chunk = self.chunks[(chunk_x, chunk_y)] = (
+                self.render(chunk_x, chunk_y, self.below_layers),
+                self.render(chunk_x, chunk_y, self.above_layers),
+            )
+        return chunk
+
+    def render(self, chunk_x, chunk_y, layers) -> None | pygame.Surface:
+        """One stack of a chunk, None when it has no tiles"""
+        tile_x_begin = chunk_x * self.chunk_tiles
+        tile_y_begin = chunk_y * self.chunk_tiles
+        tile_x_end = min(tile_x_begin + self.chunk_tiles, self.map.width)
+        tile_y_end = min(tile_y_begin + self.chunk_tiles, self.map.height)
+        blits = []
+        for layer in layers:
+            for x in range(tile_x_begin, tile_x_end):
+                for y in range(tile_y_begin, tile_y_end):
+                    image = self.map.get_tile_image(x, y, layer)
+                    if image:
+                        blits.append(
+                            (
+                                image,
+                                (
+                                    (x - tile_x_begin) * TILE_SIZE,
+                                    (y - tile_y_begin) * TILE_SIZE,
+                                ),
+                            )
+                        )
+        if not blits:
+            return None
+        size = (
+            (tile_x_end - tile_x_begin) * TILE_SIZE,
+            (tile_y_end - tile_y_begin) * TILE_SIZE,
+        )
+        image = pygame.Surface(size, pygame.SRCALPHA)
+        image.blits(blits, doreturn=False)
+        return image.convert_alpha()
@@ -0,0 +1,114 @@
+"""Per frame phase timings kept in a fixed size ring buffer.
+
+The main loop calls begin_frame with the active screen, mark after each
+phase and end_frame. Only the last capacity frames are kept, write exports
+p50/p95/p99 per phase, overall and per screen. NullFrameProfiler has the
+same methods doing nothing, so the calls stay in the loop when disabled.
+"""
+
+import json
+import time
+
+import numpy as np
+
+EVENTS = 0
+UPDATE = 1
+UI_UPDATE = 2
+DRAW = 3
+DRAW_UI = 4
+DISPLAY = 5
+PHASES = ["events", "update", "ui_update", "draw", "draw_ui", "display"]
+PERCENTILES = [50, 95, 99]
+DEFAULT_CAPACITY = 3600  # a minute at 60fps
+
+
+class NullFrameProfiler:
+    def begin_frame(self, tag: str):
+        pass
+
+    def mark(self, phase: int):
+        pass
+
+    def end_frame(self):
+        pass
+
+    def write(self):
+        pass
+
+
+class FrameProfiler:
+    def __init__(
+        self,
+        path: str,
+        capacity: int = DEFAULT_CAPACITY,
+        clock=time.perf_counter,
+    ):
+        self.path = path
+        self.capacity = capacity
+        self.clock = clock
+        self.samples = np.zeros((capacity, len(PHASES)), dtype=np.float64)
+        self.tags: list[str] = [""] * capacity
+        self.frame_count = 0
+        self.row = [0.0] * len(PHASES)
+        self.tag = ""
+        self.last = 0.0
+
+    def begin_frame(self, tag: str):
+        self.tag = tag
+        self.row = [0.0] * len(PHASES)
+        self.last = self.clock()
+
+    def mark(self, phase: int):
+        now = self.clock()
+        self.row[phase] += now - self.last
+        self.last = now
+
+    def end_frame(self):
+        index = self.frame_count % self.capacity
+        self.samples[index] = self.row
+        self.tags[index] = self.tag
+        self.frame_count += 1
+
+    def recorded(self) -> tuple[np.ndarray, list[str]]:
+        """Samples and tags of the frames still in the buffer"""
+        count = min(self.frame_count, self.capacity)
+        return self.samples[:count], self.tags[:count]
+
+    def summary(self) -> dict:
+        samples, tags = self.recorded()
+        tag_array = np.array(tags, dtype=object)
+        return {
+            "frames": self.frame_count,
+            "recorded": len(samples),
+            "all": self.summarize(samples),
+            "screens": {
+                tag: self.summarize(samples[tag_array == tag])
+                for tag in sorted(set(tags))
+            },
+        }
+
+    @classmethod
+    def summarize(cls, samples: np.ndarray) -> dict:
+        """Milliseconds at each percentile for each phase and the frame total"""
+        if not len(samples):
+            return {"frames": 0}
+        columns = dict(zip(PHASES, samples.T))
+        columns["total"] = samples.sum(axis=1)
+        summary = {"frames": len(samples)}
+        for name, column in columns.items():
+            values = np.percentile(column, PERCENTILES) * 1000
+            summary[name] = {
+                f"p{percentile}": round(float(value), 4)
+                for percentile, value in zip(PERCENTILES, values)
+            }
+        return summary
+
+    def write(self):
+        with open(self.path, "w") as f:
+            json.dump(self.summary(), f, indent=2)
+
+
+def create_frame_profiler(enabled: bool, path: str, capacity: int = DEFAULT_CAPACITY):
+    if enabled:
+        return FrameProfiler(path, capacity)
+    return NullFrameProfiler()
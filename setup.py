@@ -20,6 +20,7 @@ setup(
     zip_safe=True,
     install_requires=[
         "dataclass_wizard",
+        "numpy",
         "pygame",
         "pygame_gui",
         "pytmx",
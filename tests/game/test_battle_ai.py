@@ -0,0 +1,77 @@
+import time
+import unittest
+from random import Random
+
+from narfecritters.models import *
+from narfecritters.game.battle_ai import BattleAI, RandomAI, SearchAI
+from narfecritters.game.battle_events import FaintEvent
+from narfecritters.game.world import Encounter, World
+
+
+class TestBattleAI(unittest.TestCase):
+    def setUp(self):
+        self.world = World(random=Random(x=12345))
+        self.enemy = self.world.encyclopedia.create(
+            self.world.random, self.world.moves, id=4, level=10
+        )
+        self.enemy.moves = [
+            self.world.moves.find_by_name(name)
+            for name in ["growl", "scratch", "ember"]
+        ]
+        self.player_critter = self.world.encyclopedia.create(
+            self.world.random, self.world.moves, id=1, level=10
+        )
+
+    def choose_move(self, ai, random):
+        return ai.choose_move(
+            self.enemy,
+            self.player_critter,
+            EncounterStages(),
+            EncounterStages(),
+            random,
+        )
+
+    def test_random_ai(self):
+        random, expected_random = Random(3), Random(3)
+        move = self.choose_move(RandomAI(), random)
+        self.assertIs(expected_random.choice(self.enemy.moves), move)
+
+    def test_abstract_ai(self):
+        class IncompleteAI(BattleAI):
+            pass
+
+        with self.assertRaises(TypeError):
+            IncompleteAI()
+
+    def test_search_ai(self):
+        ai = SearchAI(budget_ms=5)
+        random = Random(3)
+        state = random.getstate()
+        start = time.perf_counter()
+        move = self.choose_move(ai, random)
+        elapsed = time.perf_counter() - start
+        self.assertEqual("ember", move.name)
+        self.assertEqual(state, random.getstate())
+        self.assertGreaterEqual(ai.depth_reached, 1)
+        self.assertLess(elapsed, 0.05)
+
+    def test_search_ai_after_faster_player(self):
+        """The enemy acts next even when the player moved first this turn"""
+        scratch = self.world.moves.find_by_name("scratch")
+        scratch.accuracy = 100
+        self.enemy.moves = [self.world.moves.find_by_name("growl"), scratch]
+        self.enemy.current_hp = 1
+        self.player_critter.moves = [scratch]
+        self.player_critter.current_hp = 1
+        self.world.player.add_critter(self.player_critter)
+        self.world.encounter = Encounter(
+            self.enemy,
+            active_player_critter=self.player_critter,
+            order_player_first=True,
+        )
+        self.world.enemy_ai = SearchAI()
+        growl = self.world.moves.find_by_name("growl")
+        growl.accuracy = 0
+
+        result = self.world.turn(growl)
+        self.assertIn(FaintEvent(self.player_critter.name), result.information)
@@ -0,0 +1,48 @@
+import io
+import unittest
+
+from narfecritters.game.battle_events import *
+from narfecritters.models import *
+
+EVENTS = [
+    MessageEvent("No balls left!"),
+    DamageEvent("Bulbasaur", 12, "tackle", 2.0),
+    MissEvent("Bulbasaur"),
+    FaintEvent("Pidgey"),
+    LevelUpEvent("Bulbasaur", 6),
+    LearnMoveEvent("Bulbasaur", "Vine Whip"),
+    EvolutionEvent("Bulbasaur", "Ivysaur"),
+    StatChangeEvent("Pidgey", "attack", -1),
+    AilmentEvent("Pidgey", Ailment.CONFUSION, AilmentEffect.SELF_HIT),
+    FlinchEvent("Pidgey"),
+    CatchEvent("Pidgey", False),
+    RunEvent("Bulbasaur", True),
+]
+
+
+class TestBattleEvents(unittest.TestCase):
+    def test_format(self):
+        self.assertEqual(
+            "Bulbasaur took 12 dmg from tackle.  It was super effective!",
+            str(EVENTS[1]),
+        )
+        self.assertEqual("Bulbasaur leveled up to 6", str(EVENTS[4]))
+        self.assertEqual("Attack changed for Pidgey", str(EVENTS[7]))
+        self.assertEqual(
+            "Pidgey is confused! It hurt itself in its confusion!", str(EVENTS[8])
+        )
+        self.assertEqual("Failed to catch Pidgey.", str(EVENTS[10]))
+
+    def test_log_round_trip(self):
+        log_file = io.BytesIO()
+        writer = BattleLogWriter(log_file)
+        writer.write(EVENTS[:6])
+        writer.write(EVENTS[6:] + EVENTS)
+        log_file.seek(0)
+        self.assertEqual(EVENTS + EVENTS, list(BattleLogReader(log_file)))
+        # each name is stored once
+        self.assertEqual(1, log_file.getvalue().count(b"Bulbasaur"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,38 @@
+import subprocess
+import sys
+import unittest
+
+from narfecritters.game.battle_sim import (
+    BattleAction,
+    BattleConfig,
+    BattleOutcome,
+    simulate,
+)
+
+
+class TestBattleSim(unittest.TestCase):
+    def test_simulate_reproducible(self):
+        config = BattleConfig(1, 5, 4, 5)
+        stats = simulate(config, 30, seed=5, processes=1, chunk_size=8)
+        self.assertEqual(30, stats.battles)
+        self.assertEqual(stats, simulate(config, 30, seed=5, processes=2))
+        self.assertNotEqual(stats, simulate(config, 30, seed=6, processes=1))
+
+    def test_simulate_run(self):
+        stats = simulate(
+            BattleConfig(4, 30, 1, 5, action=BattleAction.RUN), 10, processes=1
+        )
+        self.assertEqual(0, stats.outcomes[BattleOutcome.WIN])
+        self.assertGreater(stats.outcomes[BattleOutcome.ESCAPED], 0)
+
+    def test_no_pygame(self):
+        """Workers import the simulator, which must not pull in SDL"""
+        subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys, narfecritters.game.battle_sim; "
+                "assert 'pygame' not in sys.modules, 'pygame imported'",
+            ],
+            check=True,
+        )
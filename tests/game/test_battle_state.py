@@ -0,0 +1,64 @@
+import unittest
+from dataclasses import asdict
+from random import Random
+
+from narfecritters.models import *
+from narfecritters.game.battle_state import BattleState, step
+from narfecritters.game.world import World
+
+
+class TestBattleState(unittest.TestCase):
+    def test_step_matches_world_turn(self):
+        for seed in range(40):
+            world = World(random=Random(seed))
+            for species_id in [1 + seed % 9, 1 + (seed * 5) % 9]:
+                world.player.add_critter(
+                    world.encyclopedia.create(
+                        world.random, world.moves, id=species_id, level=8
+                    )
+                )
+            world.start_encounter(
+                world.encyclopedia.create(
+                    world.random, world.moves, id=1 + (seed * 7) % 9, level=10
+                )
+            )
+            state = BattleState.from_world(world)
+            rng = Random()
+            rng.setstate(world.random.getstate())
+            policy = Random(seed)
+            while world.encounter:
+                move = policy.choice(world.active_critter.moves)
+                experience = sum(
+                    critter.experience for critter in world.player.critters
+                )
+                previous = state
+                world.turn(move)
+                state = step(state, move, rng)
+                self.assertIsNot(previous, state)
+                if world.encounter is None:
+                    # only a win grants experience, a fainted enemy may have
+                    # been healed again by the rest of the turn
+                    won = experience < sum(
+                        critter.experience for critter in world.player.critters
+                    )
+                    self.assertEqual(won, state.won)
+                    break
+                self.assertEqual(world.random.getstate(), rng.getstate())
+                self.assertEqual(BattleState.from_world(world), state)
+
+    def test_step_is_pure(self):
+        world = World(random=Random(3))
+        world.player.add_critter(
+            world.encyclopedia.create(world.random, world.moves, id=4, level=8)
+        )
+        world.start_encounter(
+            world.encyclopedia.create(world.random, world.moves, id=1, level=8)
+        )
+        state = BattleState.from_world(world)
+        snapshot = (state, asdict(state.player_stages), asdict(state.enemy_stages))
+        move = state.active_critter.moves[0]
+        first = step(state, move, Random(1))
+        self.assertEqual(first, step(state, move, Random(1)))
+        self.assertEqual(
+            snapshot, (state, asdict(state.player_stages), asdict(state.enemy_stages))
+        )
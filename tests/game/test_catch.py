@@ -0,0 +1,53 @@
+import math
+import unittest
+from random import Random
+
+from narfecritters.game.catch import (
+    MAX_CATCH_VALUE,
+    calculate_catch_value,
+    catch_probability,
+    roll_catch,
+    shake_threshold,
+)
+
+
+def legacy_roll_catch(a, random: Random):
+    if a >= random.randint(0, 1044480):
+        return True
+    for _x in range(3):
+        b = math.floor(65536 / math.sqrt(math.sqrt(1044480 / a)))
+        if random.randint(0, 65535) >= b:
+            return False
+    return True
+
+
+class TestCatch(unittest.TestCase):
+    def test_shake_threshold(self):
+        for a in list(range(1, MAX_CATCH_VALUE + 1, 997)) + [MAX_CATCH_VALUE]:
+            self.assertEqual(
+                math.floor(65536 / math.sqrt(math.sqrt(1044480 / a))),
+                shake_threshold(a),
+            )
+
+    def test_roll_catch(self):
+        for a in [1, 5000, 100_000, 700_000, MAX_CATCH_VALUE, 10**9]:
+            for seed in range(50):
+                random, legacy_random = Random(seed), Random(seed)
+                self.assertEqual(
+                    legacy_roll_catch(a, legacy_random), roll_catch(a, random)
+                )
+                self.assertEqual(legacy_random.random(), random.random())
+
+    def test_catch_probability(self):
+        self.assertEqual(1.0, catch_probability(45, 20, 10))
+        # capture rate 0 only catches on a roll of exactly 0
+        self.assertEqual(1 / (MAX_CATCH_VALUE + 1), catch_probability(0, 20, 10))
+        a = calculate_catch_value(1, 1, 1)
+        self.assertEqual(1365, a)
+        random = Random(3)
+        rolls = 20000
+        caught = sum(roll_catch(a, random) for _ in range(rolls))
+        probability = (a + 1) / (MAX_CATCH_VALUE + 1)
+        probability += (1 - probability) * (shake_threshold(a) / 65536) ** 3
+        self.assertAlmostEqual(probability, catch_probability(1, 1, 1))
+        self.assertAlmostEqual(probability, caught / rolls, delta=0.01)
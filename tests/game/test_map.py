@@ -0,0 +1,117 @@
+import unittest
+from types import SimpleNamespace
+
+from narfecritters.game.map import (
+    TILE_HEAL,
+    TILE_TALLGRASS,
+    TILE_TRANSITION,
+    EncounterLevel,
+    Map,
+    SpecialEncounter,
+    TransitionDetails,
+    build_tile_grids,
+)
+
+TILE_PROPERTIES = {
+    1: {"type": "tallgrass"},
+    2: {"colliders": [object()]},
+    3: {"type": "heal"},
+    4: {"type": "transition"},
+}
+
+
+def layer(*rows):
+    return SimpleNamespace(data=[list(row) for row in rows])
+
+
+def tiled_object(name, **properties):
+    return SimpleNamespace(name=name, properties=properties)
+
+
+class TestMap(unittest.TestCase):
+    def test_build_tile_grids(self):
+        tmxdata = SimpleNamespace(
+            width=3,
+            height=2,
+            layers=[
+                layer([0, 1, 1], [3, 0, 0]),
+                layer([0, 2, 0], [0, 4, 1]),
+                layer([2, 2, 2], [2, 2, 2]),  # past layer_count, ignored
+            ],
+            get_tile_properties_by_gid=TILE_PROPERTIES.get,
+        )
+        collisions, tile_flags = build_tile_grids(tmxdata, 2)
+        self.assertEqual(bytearray([0, 1, 0, 0, 0, 0]), collisions)
+        self.assertEqual(
+            bytearray(
+                [0, TILE_TALLGRASS, TILE_TALLGRASS, TILE_HEAL, TILE_TRANSITION, 1]
+            ),
+            tile_flags,
+        )
+
+    def test_indexes(self):
+        tmxdata = SimpleNamespace(
+            width=1,
+            height=1,
+            layers=[layer([0])],
+            visible_tile_layers=[0],
+            get_tile_properties_by_gid=TILE_PROPERTIES.get,
+            properties={
+                "StartTile": "3,4",
+                "EncounterLevelMean": "5",
+                "EncounterLevelSigma": "1.5",
+                "Encounters": "critter1,60\ncritter4,40",
+                "NPCs": "2,2\n7,1\n9,9",
+            },
+            objects=[
+                tiled_object(None),
+                tiled_object("transition,5,6", Destination="cave", DestinationXY="1,2"),
+                tiled_object("npc,2,2", Name="merchant"),
+                tiled_object("npc,7,1", Name="critter7", Level="12"),
+                tiled_object("npc,9,9", Name="critter9", Level="3"),
+            ],
+        )
+        map = Map("test", tmxdata)
+        self.assertEqual((3, 4), map.get_start_tile())
+        self.assertEqual(EncounterLevel(5, 1.5), map.get_area_encounter_level())
+        self.assertEqual([("critter1", 60), ("critter4", 40)], map.encounter_table)
+        self.assertEqual(
+            TransitionDetails("cave", 1, 2), map.get_transition_details(5, 6)
+        )
+        self.assertEqual({"cave"}, map.get_transition_destinations())
+        self.assertEqual((2, 2), map.get_area_merchant_details())
+        self.assertEqual(
+            [
+                SpecialEncounter("critter7", 12, 7, 1),
+                SpecialEncounter("critter9", 3, 9, 9),
+            ],
+            map.get_area_special_encounters(),
+        )
+
+    def test_duplicates(self):
+        tmxdata = SimpleNamespace(
+            width=1,
+            height=1,
+            layers=[layer([0])],
+            visible_tile_layers=[0],
+            get_tile_properties_by_gid=TILE_PROPERTIES.get,
+            properties={"NPCs": "7,1\n7,1"},
+            objects=[
+                tiled_object("transition,5,6", Destination="cave", DestinationXY="1,2"),
+                tiled_object("transition,5,6", Destination="town", DestinationXY="3,4"),
+                tiled_object("npc,7,1", Name="critter7", Level="12"),
+                tiled_object("npc,7,1", Name="critter9", Level="3"),
+            ],
+        )
+        with self.assertLogs("narfecritters.game.map", "WARNING"):
+            map = Map("test", tmxdata)
+        self.assertEqual(
+            TransitionDetails("cave", 1, 2), map.get_transition_details(5, 6)
+        )
+        self.assertEqual(
+            [SpecialEncounter("critter7", 12, 7, 1)], map.get_area_special_encounters()
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
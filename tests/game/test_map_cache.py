@@ -0,0 +1,63 @@
+import threading
+import unittest
+
+from narfecritters.game.map_cache import MapCache
+
+NEIGHBOURS = {"overworld": {"cave", "house"}, "cave": {"overworld"}, "house": set()}
+
+
+class FakeMap:
+    def __init__(self, area):
+        self.area = area
+        self.thread = threading.current_thread()
+        self.converted_on = None
+
+    def convert_images(self):
+        self.converted_on = threading.current_thread()
+        return self
+
+    def get_transition_destinations(self):
+        return NEIGHBOURS.get(self.area, set())
+
+
+class TestMapCache(unittest.TestCase):
+    def test_lru(self):
+        loaded = []
+
+        def loader(area):
+            loaded.append(area)
+            return FakeMap(area)
+
+        cache = MapCache(capacity=2, loader=loader)
+        overworld = cache.get("overworld")
+        self.assertIs(overworld, cache.get("overworld"))
+        cache.get("cave")
+        cache.get("overworld")
+        cache.get("house")  # evicts cave, the least recently used
+        self.assertIn("overworld", cache)
+        self.assertNotIn("cave", cache)
+        self.assertEqual(["overworld", "cave", "house"], loaded)
+
+    def test_load_then_add(self):
+        cache = MapCache(loader=FakeMap)
+        map = cache.load("cave")
+        self.assertNotIn("cave", cache)
+        self.assertIsNone(map.converted_on)
+        self.assertIs(map, cache.add(map))
+        self.assertIn("cave", cache)
+        self.assertIs(map, cache.load("cave"))
+
+    def test_preload_neighbours(self):
+        cache = MapCache(loader=FakeMap)
+        overworld = cache.get("overworld")
+        cache.preload_neighbours(overworld)
+        self.assertEqual({"cave", "house"}, set(cache.pending))
+        cave = cache.get("cave")
+        self.assertIsNot(threading.main_thread(), cave.thread)
+        self.assertIs(threading.main_thread(), cave.converted_on)
+        cache.preload_neighbours(cave)
+        self.assertEqual({}, cache.pending)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,15 @@
 from random import Random
 import unittest
 
+import numpy as np
+
 from narfecritters.models import *
-from narfecritters.game.move_damage import calculate_move_damage
+from narfecritters.game.move_damage import (
+    TYPES,
+    DamageBatch,
+    calculate_move_damage,
+    calculate_move_damage_batch,
+)
 
 
 class TestMoveDamage(unittest.TestCase):
@@ -34,3 +41,82 @@ class TestMoveDamage(unittest.TestCase):
                 critter1, critter2, c1stages, c2stages, ember, random
             ).damage,
         )
+
+    def test_type_chart(self):
+        def legacy_type_factor(attacking_type_id, defending_type_ids):
+            type_factor = 1
+            for type_id in defending_type_ids:
+                if attacking_type_id in TYPES.find_by_id(type_id).double_damage_from:
+                    type_factor *= 2
+                if attacking_type_id in TYPES.find_by_id(type_id).half_damage_from:
+                    type_factor /= 2
+                if attacking_type_id in TYPES.find_by_id(type_id).no_damage_from:
+                    type_factor *= 0
+            return type_factor
+
+        type_ids = [type.id for type in TYPES.types]
+        for attacking_type_id in type_ids:
+            for first_type_id in type_ids:
+                defending_type_ids = [first_type_id]
+                self.assertEqual(
+                    legacy_type_factor(attacking_type_id, defending_type_ids),
+                    TYPES.chart.factor(attacking_type_id, defending_type_ids),
+                )
+                for second_type_id in type_ids:
+                    defending_type_ids = [first_type_id, second_type_id]
+                    self.assertEqual(
+                        legacy_type_factor(attacking_type_id, defending_type_ids),
+                        TYPES.chart.factor(attacking_type_id, defending_type_ids),
+                    )
+
+    def test_calculate_move_damage_batch(self):
+        random = Random(x=12345)
+        encyclopedia = Encyclopedia.load()
+        moves = Moves.load()
+        damaging_moves = [
+            move
+            for move in moves.moves
+            if move.power and move.damage_class is not DamageClass.STATUS
+        ]
+        entries = []
+        for _ in range(500):
+            attacker_stages = EncounterStages(
+                attack=random.randint(-6, 6), spattack=random.randint(-6, 6)
+            )
+            defender_stages = EncounterStages(
+                defense=random.randint(-6, 6), spdefense=random.randint(-6, 6)
+            )
+            entries.append(
+                (
+                    encyclopedia.create(
+                        random,
+                        moves,
+                        id=random.randint(1, 9),
+                        level=random.randint(1, 100),
+                    ),
+                    encyclopedia.create(
+                        random,
+                        moves,
+                        id=random.randint(1, 9),
+                        level=random.randint(1, 100),
+                    ),
+                    attacker_stages,
+                    defender_stages,
+                    random.choice(damaging_moves),
+                )
+            )
+        expected = []
+        crit_rolls = []
+        random_rolls = []
+        for seed, entry in enumerate(entries):
+            expected.append(calculate_move_damage(*entry, Random(seed)).damage)
+            rolls = Random(seed)
+            crit_rolls.append(rolls.random())
+            random_rolls.append(rolls.random())
+
+        damage = calculate_move_damage_batch(
+            DamageBatch.from_moves(entries),
+            crit_rolls=np.array(crit_rolls),
+            random_rolls=np.array(random_rolls),
+        )
+        self.assertEqual(expected, damage.tolist())
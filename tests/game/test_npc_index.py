@@ -0,0 +1,40 @@
+import unittest
+
+from narfecritters.game.npc_index import NPCIndex
+from narfecritters.models import NPC
+from narfecritters.ui.settings import TILE_SIZE
+
+
+def npc_at(tile_x, tile_y):
+    return NPC(x=tile_x * TILE_SIZE + TILE_SIZE // 2, y=tile_y * TILE_SIZE)
+
+
+class TestNPCIndex(unittest.TestCase):
+    def test_at(self):
+        first, second = npc_at(2, 3), npc_at(20, 3)
+        index = NPCIndex([first, second])
+        self.assertIs(first, index.at(2, 3))
+        self.assertIsNone(index.at(3, 3))
+        index.remove(second)
+        self.assertIsNone(index.at(20, 3))
+        self.assertEqual([first], list(index))
+
+    def test_shared_tile(self):
+        first, second = npc_at(1, 1), npc_at(1, 1)
+        index = NPCIndex([first, second])
+        index.remove(second)
+        self.assertIs(first, index.at(1, 1))
+
+    def test_in_rect(self):
+        npcs = [npc_at(x, y) for x in range(0, 100, 5) for y in range(0, 100, 5)]
+        index = NPCIndex(npcs)
+        visible = list(index.in_rect(-3, 7, 16, 21))
+        expected = {(x, y) for x in range(0, 16, 5) for y in range(10, 21, 5)}
+        self.assertEqual(len(expected), len(visible))
+        self.assertEqual(
+            expected, {(npc.x // TILE_SIZE, npc.y // TILE_SIZE) for npc in visible}
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
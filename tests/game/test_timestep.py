@@ -0,0 +1,46 @@
+import unittest
+from random import Random
+
+from narfecritters.game.timestep import STEP_SECONDS, FixedTimestep
+from narfecritters.game.world import MoveAction, World
+
+
+class TestTimestep(unittest.TestCase):
+    def test_advance(self):
+        timestep = FixedTimestep()
+        self.assertEqual(0, timestep.advance(STEP_SECONDS / 2))
+        self.assertAlmostEqual(0.5, timestep.alpha)
+        self.assertEqual(1, timestep.advance(STEP_SECONDS))
+        self.assertAlmostEqual(0.5, timestep.alpha)
+        # a slow frame catches up with several steps
+        self.assertEqual(3, timestep.advance(STEP_SECONDS * 3))
+        # a stall is dropped after max_steps rather than replayed
+        self.assertEqual(timestep.max_steps, timestep.advance(10))
+        self.assertEqual(0, timestep.alpha)
+
+    def test_speed(self):
+        timestep = FixedTimestep(speed=4)
+        self.assertEqual(4, timestep.advance(STEP_SECONDS))
+
+    def test_world_update_deprecated(self):
+        world = World(random=Random(1))
+        world.player.x, world.player.y = 48, 48
+        world.move_action = MoveAction(target_x=80, target_y=48, running=False)
+        with self.assertWarns(DeprecationWarning):
+            world.update(0.5)
+        self.assertEqual(50, world.player.x)
+        self.assertAlmostEqual(0.5, world.player.play_time)
+
+    def test_world_step_interpolation(self):
+        world = World(random=Random(1))
+        world.player.x, world.player.y = 48, 48
+        world.move_action = MoveAction(target_x=80, target_y=48, running=False)
+        world.step()
+        self.assertEqual(50, world.player.x)
+        self.assertAlmostEqual(STEP_SECONDS, world.player.play_time)
+        self.assertEqual((49, 48), world.render_position(0.5))
+        self.assertEqual((50, 48), world.render_position(1))
+
+
+if __name__ == "__main__":
+    unittest.main()
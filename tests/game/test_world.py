@@ -1,8 +1,43 @@
+from dataclasses import replace
 from random import Random
+from types import SimpleNamespace
 import unittest
 
 from narfecritters.models import *
+from narfecritters.game.map import Map
+from narfecritters.game.map_cache import MapCache
 from narfecritters.game.world import Encounter, World
+from narfecritters.ui.settings import TILE_SIZE
+
+
+def create_tmxdata(encounter_name):
+    """A 4x4 area with a merchant and one special encounter"""
+    return SimpleNamespace(
+        width=4,
+        height=4,
+        layers=[SimpleNamespace(data=[[0] * 4 for _ in range(4)])],
+        visible_tile_layers=[0],
+        images=[],
+        get_tile_properties_by_gid=lambda gid: None,
+        properties={
+            "StartTile": "1,1",
+            "Encounters": f"{encounter_name},100",
+            "NPCs": "0,3\n2,2",
+        },
+        objects=[
+            SimpleNamespace(name="npc,0,3", properties={"Name": "merchant"}),
+            SimpleNamespace(
+                name="npc,2,2", properties={"Name": encounter_name, "Level": "7"}
+            ),
+        ],
+    )
+
+
+def create_area_world(seed):
+    world = World(random=Random(seed))
+    name = world.encyclopedia.find_by_id(4).name
+    world.map_cache = MapCache(loader=lambda area: Map(area, create_tmxdata(name)))
+    return world
 
 
 class TestWorld(unittest.TestCase):
@@ -83,6 +118,71 @@ class TestWorld(unittest.TestCase):
         self.assertEqual(0, critter2.current_hp)
         self.assertEqual(190, critter1.experience)
 
+    def test_no_ailment_damage_after_win(self):
+        random = Random(x=12345)
+        world = World(random=random)
+        critter1 = world.encyclopedia.create(random, world.moves, id=4, level=5)
+        critter2 = world.encyclopedia.create(random, world.moves, id=1, level=5)
+        world.player.add_critter(critter1)
+        world.encounter = Encounter(critter2, active_player_critter=critter1)
+        critter1.current_hp = 1
+        critter1.ailments.add(Ailment.BURN)
+        critter2.current_hp = 1
+        player_move = replace(world.moves.find_by_name("scratch"), accuracy=100)
+
+        world.turn(player_move)
+        self.assertIsNone(world.encounter)
+        self.assertEqual(1, critter1.current_hp)
+        world.start_encounter(
+            world.encyclopedia.create(random, world.moves, id=1, level=5)
+        )
+        self.assertIs(critter1, world.active_critter)
+
+    def test_prepare_area_leaves_world(self):
+        world = create_area_world(3)
+        random_state = world.random.getstate()
+        prepared = world.prepare_area("route")
+        self.assertEqual(random_state, world.random.getstate())
+        self.assertIsNone(world.area)
+        self.assertIsNone(world.map)
+        self.assertIsNone(world.merchant)
+        self.assertEqual(0, len(world.npc_index))
+        self.assertEqual([], world.candidate_encounters)
+        self.assertNotIn("route", world.map_cache)
+        self.assertEqual((0, 0), (world.player.x, world.player.y))
+
+    def test_apply_area(self):
+        """Applying a prepared area rolls what set_area always rolled, from
+        world.random itself
+        """
+        world = create_area_world(3)
+        world.apply_area(world.prepare_area("route"))
+        random = Random(3)
+        critter = world.encyclopedia.create(random, world.moves, id=4, level=7)
+        self.assertEqual(random.getstate(), world.random.getstate())
+
+        self.assertEqual("route", world.area)
+        self.assertIs(world.map, world.map_cache.get("route"))
+        self.assertEqual([4] * 100, world.candidate_encounters)
+        center = TILE_SIZE // 2
+        self.assertEqual(
+            (TILE_SIZE + center, TILE_SIZE + center),
+            (world.player.x, world.player.y),
+        )
+        self.assertEqual(
+            (center, 3 * TILE_SIZE + center), (world.merchant.x, world.merchant.y)
+        )
+        npc = world.npc_index.at(2, 2)
+        self.assertEqual(
+            (critter.id, critter.level, critter.ivs, critter.moves),
+            (
+                npc.active_critter.id,
+                npc.active_critter.level,
+                npc.active_critter.ivs,
+                npc.active_critter.moves,
+            ),
+        )
+
     def test_all_moves(self):
         world = World()
         attacker = world.encyclopedia.create(world.random, world.moves, id=1, level=5)
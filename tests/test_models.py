@@ -1,6 +1,78 @@
+import os
+import pickle
+import tempfile
+import time
 import unittest
+import uuid
+import zlib
+
+from dataclass_wizard import asdict
 
 from narfecritters.models import *
+from narfecritters.models.gamedata import (
+    GameDataPack,
+    build_pack,
+    is_pack_stale,
+    write_pack,
+)
+from narfecritters.models.save_slots import (
+    SLOT_HEADER,
+    SLOT_MAGIC,
+    SLOT_PREFIX,
+    SLOT_VERSION,
+    Autosaver,
+    SaveSlots,
+)
+
+
+def create_species(id, evolved_species_id=None):
+    evolution_triggers = []
+    if evolved_species_id:
+        evolution_triggers.append(EvolutionTrigger(evolved_species_id, 16))
+    return Species(
+        id=id,
+        name=f"species{id}",
+        base_experience=64,
+        base_stats=Stats(45, 49, 49, 65, 65, 45),
+        type_ids=[1],
+        moves=[],
+        evolution_triggers=evolution_triggers,
+        capture_rate=45,
+        flavor_text=None,
+    )
+
+
+def create_critter(species_id=1, experience=125):
+    species = create_species(species_id)
+    critter = Critter(
+        **species.critter_attributes,
+        name=species.name_pretty,
+        uuid=uuid.uuid1(),
+        moves=[create_move(1, "tackle")],
+        ivs=Stats(),
+        evs=Stats(),
+        experience=experience,
+    )
+    critter.heal()
+    return critter
+
+
+def create_move(id, name):
+    return Move(
+        id=id,
+        name=name,
+        type_id=1,
+        target=MoveTarget.SELECTED_CRITTERS,
+        crit_rate=0,
+        flinch_chance=0,
+        healing=0,
+        stat_chance=0,
+        accuracy=100,
+        ailment_chance=0,
+        damage_class=DamageClass.PHYSICAL,
+        ailment=None,
+        power=40,
+    )
 
 
 class TestModels(unittest.TestCase):
@@ -19,3 +91,242 @@ class TestModels(unittest.TestCase):
         self.assertEqual(6, critter.level)
         self.assertEqual(11, critter.attack)
         self.assertEqual(22, critter.max_hp)
+
+    def test_level_for_medium_fast_xp(self):
+        for experience in range(0, 1_000_001, 7):
+            level = 1
+            while level**3 <= experience:
+                level += 1
+            self.assertEqual(level - 1, Critter.level_for_medium_fast_xp(experience))
+
+    def test_derived_stats_invalidation(self):
+        critter = create_critter()
+        self.assertEqual(5, critter.level)
+        self.assertEqual(9, critter.attack)
+        critter.experience = 216
+        self.assertEqual(6, critter.level)
+        self.assertEqual(10, critter.attack)
+        critter.ivs = Stats(attack=31)
+        self.assertEqual(12, critter.attack)
+        critter.base_stats = Stats(attack=100)
+        self.assertEqual(18, critter.attack)
+
+    def test_critter_slots(self):
+        critter = create_critter()
+        self.assertFalse(hasattr(critter, "__dict__"))
+        self.assertFalse(hasattr(critter.ivs, "__dict__"))
+        npc = NPC()
+        npc.add_critter(critter)
+        save = Save(players=[npc] + [None] * (Save.SLOT_COUNT - 1))
+        self.assertEqual(save, Save.from_yaml(save.to_yaml()))
+        self.assertNotIn("derived", save.to_yaml())
+
+    def test_npc_critter_index(self):
+        first, second = create_critter(1), create_critter(2)
+        npc = NPC()
+        npc.add_critter(first)
+        npc.add_critter(second)
+        self.assertIs(second, npc.find_critter_by_uuid(second.uuid))
+        self.assertTrue(npc.has_critter(first))
+        self.assertIs(first, npc.active_critter)
+
+        first.add_current_hp(-first.max_hp)
+        self.assertIs(second, npc.active_critter)
+        first.heal()
+        self.assertIs(first, npc.active_critter)
+        active_critter_list = npc.active_critter_list
+        create_critter(3).add_current_hp(-1)  # others' hp leaves the cache be
+        self.assertIs(active_critter_list, npc.active_critter_list)
+
+        npc.deactivate_critter(0)
+        self.assertIs(second, npc.active_critter)
+        npc.remove_critter(second)
+        self.assertIsNone(npc.find_critter_by_uuid(second.uuid))
+        self.assertIsNone(npc.active_critter)
+        npc.activate_critter(first.uuid)
+        self.assertIs(first, npc.active_critter)
+
+        loaded = Save.from_yaml(
+            Save(players=[npc] + [None] * (Save.SLOT_COUNT - 1)).to_yaml()
+        ).players[0]
+        self.assertEqual(first, loaded.find_critter_by_uuid(first.uuid))
+        self.assertEqual(first, loaded.active_critter)
+
+    def test_moves_index(self):
+        tackle = create_move(1, "tackle")
+        moves = Moves(moves=[tackle])
+        self.assertIs(tackle, moves.find_by_id(1))
+        self.assertIs(tackle, moves.find_by_name("tackle"))
+        self.assertIsNone(moves.find_by_id(2))
+
+        ember = create_move(2, "ember")
+        moves.add(ember)
+        self.assertIs(ember, moves.find_by_name("ember"))
+        self.assertEqual([tackle, ember], moves.moves)
+
+        pound = create_move(1, "pound")
+        moves.add(pound)
+        self.assertIs(pound, moves.find_by_id(1))
+        self.assertIsNone(moves.find_by_name("tackle"))
+        self.assertEqual([pound, ember], moves.moves)
+
+    def test_types_index(self):
+        types = Types(types=[Type(1, "normal"), Type(10, "fire")])
+        self.assertEqual("fire", types.find_by_id(10).name)
+        self.assertEqual(1, types.find_by_name("normal").id)
+        types.add(Type(10, "flame"))
+        self.assertEqual("flame", types.find_by_id(10).name)
+        self.assertEqual(2, len(types.types))
+
+    def test_game_data_pack(self):
+        with tempfile.TemporaryDirectory() as db_path:
+            os.mkdir(os.path.join(db_path, "species"))
+            Encyclopedia(name_to_id={"narf": 7}).to_yaml_file(
+                os.path.join(db_path, "encyclopedia.yml")
+            )
+            Moves(moves=[create_move(1, "tackle")]).to_yaml_file(
+                os.path.join(db_path, "moves.yml")
+            )
+            types_path = os.path.join(db_path, "types.yml")
+            Types(types=[Type(1, "normal", no_damage_from=[8])]).to_yaml_file(
+                types_path
+            )
+            species = Species(
+                id=7,
+                name="narf",
+                base_experience=64,
+                base_stats=Stats(45, 49, 49, 65, 65, 45),
+                type_ids=[1],
+                moves=[SpeciesMove(1, "tackle", "level-up", 1)],
+                evolution_triggers=[EvolutionTrigger(8, 16)],
+                capture_rate=45,
+                flavor_text=None,
+            )
+            species.to_yaml_file(os.path.join(db_path, "species", "7.yml"))
+
+            pack = GameDataPack(build_pack(db_path))
+            self.assertEqual({"narf": 7}, pack.name_to_id())
+            self.assertEqual([create_move(1, "tackle")], pack.moves())
+            self.assertEqual([8], pack.types()[0].no_damage_from)
+            self.assertEqual(species, pack.species(7))
+
+            self.assertTrue(is_pack_stale(db_path))
+            write_pack(db_path)
+            self.assertFalse(is_pack_stale(db_path))
+            later = time.time() + 10
+            os.utime(types_path, (later, later))
+            self.assertTrue(is_pack_stale(db_path))
+
+            write_pack(db_path)
+            os.remove(os.path.join(db_path, "species", "7.yml"))
+            self.assertTrue(is_pack_stale(db_path))
+
+    def test_species_cache(self):
+        cache = SpeciesCache(create_species, maxsize=2)
+        cache.get(1)
+        cache.get(2)
+        cache.get(1)
+        cache.get(3)
+        self.assertEqual((1, 3), (cache.hits, cache.misses))
+        self.assertIn(1, cache)
+        self.assertNotIn(2, cache)
+        self.assertEqual(2, len(cache))
+
+    def test_prefetch(self):
+        encyclopedia = Encyclopedia(name_to_id={})
+        encyclopedia.species_cache = SpeciesCache(
+            lambda id: create_species(id, id + 1 if id < 3 else None)
+        )
+        encyclopedia.prefetch([1]).result()
+        self.assertEqual(3, len(encyclopedia.species_cache))
+        encyclopedia.find_by_id(3)
+        self.assertEqual(1, encyclopedia.species_cache.hits)
+        self.assertEqual(0, encyclopedia.species_cache.misses)
+
+    def test_save_slots(self):
+        npc = NPC(x=3, y=4, respawn_area="town")
+        npc.add_critter(create_critter(1))
+        npc.add_item(ItemType.POTION, 2)
+        with tempfile.TemporaryDirectory() as path:
+            yaml_path = os.path.join(path, "save.yml")
+            Save(players=[None, npc] + [None] * (Save.SLOT_COUNT - 2)).to_yaml_file(
+                yaml_path
+            )
+            save_slots = SaveSlots.open(os.path.join(path, "saves"), yaml_path)
+            self.assertIsNone(save_slots.load_slot(0))
+            loaded = save_slots.load_slot(1)
+            self.assertEqual(npc, loaded)
+            self.assertEqual(npc.critters[0], loaded.active_critter)
+
+            loaded.play_time = 3725
+            save_slots.save_slot(0, loaded, "route1")
+            metadata = save_slots.load_metadata()
+            self.assertIsNone(metadata[2])
+            self.assertEqual(
+                (1, 3, 4), (metadata[0].critter_count, metadata[0].x, metadata[0].y)
+            )
+            self.assertEqual("route1", metadata[0].area)
+            self.assertEqual("1:02:05", metadata[0].play_time_pretty)
+            self.assertEqual(loaded, save_slots.load().players[0])
+            save_slots.export_yaml(yaml_path)
+            self.assertEqual(loaded, Save.from_yaml_file(yaml_path).players[0])
+
+            slot_path = save_slots.slot_path(0)
+            with open(slot_path, "r+b") as slot_file:
+                slot_file.seek(-1, os.SEEK_END)
+                byte = slot_file.read(1)
+                slot_file.seek(-1, os.SEEK_END)
+                slot_file.write(bytes([byte[0] ^ 0xFF]))
+            # the header and metadata still read, the body does not
+            self.assertEqual("route1", save_slots.load_slot_metadata(0).area)
+            with self.assertLogs("narfecritters.models.save_slots", "WARNING"):
+                self.assertIsNone(save_slots.load_slot(0))
+
+            # a body with a valid crc that unpickles code is refused too
+            metadata_data = pickle.dumps(asdict(metadata[0]))
+            body = pickle.dumps(NPC)
+            with open(save_slots.slot_path(3), "wb") as slot_file:
+                slot_file.write(SLOT_PREFIX.pack(SLOT_MAGIC, SLOT_VERSION))
+                slot_file.write(
+                    SLOT_HEADER.pack(
+                        len(metadata_data),
+                        zlib.crc32(metadata_data),
+                        len(body),
+                        zlib.crc32(body),
+                    )
+                )
+                slot_file.write(metadata_data + body)
+            self.assertEqual("route1", save_slots.load_slot_metadata(3).area)
+            with self.assertLogs("narfecritters.models.save_slots", "WARNING"):
+                self.assertIsNone(save_slots.load_slot(3))
+            self.assertFalse(os.path.exists(f"{slot_path}.tmp"))
+
+            with open(save_slots.slot_path(2), "wb") as slot_file:
+                slot_file.write(SLOT_PREFIX.pack(SLOT_MAGIC, SLOT_VERSION - 1))
+            self.assertIsNone(save_slots.load_slot_metadata(2))
+            with self.assertLogs("narfecritters.models.save_slots", "WARNING"):
+                self.assertIsNone(save_slots.load_slot(2))
+
+    def test_autosave(self):
+        npc = NPC()
+        npc.add_critter(create_critter(1))
+        with tempfile.TemporaryDirectory() as path:
+            save_slots = SaveSlots(path)
+            self.assertIsNone(save_slots.load_autosave())
+            autosaver = Autosaver(save_slots)
+            for x in range(3):
+                npc.x = x
+                autosaver.autosave(npc, "route1")
+                autosaver.flush()
+            npc.x = 3
+            autosaver.autosave(npc, "route2")
+            npc.x = 4
+            autosaver.flush()
+            loaded, metadata = save_slots.load_autosave()
+            self.assertEqual((3, "route2"), (loaded.x, metadata.area))
+
+            newest_path = save_slots.autosaves()[0][1]
+            with open(newest_path, "r+b") as slot_file:
+                slot_file.truncate(os.path.getsize(newest_path) - 1)
+            loaded, metadata = save_slots.load_autosave()
+            self.assertEqual((2, "route1"), (loaded.x, metadata.area))
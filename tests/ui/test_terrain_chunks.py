@@ -0,0 +1,125 @@
+import os
+import unittest
+from types import SimpleNamespace
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from narfecritters.ui.settings import TILE_SIZE, WINDOW_SIZE
+from narfecritters.ui.terrain_chunks import EVICT_MARGIN, TerrainChunks
+
+LAYER_NAMES = ["Tile Layer 1", "Tile Layer 2", "Tile Layer 3"]
+COLORS = [(200, 40, 40), (40, 200, 40), (40, 40, 200)]
+
+
+class FakeMap:
+    """Tile images per layer, with gaps and transparent quadrants"""
+
+    def __init__(self, width, height, layer_names=LAYER_NAMES):
+        self.width = width
+        self.height = height
+        self.tmxdata = SimpleNamespace(
+            layers=[SimpleNamespace(name=name) for name in layer_names]
+        )
+        self.tiles = []
+        for color in COLORS:
+            tile = pygame.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)
+            tile.fill(color)
+            tile.fill((0, 0, 0, 0), (0, 0, TILE_SIZE // 2, TILE_SIZE // 2))
+            self.tiles.append(tile)
+
+    def get_tile_layer_count(self):
+        return len(self.tmxdata.layers)
+
+    def get_tile_image(self, x, y, layer):
+        if (x * 7 + y * 3 + layer) % 4 == 0:
+            return None
+        return self.tiles[layer]
+
+
+def draw_tiles(map, surface, camera_x, camera_y, layers):
+    """The per tile blits chunks replace"""
+    for layer in layers:
+        for x in range(map.width):
+            for y in range(map.height):
+                image = map.get_tile_image(x, y, layer)
+                if image:
+                    surface.blit(
+                        image,
+                        (
+                            WINDOW_SIZE[0] // 2 + x * TILE_SIZE - camera_x,
+                            WINDOW_SIZE[1] // 2 + y * TILE_SIZE - camera_y,
+                        ),
+                    )
+
+
+def create_surface():
+    surface = pygame.Surface(WINDOW_SIZE)
+    surface.fill((90, 90, 90))
+    return surface
+
+
+class TestTerrainChunks(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        pygame.display.init()
+        pygame.display.set_mode((1, 1))
+
+    def test_matches_tiles(self):
+        map = FakeMap(45, 37)
+        terrain = TerrainChunks(map, chunk_tiles=8)
+        self.assertEqual([0, 1], terrain.below_layers)
+        self.assertEqual([2], terrain.above_layers)
+        for camera_x, camera_y in [(700, 650), (45 * TILE_SIZE, 0), (-100, 1200)]:
+            expected_below = create_surface()
+            draw_tiles(map, expected_below, camera_x, camera_y, [0, 1])
+            expected = expected_below.copy()
+            draw_tiles(map, expected, camera_x, camera_y, [2])
+            surface = create_surface()
+            terrain.draw_below(surface, camera_x, camera_y)
+            self.assertEqual(
+                pygame.image.tobytes(expected_below, "RGB"),
+                pygame.image.tobytes(surface, "RGB"),
+            )
+            terrain.draw_above(surface, camera_x, camera_y)
+            self.assertEqual(
+                pygame.image.tobytes(expected, "RGB"),
+                pygame.image.tobytes(surface, "RGB"),
+            )
+
+    def test_edge_chunks(self):
+        terrain = TerrainChunks(FakeMap(21, 19), chunk_tiles=8)
+        self.assertEqual((3, 3), (terrain.chunk_columns, terrain.chunk_rows))
+        below, _above = terrain.get_chunk(2, 2)
+        self.assertEqual((5 * TILE_SIZE, 3 * TILE_SIZE), below.get_size())
+
+    def test_without_sprite_layer(self):
+        terrain = TerrainChunks(FakeMap(8, 8, ["Ground", "Trees"]), chunk_tiles=8)
+        self.assertFalse(terrain.has_sprite_layer)
+        self.assertEqual([0, 1], terrain.below_layers)
+        self.assertEqual((None,), terrain.get_chunk(0, 0)[1:])
+
+    def test_preload_and_evict(self):
+        terrain = TerrainChunks(FakeMap(200, 200), chunk_tiles=4)
+        surface = create_surface()
+        camera_x, camera_y = 3000, 3000
+        columns, rows = terrain.visible_range(camera_x, camera_y)
+        visible = len(columns) * len(rows)
+        terrain.draw_below(surface, camera_x, camera_y)
+        # the visible chunks, plus one ahead of the view per frame
+        self.assertEqual(visible + 1, len(terrain.chunks))
+        terrain.draw_below(surface, camera_x, camera_y)
+        self.assertEqual(visible + 2, len(terrain.chunks))
+
+        camera_x += 10 * terrain.chunk_size
+        terrain.draw_below(surface, camera_x, camera_y)
+        columns, rows = terrain.visible_range(camera_x, camera_y, EVICT_MARGIN)
+        for chunk_x, chunk_y in terrain.chunks:
+            self.assertIn(chunk_x, columns)
+            self.assertIn(chunk_y, rows)
+        self.assertEqual(visible + 1, len(terrain.chunks))
+
+
+if __name__ == "__main__":
+    unittest.main()
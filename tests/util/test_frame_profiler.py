@@ -0,0 +1,41 @@
+import json
+import os
+import tempfile
+import unittest
+
+from narfecritters.util import frame_profiler
+from narfecritters.util.frame_profiler import FrameProfiler
+
+
+class TestFrameProfiler(unittest.TestCase):
+    def test_ring_buffer_percentiles(self):
+        ticks = iter(range(10**6))
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "frames.json")
+            profiler = FrameProfiler(path, capacity=4, clock=lambda: next(ticks))
+            for frame in range(6):
+                profiler.begin_frame("AreaScreen" if frame % 2 else "BattleScreen")
+                for phase in range(len(frame_profiler.PHASES)):
+                    profiler.mark(phase)
+                profiler.end_frame()
+            profiler.write()
+            with open(path) as f:
+                summary = json.load(f)
+        self.assertEqual(6, summary["frames"])
+        self.assertEqual(4, summary["recorded"])
+        self.assertEqual(2, summary["screens"]["AreaScreen"]["frames"])
+        # each phase took one tick, a second
+        self.assertEqual(1000, summary["all"]["update"]["p99"])
+        self.assertEqual(6000, summary["all"]["total"]["p50"])
+
+    def test_disabled(self):
+        profiler = frame_profiler.create_frame_profiler(False, "unused.json")
+        profiler.begin_frame("StartScreen")
+        profiler.mark(frame_profiler.DRAW)
+        profiler.end_frame()
+        profiler.write()
+        self.assertFalse(os.path.exists("unused.json"))
+
+
+if __name__ == "__main__":
+    unittest.main()